@@ -1,3 +1,4 @@
+import hashlib
 import os
 import random
 import sys
@@ -6,22 +7,85 @@ import http_request_codegen
 from http_request_codegen.hrc_factory import get_func_by_lang_impl_method
 
 
-DOCS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), 'docs'))
+ROOT_DIR = os.path.abspath(os.path.dirname(__file__))
+DOCS_DIR = os.path.join(ROOT_DIR, 'docs')
+
+# snippets rendered are stored in this SQLite database between builds if the
+# seed is pinned, set the environment variable to an empty string to disable
+# the cache
+DOCS_CACHE_PATH = os.environ.get(
+    'HRC_DOCS_CACHE',
+    os.path.join(ROOT_DIR, '.cache', 'docs-snippets.sqlite'),
+)
 if DOCS_DIR not in sys.path:
     sys.path.append(DOCS_DIR)
 
 import fake_module  # noqa: E402
 
 
+def _sources_digest():
+    # digest of the sources that render the snippets, so the cached snippets
+    # are rendered again after editing them without bumping the version
+    sha = hashlib.sha256()
+    sources_dir = os.path.dirname(
+        os.path.abspath(http_request_codegen.__file__),
+    )
+    filepaths = [fake_module.__file__]
+    for dirpath, dirnames, filenames in os.walk(sources_dir):
+        dirnames.sort()
+        filepaths.extend(
+            os.path.join(dirpath, filename)
+            for filename in sorted(filenames) if filename.endswith('.py')
+        )
+    for filepath in filepaths:
+        sha.update(os.path.relpath(filepath, ROOT_DIR).encode('utf-8'))
+        with open(filepath, 'rb') as f:
+            sha.update(f.read())
+    return sha.hexdigest()
+
+
+class CachedHttpRequestCodegen:
+    '''Library module proxy that renders the snippets using a cache.'''
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def generate_http_request_code(self, **kwargs):
+        return http_request_codegen.generate_http_request_code(
+            cache=self.cache, **kwargs,
+        )
+
+    def generate_http_request_md_fenced_code_block(self, **kwargs):
+        return http_request_codegen.generate_http_request_md_fenced_code_block(
+            cache=self.cache, **kwargs,
+        )
+
+    def __getattr__(self, name):
+        return getattr(http_request_codegen, name)
+
+
 def define_env(env):
-    # library module exposed globally
-    env.variables['http_request_codegen'] = http_request_codegen
+    # random seed for each build, only for fun, pin it with the environment
+    # variable to serve the cached snippets in the next builds
+    pinned_seed = os.environ.get('HRC_DOCS_SEED')
+    env.variables['seed'] = int(pinned_seed or random.randint(1, 10000))
+
+    # library module exposed globally, the snippets rendered with random
+    # seeds are not cached because they would never be used again
+    if DOCS_CACHE_PATH and pinned_seed:
+        env.variables['http_request_codegen'] = CachedHttpRequestCodegen(
+            http_request_codegen.DiskRenderCache(
+                DOCS_CACHE_PATH,
+                version='%s+%s' % (
+                    http_request_codegen.__version__, _sources_digest(),
+                ),
+            ),
+        )
+    else:
+        env.variables['http_request_codegen'] = http_request_codegen
     env.variables['get_func_by_lang_impl_method'] = \
         get_func_by_lang_impl_method
 
-    # random seed for each build, only for fun
-    env.variables['seed'] = random.randint(1, 10000)
-
     # fake module to perform imports in demos
     env.variables['fake_module'] = fake_module
 
@@ -56,3 +120,12 @@ def define_env(env):
 
                 response += '|\n'
         return response
+
+
+def on_post_build(env):
+    # removes the snippets of the cache not used by this build, so the
+    # database doesn't grow with the snippets of changed pages
+    library = env.variables['http_request_codegen']
+    if isinstance(library, CachedHttpRequestCodegen):
+        library.cache.prune()
+        library.cache.close()
@@ -1,24 +1,62 @@
-from http_request_codegen.hrc_api import (
-    generate_http_request_code,
-    generate_http_request_md_fenced_code_block,
-)
-from http_request_codegen.hrc_support import (
-    supported_features,
-    supported_methods,
-)
-from http_request_codegen.hrc_valuer import (
-    lazy_name_by_parameter,
-    lazy_value_by_parameter,
-)
+import importlib
 
 
 __version__ = '0.1.0'
 __title__ = 'http-request-codegen'
 __all__ = (
+    'DiskRenderCache',
+    'RenderCache',
+    'RequestSpec',
+    'compile_name_generator',
+    'compile_value_generator',
     'generate_http_request_code',
+    'generate_http_request_codes',
+    'generate_http_request_codes_by_targets',
     'generate_http_request_md_fenced_code_block',
+    'generate_values',
     'lazy_name_by_parameter',
     'lazy_value_by_parameter',
+    'render_to',
     'supported_features',
+    'supported_implementations',
     'supported_methods',
 )
+
+# public names are imported from their modules the first time that they are
+# accessed, so importing the package is fast (PEP 562)
+_MODULES_BY_NAME = {
+    'DiskRenderCache': 'http_request_codegen.hrc_cache',
+    'RenderCache': 'http_request_codegen.hrc_cache',
+    'RequestSpec': 'http_request_codegen.hrc_spec',
+    'compile_name_generator': 'http_request_codegen.hrc_valuer',
+    'compile_value_generator': 'http_request_codegen.hrc_valuer',
+    'generate_http_request_code': 'http_request_codegen.hrc_api',
+    'generate_http_request_codes': 'http_request_codegen.hrc_api',
+    'generate_http_request_codes_by_targets': 'http_request_codegen.hrc_api',
+    'generate_http_request_md_fenced_code_block': (
+        'http_request_codegen.hrc_api'
+    ),
+    'generate_values': 'http_request_codegen.hrc_valuer',
+    'lazy_name_by_parameter': 'http_request_codegen.hrc_valuer',
+    'lazy_value_by_parameter': 'http_request_codegen.hrc_valuer',
+    'render_to': 'http_request_codegen.hrc_api',
+    'supported_features': 'http_request_codegen.hrc_support',
+    'supported_implementations': 'http_request_codegen.hrc_support',
+    'supported_methods': 'http_request_codegen.hrc_support',
+}
+
+
+def __getattr__(name):
+    try:
+        module_path = _MODULES_BY_NAME[name]
+    except KeyError:
+        raise AttributeError(
+            'module \'%s\' has no attribute \'%s\'' % (__name__, name),
+        )
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,7 @@
+import sys
+
+from http_request_codegen.hrc_cli import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
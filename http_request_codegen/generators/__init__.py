@@ -1 +1,20 @@
 '''HTTP request code generators.'''
+
+from collections import OrderedDict
+
+
+# modules of the generators included in the package by language and
+# implementation, so they can be found without scanning this directory
+# (the first implementation of each language is their default one)
+GENERATORS_MANIFEST = OrderedDict({
+    'python': OrderedDict({
+        'requests': 'http_request_codegen.generators.python.requests',
+        'httpx': 'http_request_codegen.generators.python.httpx',
+    }),
+    'bash': OrderedDict({
+        'curl': 'http_request_codegen.generators.bash.curl',
+    }),
+    'javascript': OrderedDict({
+        'fetch': 'http_request_codegen.generators.javascript.fetch',
+    }),
+})
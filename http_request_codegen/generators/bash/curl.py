@@ -14,9 +14,16 @@ from http_request_codegen.generators.bash._utils import (
     DEFAULT_WRAP,
     escape_by_quote,
 )
-from http_request_codegen.hrc_valuer import (
-    lazy_name_by_parameter,
-    lazy_value_by_parameter,
+from http_request_codegen.hrc_http import stream_response_filename
+from http_request_codegen.hrc_meta import declare_features
+from http_request_codegen.hrc_random import derive_seed
+from http_request_codegen.hrc_spec import RequestSpec
+
+
+# keyword arguments of the features supported by the generators
+FEATURES = (
+    'headers', 'parameters', 'locale', 'seed', 'indent', 'quote_char',
+    'oneline', 'setup', 'teardown', 'wrap', 'stream_response',
 )
 
 
@@ -50,14 +57,15 @@ def _render_options_map(
 
 def _build_headers(
     headers, quote_char=DEFAULT_QUOTE_CHAR,
-    content_type='application/x-www-form-urlencoded',
+    content_type='application/x-www-form-urlencoded', escape=True,
 ):
     map, string = ([], '')
     for name, value in headers.items():
         option = '-H'
         value = ('%(header_name)s: %(header_value)s') % {
             'header_name': name,
-            'header_value': escape_by_quote(str(value), quote_char),
+            'header_value': escape_by_quote(str(value), quote_char)
+            if escape else str(value),
         }
         map.append([option, value])
 
@@ -76,28 +84,24 @@ def _build_headers(
     return (map, string, content_type)
 
 
-def get(
-    url, parameters=[], headers={}, indent=DEFAULT_INDENT,
-    quote_char=DEFAULT_QUOTE_CHAR, setup=False, teardown=None,
-    oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None, **kwargs,
-):
-    '''Pass extra options to 'curl' command in ``kwargs`` parameter. For
-    example, to save the response in a file, pass
-    ``kwargs={'-o': 'filename.ext'}``:
+def _stream_options(url, stream_response, quote_char=DEFAULT_QUOTE_CHAR):
+    # options that write the response into a file as it's received, without
+    # buffering the output
+    filename = stream_response_filename(url, stream_response)
+    return (
+        [['-N', None], ['-o', filename]],
+        ' -N -o %(quote_char)s%(filename)s%(quote_char)s' % {
+            'quote_char': quote_char,
+            'filename': escape_by_quote(filename, quote_char),
+        },
+    )
 
-    ```bash
-    curl -o "filename.ext"
-    ```
-    '''
-    '''In this implementation, options values and URLs are not wrapped in
-    multiples lines if these values exceed the wrap length.
-    '''
-    response = ''
 
-    if setup:
-        response += str(setup)
-
-    response += 'curl'
+def _get_options(spec, quote_char=DEFAULT_QUOTE_CHAR, escape=True):
+    # options of a GET request, as a list of option-value pairs and as the
+    # string used to compute the length of the command. Without ``escape``
+    # the values of the pairs are not escaped for the quotation character
+    parameters, headers, kwargs = spec.parameters, spec.headers, spec.options
 
     options_string = ''
     options_map = []
@@ -110,6 +114,8 @@ def get(
                     str(option_value), quote_char,
                 )
                 options_string += ' ' + option_value_string
+                if not escape:
+                    option_value_string = str(option_value)
             else:
                 option_value_string = None
             options_map.append([option_name, option_value_string])
@@ -129,11 +135,7 @@ def get(
 
             parameters_dict = OrderedDict({})
             for parameter in parameters:
-                parameter_name = lazy_name_by_parameter(parameter, seed=seed)
-                parameter_value = lazy_value_by_parameter(
-                    parameter, seed=seed, locale=locale,
-                )
-                parameters_dict[parameter_name] = parameter_value
+                parameters_dict[parameter['name']] = str(parameter['value'])
 
             params_string = escape_by_quote(
                 urlencode(parameters_dict),
@@ -143,47 +145,29 @@ def get(
                 quote_char=quote_char,
                 params=params_string,
             )
-            options_map.append(['-d', params_string])
+            options_map.append([
+                '-d', params_string if escape else urlencode(parameters_dict),
+            ])
 
     if headers:
         headers_map, headers_string, _ = _build_headers(
             headers,
             quote_char=quote_char,
+            escape=escape,
         )
         options_map.extend(headers_map)
         options_string += headers_string
 
-    # 1 here is a space
-    if len(options_string) + len(url) + len(response) + 1 < wrap:
-        oneline = True
-    response += ' '
+    return (options_map, options_string)
 
-    response += _render_options_map(
-        options_map,
-        options_string,
-        url,
-        oneline=oneline,
-        indent=indent,
-        quote_char=quote_char,
-    )
 
-    if teardown:
-        response += str(teardown)
-
-    return response
-
-
-def post(
-    url, parameters=[], files={}, headers={}, indent=DEFAULT_INDENT,
-    quote_char=DEFAULT_QUOTE_CHAR, setup=False, teardown=None,
-    oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None, **kwargs,
-):
-    response = ''
-
-    if setup:
-        response += str(setup)
-
-    response += 'curl'
+def _post_options(spec, quote_char=DEFAULT_QUOTE_CHAR, escape=True):
+    # options of a POST request, as a list of option-value pairs and as the
+    # string used to compute the length of the command. Without ``escape``
+    # the values of the pairs are not escaped for the quotation character
+    parameters, files, headers, kwargs = (
+        spec.parameters, spec.files, spec.headers, spec.options,
+    )
 
     options_string = ''
     options_map = []
@@ -194,6 +178,7 @@ def post(
         quote_char=quote_char,
         content_type='application/x-www-form-urlencoded'
                      if not files else 'multipart/form-data',
+        escape=escape,
     )
 
     _x_post_defined = False
@@ -230,13 +215,9 @@ def post(
     if parameters:
         parameters_dict = OrderedDict({})
         for parameter in parameters:
-            parameter_name = lazy_name_by_parameter(parameter, seed=seed)
-            parameter_value = lazy_value_by_parameter(
-                parameter,
-                seed=seed,
-                locale=locale,
+            parameters_dict[parameter.get('name', '')] = str(
+                parameter['value'],
             )
-            parameters_dict[parameter_name] = parameter_value
 
         # parameters codification
         if content_type == 'multipart/form-data':
@@ -247,6 +228,14 @@ def post(
                 )
                 options_map.append(['-F', option_value])
                 options_string += f' -F {option_value}'
+        elif spec.content_type == 'text/plain':
+            # the value of the only parameter is the raw body
+            option_value = str(parameters[0]['value'])
+            options_map.append(['-d', option_value])
+            options_string += ' -d {quote_char}{params}{quote_char}'.format(
+                quote_char=quote_char,
+                params=option_value,
+            )
         else:
             encode_func = json.dumps if content_type == 'application/json' \
                 else urlencode
@@ -263,29 +252,8 @@ def post(
     # Add files
     if files:
         for file_param_name, file_data in files.items():
-            if file_data is None:
-                file_data = lazy_value_by_parameter(
-                    {
-                        'name': '',
-                        'faker': 'faker.providers.file::file_path',
-                    },
-                    seed=seed,
-                    locale=locale,
-                )
-            elif isinstance(file_data, str):
-                file_data = file_data
-            else:  # Iterable
-                if file_data[0] is None:
-                    file_data = lazy_value_by_parameter(
-                        {
-                            'name': '',
-                            'faker': 'faker.providers.file::file_path',
-                        },
-                        seed=seed,
-                        locale=locale,
-                    )
-                else:
-                    file_data = file_data[0]
+            if not isinstance(file_data, str):  # Iterable
+                file_data = file_data[0]
             option_value = f'{file_param_name}=@'
             option_value += file_data
             options_string += f' -F {option_value}'
@@ -295,6 +263,103 @@ def post(
     options_string += headers_string
     options_map.extend(headers_map)
 
+    return (options_map, options_string)
+
+
+@declare_features(*FEATURES)
+def get(
+    url, parameters=[], headers={}, indent=DEFAULT_INDENT,
+    quote_char=DEFAULT_QUOTE_CHAR, setup=False, teardown=None,
+    oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
+    stream_response=False, **kwargs,
+):
+    '''Pass extra options to 'curl' command in ``kwargs`` parameter. For
+    example, to save the response in a file, pass
+    ``kwargs={'-o': 'filename.ext'}``:
+
+    ```bash
+    curl -o "filename.ext"
+    ```
+
+    Passing ``stream_response``, the response is written into the file as
+    it's received, disabling the buffering of the output:
+
+    ```bash
+    curl -N -o "filename.ext"
+    ```
+    '''
+    '''In this implementation, options values and URLs are not wrapped in
+    multiples lines if these values exceed the wrap length.
+    '''
+    spec = RequestSpec.from_arguments(
+        url, method='GET', parameters=parameters, headers=headers,
+        options=kwargs,
+    ).resolve(seed=seed, locale=locale)
+    url = spec.url
+
+    response = ''
+
+    if setup:
+        response += str(setup)
+
+    response += 'curl'
+
+    options_map, options_string = _get_options(spec, quote_char=quote_char)
+    if stream_response:
+        stream_map, stream_string = _stream_options(
+            spec.url, stream_response, quote_char=quote_char,
+        )
+        options_map.extend(stream_map)
+        options_string += stream_string
+
+    # 1 here is a space
+    if len(options_string) + len(url) + len(response) + 1 < wrap:
+        oneline = True
+    response += ' '
+
+    response += _render_options_map(
+        options_map,
+        options_string,
+        url,
+        oneline=oneline,
+        indent=indent,
+        quote_char=quote_char,
+    )
+
+    if teardown:
+        response += str(teardown)
+
+    return response
+
+
+@declare_features(*FEATURES)
+def post(
+    url, parameters=[], files={}, headers={}, indent=DEFAULT_INDENT,
+    quote_char=DEFAULT_QUOTE_CHAR, setup=False, teardown=None,
+    oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
+    stream_response=False, **kwargs,
+):
+    spec = RequestSpec.from_arguments(
+        url, method='POST', parameters=parameters, headers=headers,
+        files=files, options=kwargs,
+    ).resolve(seed=seed, locale=locale)
+    url, headers = spec.url, spec.headers
+
+    response = ''
+
+    if setup:
+        response += str(setup)
+
+    response += 'curl'
+
+    options_map, options_string = _post_options(spec, quote_char=quote_char)
+    if stream_response:
+        stream_map, stream_string = _stream_options(
+            spec.url, stream_response, quote_char=quote_char,
+        )
+        options_map.extend(stream_map)
+        options_string += stream_string
+
     # 1 here is a space
     _current_length = len(options_string) + len(url) + len(response) + 1 \
         + len(headers) * 2 * len(quote_char)
@@ -316,3 +381,169 @@ def post(
         response += str(teardown)
 
     return response
+
+
+def _config_value(value):
+    # strings of curl config files are always quoted by double quotes and
+    # backslashes escape the next character
+    return '"%s"' % value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def batch(
+    specs, parallel=True, parallel_max=None, config=False,
+    indent=DEFAULT_INDENT, quote_char=DEFAULT_QUOTE_CHAR, setup=False,
+    teardown=None, oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
+):
+    '''Renders multiple requests performed by one ``curl`` process, so the
+    connections to the same hosts are reused between them instead of
+    executing a new process for each request. The options of each request
+    are separated by ``--next``, so they don't leak to the next requests.
+
+    If ``config`` is ``True``, the requests are defined in a configuration
+    read by ``curl -K -`` from a heredoc, with each request separated by a
+    ``next`` line, which avoids the limits of the length of command lines
+    for large batches.
+
+    Args:
+        specs (list): Request specifications, as
+            [``RequestSpec``](/reference#requestspec) objects or
+            dictionaries with their arguments. Only GET and POST requests
+            are supported.
+        parallel (bool): Perform the requests in parallel (``--parallel``).
+        parallel_max (int): Maximum number of requests performed at the
+            same time (``--parallel-max``). If not defined, the curl
+            default is used.
+        config (bool): Define the requests in a configuration read from
+            the standard input instead of in the command line.
+        indent (str): Indentation used in the snippet.
+        quote_char (str): Quotation character used for strings. The
+            configuration always uses double quotes.
+        setup (str): Code prepended to the snippet.
+        teardown (str): Code appended at the end of the snippet.
+        oneline (bool): Render the command in one line. Configurations are
+            always rendered in multiple lines.
+        wrap (int): Maximum width of the lines of the snippet.
+        seed (int): Seed used randomizing the values of the requests. The
+            seed of each request is derived from it and their position in
+            the sequence.
+        locale (str): Locale used for ``faker`` providers.
+
+    Raises:
+        ValueError: No request specifications are passed, one of them uses
+            an HTTP method not supported or ``parallel_max`` is lower than 1
+            or defined without ``parallel``.
+
+    Examples:
+        >>> specs = [{'url': 'http://localhost/foo',
+        ...           'headers': {'Accept': '*/*'}},
+        ...          {'url': 'http://localhost/bar', 'method': 'POST'}]
+        >>> print(batch(specs, parallel_max=5, wrap=40))
+        curl --parallel --parallel-max 5 \\
+            -H "Accept: */*" \\
+            http://localhost/foo \\
+            --next \\
+            -X "POST" \\
+            http://localhost/bar
+        >>> print(batch(specs, config=True))
+        curl --parallel -K - <<'EOF'
+        -H "Accept: */*"
+        url = "http://localhost/foo"
+        next
+        -X "POST"
+        url = "http://localhost/bar"
+        EOF
+
+    Returns:
+        str: Code snippet of the requests batch.
+    '''
+    specs = [
+        spec if isinstance(spec, RequestSpec) else RequestSpec(**spec)
+        for spec in specs
+    ]
+    if not specs:
+        raise ValueError('At least one request specification must be passed')
+    for spec in specs:
+        if spec.method not in ('GET', 'POST'):
+            raise ValueError(
+                'HTTP %s method is not supported by curl batches' % (
+                    spec.method
+                ),
+            )
+    if parallel_max is not None:
+        if not parallel:
+            raise ValueError(
+                'The maximum number of parallel requests can only be'
+                ' defined performing them in parallel',
+            )
+        if parallel_max < 1:
+            raise ValueError(
+                'The maximum number of parallel requests must be greater'
+                ' than 0',
+            )
+    if config:
+        quote_char = '"'
+
+    command = 'curl'
+    if parallel:
+        command += ' --parallel'
+        if parallel_max is not None:
+            command += ' --parallel-max %d' % parallel_max
+
+    requests_options = []
+    for i, spec in enumerate(specs):
+        _seed = None if seed is None else derive_seed(seed, i)
+        spec = spec.resolve(seed=_seed, locale=locale)
+        options_func = _post_options if spec.method == 'POST' \
+            else _get_options
+        # the values of the configuration are escaped only once, by
+        # '_config_value', so they're collected without escaping
+        options_map, options_string = options_func(
+            spec, quote_char=quote_char, escape=not config,
+        )
+        requests_options.append((options_map, options_string, spec.url))
+
+    response = str(setup) if setup else ''
+
+    if config:
+        response += '%s -K - <<\'EOF\'\n' % command
+        for i, (options_map, _, url) in enumerate(requests_options):
+            if i:
+                response += 'next\n'
+            for option, value in options_map:
+                response += option
+                if value:
+                    response += ' ' + _config_value(value)
+                response += '\n'
+            response += 'url = %s\n' % _config_value(url)
+        response += 'EOF'
+    else:
+        # 8 here is ' --next '
+        _length = len(response) + len(command) + sum(
+            len(options_string) + len(url) + 8
+            for _, options_string, url in requests_options
+        )
+        if _length < wrap:
+            oneline = True
+
+        response += command
+        for i, (options_map, options_string, url) in enumerate(
+            requests_options,
+        ):
+            if i:
+                response += ' --next' if oneline else (
+                    ' \\\n%s--next' % indent
+                )
+            response += ' '
+            response += _render_options_map(
+                options_map,
+                options_string,
+                url,
+                oneline=oneline,
+                indent=indent,
+                quote_char=quote_char,
+            )
+
+    if teardown:
+        response += str(teardown)
+
+    return response
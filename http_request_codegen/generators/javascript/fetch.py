@@ -16,14 +16,24 @@ from http_request_codegen.generators.javascript._utils import (
     escape_by_quote,
     str_definition,
 )
-from http_request_codegen.hrc_exceptions import (
-    raise_post_text_plain_n_parameters_not_1,
+from http_request_codegen.hrc_http import stream_response_filename
+from http_request_codegen.hrc_meta import declare_features
+from http_request_codegen.hrc_random import derive_seed
+from http_request_codegen.hrc_spec import (
+    DEFAULT_CONTENT_TYPE,
+    RequestSpec,
+    common_headers,
 )
-from http_request_codegen.hrc_valuer import (
-    lazy_name_by_parameter,
-    lazy_value_by_parameter,
+
+
+# keyword arguments of the features supported by the generators
+FEATURES = (
+    'headers', 'parameters', 'locale', 'seed', 'indent', 'quote_char',
+    'oneline', 'setup', 'teardown', 'wrap', 'stream_response',
 )
 
+DEFAULT_CONCURRENCY = 10
+
 
 def _promises_chain_render(
     quote_char=DEFAULT_QUOTE_CHAR,
@@ -44,6 +54,58 @@ def _promises_chain_render(
     }
 
 
+def _stream_chain_render(
+    filename=None,
+    quote_char=DEFAULT_QUOTE_CHAR,
+    indent=DEFAULT_INDENT,
+    oneline=False,
+):
+    # the body of the response is consumed by a reader of their stream, so
+    # the chunks are processed as they are received, writing them into a file
+    # in NodeJS (if ``filename`` is defined) or logging them in browsers
+    if filename is not None:
+        file_line = (
+            'const file = fs.createWriteStream(%(quote_char)s%(filename)s'
+            '%(quote_char)s);'
+        ) % {
+            'quote_char': quote_char,
+            'filename': escape_by_quote(filename, quote_char),
+        }
+    lines = [
+        (1, 'const reader = response.body.getReader();'),
+        (1, 'while (true) {'),
+        (2, 'const {done, value} = await reader.read();'),
+        (2, 'if (done) {'),
+        (3, 'break;'),
+        (2, '}'),
+        (2, 'file.write(value);' if filename is not None
+         else 'console.log(value);'),
+        (1, '}'),
+    ]
+    if filename is not None:
+        lines.insert(0, (1, file_line))
+        lines.append((1, 'file.end();'))
+
+    return (
+        ').then(async function(response) {%(newline)s%(lines)s}).catch('
+        'function(err) {%(newline)s%(indent)sconsole.error('
+        '%(quote_char)sError:%(quote_char)s, err)%(separator)s'
+        '%(newline)s});'
+    ) % {
+        'newline': '\n' if not oneline else '',
+        'lines': ''.join(
+            '%s%s%s' % (
+                indent * depth if not oneline else '',
+                line,
+                '\n' if not oneline else '',
+            ) for depth, line in lines
+        ),
+        'indent': indent if not oneline else '',
+        'quote_char': quote_char,
+        'separator': ';' if not oneline else '',
+    }
+
+
 def _headers_render(
     headers, indent=DEFAULT_INDENT,
     quote_char=DEFAULT_QUOTE_CHAR, oneline=False,
@@ -116,11 +178,87 @@ def _kwargs_render(
     return response
 
 
+def _body_render(
+    content_type, parameters, indent=DEFAULT_INDENT,
+    quote_char=DEFAULT_QUOTE_CHAR, oneline=False, wrap=DEFAULT_WRAP,
+):
+    # body of not multipart requests, rendered as the value of the ``body``
+    # option of ``fetch``
+    if content_type == 'text/plain':
+        body = str_definition(
+            str(parameters[0]['value']),
+            indent=' ' * (len(indent) * 2 + 6),
+            quote_char=quote_char,
+            wrap=wrap,
+        )
+    else:  # 'application/json' or 'application/x-www-form-urlencoded'
+        object_content = ''
+
+        for i, parameter in enumerate(parameters):
+            name, value = parameter['name'], str(parameter['value'])
+
+            if oneline:
+                name_def = '{quote_char}{name}{quote_char}'.format(
+                    name=escape_by_quote(name, quote_char),
+                    quote_char=quote_char,
+                )
+                value_def = '{quote_char}{value}{quote_char}'.format(
+                    value=escape_by_quote(value, quote_char),
+                    quote_char=quote_char,
+                )
+            else:
+                name_def = str_definition(
+                    name,
+                    indent=indent * 3,
+                    quote_char=quote_char,
+                    wrap=wrap,
+                )
+                _value_def_indent = ' ' * (
+                    len(indent) * 3 + len(name_def) + 2
+                )
+                value_def = str_definition(
+                    value,
+                    indent=_value_def_indent,
+                    quote_char=quote_char,
+                    wrap=wrap,
+                )
+
+            object_content += (
+                '%(indent)s%(name)s: %(value)s%(comma)s'
+                '%(newline)s'
+            ) % {
+                'name': name_def,
+                'indent': indent * 3,
+                'value': value_def,
+                'comma': ',' if i < (len(parameters) - 1) else '',
+                'newline': '\n' if (
+                    not oneline and i < (len(parameters) - 1)
+                ) else '',
+            }
+
+        if object_content:
+            body = (
+                '%(object_wrapper)s({%(newline)s'
+                '%(object_content)s%(newline)s%(indent)s})'
+            ) % {
+                'object_wrapper': 'JSON.stringify'
+                if content_type == 'application/json'
+                else 'new URLSearchParams',
+                'object_content': object_content,
+                'newline': '\n' if not oneline else '',
+                'indent': indent * 2,
+            }
+        else:
+            body = ''
+    return body
+
+
+@declare_features(*FEATURES)
 def get(
     url, parameters=[], headers={}, indent=DEFAULT_INDENT,
     quote_char=DEFAULT_QUOTE_CHAR, setup=False, teardown=None,
     oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
-    **kwargs,
+    stream_response=False, **kwargs,
 ):
     '''This implementation will emulate browsers\' fetch API by default.
     using Promises-like response processing.
@@ -149,6 +287,17 @@ def get(
     ```javascript
     import \'whatwg-fetch\';
     ```
+
+    Passing ``stream_response``, the body of the response is consumed by a
+    reader of their ``ReadableStream``, logging the chunks as they are
+    received. If ``setup`` is defined, the chunks are written into the file
+    using the ``fs`` module of NodeJS and, if it's ``True``, the fetch API
+    included in NodeJS since v18 is used instead of ``node-fetch``, because
+    the bodies of the responses of the latter are not ``ReadableStream``:
+
+    ```javascript
+    const fs = require(\'fs\');
+    ```
     '''
 
     '''Implementation details:
@@ -165,6 +314,13 @@ def get(
     So ``wrap`` argument is used only to wrap strings in multiples lines,
     instead of use it for implement the request in multiples or one line.
     '''
+    spec = RequestSpec.from_arguments(
+        url, method='GET', parameters=parameters, headers=headers,
+        options=kwargs,
+    ).resolve(seed=seed, locale=locale)
+    url, parameters, headers, kwargs = (
+        spec.url, spec.parameters, spec.headers, spec.options,
+    )
 
     response = ''
 
@@ -173,20 +329,22 @@ def get(
         if isinstance(setup, str):
             response += setup
         else:
-            # If `setup == True`, 'node-fetch' for NodeJS is required
+            # If `setup == True`, 'node-fetch' for NodeJS is required, or
+            # 'fs' streaming the response
             response += (
-                'const fetch = require(%(quote_char)snode-fetch'
+                'const %(name)s = require(%(quote_char)s%(module)s'
                 '%(quote_char)s);%(newline)s%(newline)s'
             ) % {
                 'newline': '\n' if not oneline else '',
                 'quote_char': quote_char,
+                'name': 'fs' if stream_response else 'fetch',
+                'module': 'fs' if stream_response else 'node-fetch',
             }
 
     if parameters:
         parameters_dict = OrderedDict({})
         for parameter in parameters:
-            parameters_dict[lazy_name_by_parameter(parameter, seed=seed)] = \
-                lazy_value_by_parameter(parameter, seed=seed, locale=locale)
+            parameters_dict[parameter['name']] = parameter['value']
         url = '?'.join([url, urlencode(parameters_dict)])
 
     if oneline:
@@ -237,10 +395,18 @@ def get(
             newline='\n' if not oneline else '',
         )
 
-    response += _promises_chain_render(
-        quote_char=quote_char, indent=indent,
-        oneline=oneline,
-    )
+    if stream_response:
+        response += _stream_chain_render(
+            filename=stream_response_filename(
+                spec.url, stream_response,
+            ) if setup else None,
+            quote_char=quote_char, indent=indent, oneline=oneline,
+        )
+    else:
+        response += _promises_chain_render(
+            quote_char=quote_char, indent=indent,
+            oneline=oneline,
+        )
 
     if teardown:
         response += teardown
@@ -248,28 +414,51 @@ def get(
     return response
 
 
+@declare_features(*FEATURES)
 def post(
     url, parameters=[], files={}, headers={}, indent=DEFAULT_INDENT,
     quote_char=DEFAULT_QUOTE_CHAR, setup=True, teardown=None,
     oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
-    **kwargs,
+    stream_response=False, **kwargs,
 ):
+    '''POST method code generator for Javascript fetch API. Streaming
+    responses, the snippet is rendered like for GET requests. The fetch API
+    included in NodeJS doesn't support the ``FormData`` objects of the
+    ``form-data`` package, so streaming multipart requests with
+    ``setup=True`` the ``FormData`` and ``Blob`` globals of NodeJS v18+ are
+    used instead, reading the files with ``fs.readFileSync``.
+    '''
     # (no setup -> web / setup -> node)
+    spec = RequestSpec.from_arguments(
+        url, method='POST', parameters=parameters, headers=headers,
+        files=files, options=kwargs,
+    ).resolve(seed=seed, locale=locale)
+    url, parameters, files, headers, kwargs = (
+        spec.url, spec.parameters, spec.files, spec.headers, spec.options,
+    )
+
     response = ''
 
     # Discover content-type
-    content_type = 'application/x-www-form-urlencoded'
-    for key, value in headers.items():
-        if key.lower() == 'content-type':
-            content_type = value
-            break
+    content_type = spec.header('content-type', DEFAULT_CONTENT_TYPE)
     if content_type.startswith('multipart/form-data') or files:
         content_type = 'multipart/form-data'
 
+    # the fetch API included in NodeJS only accepts their own forms
+    _native_form_data = stream_response and setup is True
+
     # Initialization will depend on content type
     if setup:
         if isinstance(setup, str):
             response += setup
+        elif stream_response:
+            response += (
+                'const fs = require(%(quote_char)sfs%(quote_char)s);'
+            ) % {
+                'quote_char': quote_char,
+            }
+            if not oneline:
+                response += '\n\n'
         else:
             if content_type == 'multipart/form-data':
                 response += (
@@ -318,10 +507,7 @@ def post(
 
         # parameters render
         for parameter in parameters:
-            name = lazy_name_by_parameter(parameter, seed=seed)
-            value = lazy_value_by_parameter(
-                parameter, seed=seed, locale=locale,
-            )
+            name, value = parameter['name'], str(parameter['value'])
 
             # 20 here is the length of `formData.append(, );`
             _multiline_param = False
@@ -396,22 +582,41 @@ def post(
                 'space': ' ' if oneline else '',
             }
 
-            if setup:
+            if _native_form_data:
+                filepath = file_data if isinstance(file_data, str) \
+                    else file_data[0]
+                _blob_options = ''
+                if not isinstance(file_data, str) and len(file_data) > 1:
+                    _blob_options = (
+                        ', {type: %(quote_char)s%(content_type)s'
+                        '%(quote_char)s}'
+                    ) % {
+                        'quote_char': quote_char,
+                        'content_type': escape_by_quote(
+                            file_data[1], quote_char,
+                        ),
+                    }
+                response += (
+                    'new Blob([fs.readFileSync(%(quote_char)s%(filepath)s'
+                    '%(quote_char)s)]%(blob_options)s),%(space)s%(newline)s'
+                    '%(indent)s%(quote_char)s%(filename)s%(quote_char)s'
+                    '%(newline)s'
+                ) % {
+                    'quote_char': quote_char,
+                    'filepath': escape_by_quote(filepath, quote_char),
+                    'filename': escape_by_quote(
+                        os.path.basename(filepath), quote_char,
+                    ),
+                    'blob_options': _blob_options,
+                    'space': ' ' if oneline else '',
+                    'newline': '\n' if not oneline else '',
+                    'indent': indent if not oneline else '',
+                }
+            elif setup:
                 response += 'fs.createReadStream('  # length: 20
 
-                if isinstance(file_data, str):
-                    filepath = file_data
-                else:
-                    filepath = file_data[0] if file_data is not None else None
-                if filepath is None:
-                    filepath = lazy_value_by_parameter(
-                        {
-                            'name': '',
-                            'faker': 'faker.providers.file::file_path',
-                        },
-                        seed=seed,
-                        locale=locale,
-                    )
+                filepath = file_data if isinstance(file_data, str) \
+                    else file_data[0]
 
                 if not oneline:
                     _filepath = str_definition(
@@ -449,7 +654,7 @@ def post(
                     'filepath': _filepath,
                     'filename': _filename,
                 }
-                if not isinstance(file_data, str) and file_data is not None:
+                if not isinstance(file_data, str):
                     if len(file_data) > 1:
                         if not oneline:
                             _content_type = str_definition(
@@ -491,83 +696,11 @@ def post(
                 newline='\n' if not oneline else '',
             )
         response += '\n'
-    elif content_type == 'text/plain':
-        if len(parameters) != 1:
-            raise_post_text_plain_n_parameters_not_1(len(parameters))
-
-        _value = lazy_value_by_parameter(
-            parameters[0],
-            seed=seed,
-            locale=locale,
-        )
-        body = str_definition(
-            _value,
-            indent=' ' * (len(indent) * 2 + 6),
-            quote_char=quote_char,
-            wrap=wrap,
+    else:
+        body = _body_render(
+            content_type, parameters, indent=indent, quote_char=quote_char,
+            oneline=oneline, wrap=wrap,
         )
-    else:  # 'application/json' or 'application/x-www-form-urlencoded'
-        object_content = ''
-
-        for i, parameter in enumerate(parameters):
-            name = lazy_name_by_parameter(parameter, seed=seed)
-            value = lazy_value_by_parameter(
-                parameter, seed=seed, locale=locale,
-            )
-
-            if oneline:
-                name_def = '{quote_char}{name}{quote_char}'.format(
-                    name=escape_by_quote(name, quote_char),
-                    quote_char=quote_char,
-                )
-                value_def = '{quote_char}{value}{quote_char}'.format(
-                    value=escape_by_quote(value, quote_char),
-                    quote_char=quote_char,
-                )
-            else:
-                name_def = str_definition(
-                    name,
-                    indent=indent * 3,
-                    quote_char=quote_char,
-                    wrap=wrap,
-                )
-                _value_def_indent = ' ' * (
-                    len(indent) * 3 + len(name_def) + 2
-                )
-                value_def = str_definition(
-                    value,
-                    indent=_value_def_indent,
-                    quote_char=quote_char,
-                    wrap=wrap,
-                )
-
-            object_content += (
-                '%(indent)s%(name)s: %(value)s%(comma)s'
-                '%(newline)s'
-            ) % {
-                'name': name_def,
-                'indent': indent * 3,
-                'value': value_def,
-                'comma': ',' if i < (len(parameters) - 1) else '',
-                'newline': '\n' if (
-                    not oneline and i < (len(parameters) - 1)
-                ) else '',
-            }
-
-        if object_content:
-            body = (
-                '%(object_wrapper)s({%(newline)s'
-                '%(object_content)s%(newline)s%(indent)s})'
-            ) % {
-                'object_wrapper': 'JSON.stringify'
-                if content_type == 'application/json'
-                else 'new URLSearchParams',
-                'object_content': object_content,
-                'newline': '\n' if not oneline else '',
-                'indent': indent * 2,
-            }
-        else:
-            body = ''
 
     response += (
         'fetch(%(newline)s%(indent)s%(url)s,%(space)s%(newline)s'
@@ -616,10 +749,305 @@ def post(
         newline='\n' if not oneline else '',
     )
 
-    response += _promises_chain_render(
-        quote_char=quote_char, indent=indent,
-        oneline=oneline,
-    )
+    if stream_response:
+        response += _stream_chain_render(
+            filename=stream_response_filename(
+                spec.url, stream_response,
+            ) if setup else None,
+            quote_char=quote_char, indent=indent, oneline=oneline,
+        )
+    else:
+        response += _promises_chain_render(
+            quote_char=quote_char, indent=indent,
+            oneline=oneline,
+        )
+
+    if teardown:
+        response += teardown
+
+    return response
+
+
+def pool(
+    specs, concurrency=DEFAULT_CONCURRENCY, keep_alive=False,
+    indent=DEFAULT_INDENT, quote_char=DEFAULT_QUOTE_CHAR, setup=True,
+    teardown=None, wrap=DEFAULT_WRAP, seed=None, locale=None,
+):
+    '''Renders multiple requests performed by a pool of asynchronous
+    workers, which take the requests from an array of request descriptors
+    until all of them are performed, so no more than ``concurrency``
+    requests are performed at the same time. The responses are stored in
+    the ``responses`` array, in the same order as the requests.
+
+    The headers defined with the same value in all the requests, except
+    ``Content-Type``, are defined once in the shared ``headers`` object and
+    merged with the headers of each request.
+
+    Args:
+        specs (list): Request specifications, as
+            [``RequestSpec``](/reference#requestspec) objects or
+            dictionaries with their arguments. Only GET and POST requests
+            without files are supported.
+        concurrency (int): Number of workers of the pool.
+        keep_alive (bool): Reuse the connections between requests using
+            NodeJS ``http`` and ``https`` agents with ``keepAlive`` enabled.
+            If ``setup`` is a string, it must require the ``http`` and
+            ``https`` modules.
+        indent (str): Indentation used in the snippet.
+        quote_char (str): Quotation character used for strings.
+        setup (bool, str): If ``True``, the modules used by NodeJS are
+            required at the beginning of the snippet. If a string is passed,
+            it replaces the requires and if ``False``, the snippet is
+            rendered for browsers.
+        teardown (str): Code appended at the end of the snippet.
+        wrap (int): Maximum width of the strings of the snippet.
+        seed (int): Seed used randomizing the values of the requests. The
+            seed of each request is derived from it and their position in
+            the sequence.
+        locale (str): Locale used for ``faker`` providers.
+
+    Raises:
+        ValueError: No request specifications are passed, one of them uses
+            an HTTP method not supported or sends files, ``concurrency`` is
+            lower than 1 or ``keep_alive`` is enabled rendering for
+            browsers.
+
+    Examples:
+        >>> print(pool([{'url': 'http://localhost/foo'}], concurrency=2,
+        ...            setup=False))
+        const requests = [
+          {
+            url: 'http://localhost/foo',
+            options: {
+              method: 'GET'
+            }
+          }
+        ];
+        <BLANKLINE>
+        const concurrency = 2;
+        const responses = [];
+        let nextRequest = 0;
+        <BLANKLINE>
+        async function worker() {
+          while (nextRequest < requests.length) {
+            const i = nextRequest++;
+            const request = requests[i];
+            try {
+              responses[i] = await fetch(request.url, request.options);
+            } catch (err) {
+              console.error('Error:', err);
+            }
+          }
+        }
+        <BLANKLINE>
+        Promise.all(
+          Array.from({length: Math.min(concurrency, requests.length)}, worker)
+        ).then(function() {
+          console.log(responses);
+        });
+
+    Returns:
+        str: Code snippet of the requests pool.
+    '''
+    specs = [
+        spec if isinstance(spec, RequestSpec) else RequestSpec(**spec)
+        for spec in specs
+    ]
+    if not specs:
+        raise ValueError('At least one request specification must be passed')
+    for spec in specs:
+        if spec.method not in ('GET', 'POST'):
+            raise ValueError(
+                'HTTP %s method is not supported by fetch pools' % (
+                    spec.method
+                ),
+            )
+        if spec.files or spec.content_type == 'multipart/form-data':
+            raise ValueError(
+                'Multipart requests are not supported by fetch pools',
+            )
+    if concurrency < 1:
+        raise ValueError('The concurrency must be greater than 0')
+    if keep_alive and not setup:
+        raise ValueError(
+            'Keep-alive agents are only available for NodeJS, rendering'
+            ' with \'setup\'',
+        )
+
+    shared_headers = common_headers(specs)
+
+    response = ''
+
+    # initialization
+    if setup:
+        if isinstance(setup, str):
+            response += setup
+        else:
+            response += (
+                'const fetch = require(%(quote_char)snode-fetch'
+                '%(quote_char)s);\n'
+            ) % {'quote_char': quote_char}
+            if keep_alive:
+                for module in ('http', 'https'):
+                    response += (
+                        'const %(module)s = require(%(quote_char)s'
+                        '%(module)s%(quote_char)s);\n'
+                    ) % {'module': module, 'quote_char': quote_char}
+            response += '\n'
+    if keep_alive:
+        response += (
+            'const httpAgent = new http.Agent({keepAlive: true});\n'
+            'const httpsAgent = new https.Agent({keepAlive: true});\n'
+            'const agent = function(url) {\n'
+            '%(indent)sreturn url.protocol === %(quote_char)shttp:'
+            '%(quote_char)s ? httpAgent : httpsAgent;\n'
+            '};\n\n'
+        ) % {'indent': indent, 'quote_char': quote_char}
+
+    # shared headers
+    if shared_headers:
+        response += 'const headers = {\n'
+        for i, (key, value) in enumerate(shared_headers.items()):
+            response += (
+                '%(indent)s%(quote_char)s%(key)s%(quote_char)s:'
+                ' %(value)s%(comma)s\n'
+            ) % {
+                'indent': indent,
+                'quote_char': quote_char,
+                'key': escape_by_quote(key, quote_char),
+                'value': str_definition(
+                    value,
+                    indent=' ' * (len(indent) + len(key) + 4),
+                    quote_char=quote_char,
+                    wrap=wrap,
+                ),
+                'comma': ',' if i < len(shared_headers) - 1 else '',
+            }
+        response += '};\n\n'
+
+    # request descriptors, rendering their options by the helpers used by
+    # the request functions, indented one more level
+    response += 'const requests = [\n'
+    for i, spec in enumerate(specs):
+        _seed = None if seed is None else derive_seed(seed, i)
+        if shared_headers:
+            spec = spec.without_headers(shared_headers)
+        spec = spec.resolve(seed=_seed, locale=locale)
+        url, parameters, headers, kwargs = (
+            spec.url, spec.parameters, spec.headers, spec.options,
+        )
+        _wrap = wrap - len(indent)
+
+        body = ''
+        if spec.method == 'GET':
+            if parameters:
+                parameters_dict = OrderedDict({})
+                for parameter in parameters:
+                    parameters_dict[parameter['name']] = parameter['value']
+                url = '?'.join([url, urlencode(parameters_dict)])
+        elif parameters:
+            body = _body_render(
+                spec.content_type, parameters, indent=indent,
+                quote_char=quote_char, wrap=_wrap,
+            )
+
+        options = (
+            '%(indent)s%(indent)smethod: %(quote_char)s%(method)s'
+            '%(quote_char)s%(comma)s\n'
+        ) % {
+            'indent': indent,
+            'quote_char': quote_char,
+            'method': spec.method,
+            'comma': ',' if (body or headers or kwargs) else '',
+        }
+        if body:
+            options += '%(indent)s%(indent)sbody: %(body)s%(comma)s\n' % {
+                'indent': indent,
+                'body': body,
+                'comma': ',' if (headers or kwargs) else '',
+            }
+        if headers:
+            options += _headers_render(
+                headers, indent=indent, quote_char=quote_char, wrap=_wrap,
+                _comma_at_end=bool(kwargs),
+            )
+        if kwargs:
+            options += _kwargs_render(
+                kwargs, indent=indent, quote_char=quote_char, wrap=_wrap,
+            )
+
+        response += (
+            '%(indent)s{\n'
+            '%(indent)s%(indent)surl: %(url)s,\n'
+            '%(indent)s%(indent)soptions: {\n'
+            '%(options)s'
+            '%(indent)s%(indent)s}\n'
+            '%(indent)s}%(comma)s\n'
+        ) % {
+            'indent': indent,
+            'url': str_definition(
+                url, indent=' ' * (len(indent) * 2 + 5),
+                quote_char=quote_char, wrap=wrap,
+            ),
+            'options': ''.join(
+                indent + line + '\n' for line in options.splitlines()
+            ),
+            'comma': ',' if i < len(specs) - 1 else '',
+        }
+    response += '];\n\n'
+
+    # pool of workers, merging the shared options with the request ones
+    options_definition, fetch_options = '', 'request.options'
+    if shared_headers or keep_alive:
+        extra_options = []
+        if shared_headers:
+            extra_options.append(
+                'headers: Object.assign({}, headers, request.options.headers)',
+            )
+        if keep_alive:
+            extra_options.append('agent: agent')
+        options_definition = (
+            '%(indent)sconst options = Object.assign({}, request.options, {\n'
+            '%(options)s\n'
+            '%(indent)s});\n'
+        ) % {
+            'indent': indent * 2,
+            'options': ',\n'.join(
+                indent * 3 + option for option in extra_options
+            ),
+        }
+        fetch_options = 'options'
+    response += (
+        'const concurrency = %(concurrency)d;\n'
+        'const responses = [];\n'
+        'let nextRequest = 0;\n\n'
+        'async function worker() {\n'
+        '%(indent)swhile (nextRequest < requests.length) {\n'
+        '%(indent)s%(indent)sconst i = nextRequest++;\n'
+        '%(indent)s%(indent)sconst request = requests[i];\n'
+        '%(options_definition)s'
+        '%(indent)s%(indent)stry {\n'
+        '%(indent)s%(indent)s%(indent)sresponses[i] = await fetch('
+        'request.url, %(fetch_options)s);\n'
+        '%(indent)s%(indent)s} catch (err) {\n'
+        '%(indent)s%(indent)s%(indent)sconsole.error(%(quote_char)sError:'
+        '%(quote_char)s, err);\n'
+        '%(indent)s%(indent)s}\n'
+        '%(indent)s}\n'
+        '}\n\n'
+        'Promise.all(\n'
+        '%(indent)sArray.from({length: Math.min(concurrency,'
+        ' requests.length)}, worker)\n'
+        ').then(function() {\n'
+        '%(indent)sconsole.log(responses);\n'
+        '});'
+    ) % {
+        'concurrency': concurrency,
+        'indent': indent,
+        'quote_char': quote_char,
+        'options_definition': options_definition,
+        'fetch_options': fetch_options,
+    }
 
     if teardown:
         response += teardown
@@ -6,6 +6,7 @@ from http_request_codegen.hrc_string import (
     escape_double_quote,
     escape_single_quote,
     lazy_escape_quote_func_by_quote_char,
+    wrap_string_segments,
 )
 
 
@@ -420,27 +421,28 @@ def str_definition(
         )
 
     indent_length = len(indent)
-    response = '({quote_char}'.format(
-        quote_char=quote_char,
+    # columns used before the segments by '(' and the quote in the first
+    # line and by ' ' and the quote in the next ones
+    _first_line_offset = 1 + len(quote_char) + indent_length
+    _lines_offset = 2 + indent_length
+    segments = wrap_string_segments(
+        string,
+        wrap - 2 - _first_line_offset,
+        wrap - 2 - _lines_offset,
     )
-    _chars_in_current_line = len(response) + indent_length
-    for i, ch in enumerate(string):
-        response += ch
-        _chars_in_current_line += 1
-        if _chars_in_current_line >= wrap - 2:
-            if i >= len(string) - 1:
-                break
-            response += '{quote_char}\n{indent} {quote_char}'.format(
-                quote_char=quote_char,
-                indent=indent,
-            )
-            _chars_in_current_line = 2 + indent_length  # ' ('
-    response += '{quote_char}{newline}{indent})'.format(
+    _chars_in_current_line = len(segments[-1]) + (
+        _first_line_offset if len(segments) < 2 else _lines_offset
+    ) if segments else _first_line_offset
+
+    return '({quote_char}{value}{quote_char}{newline}{indent})'.format(
+        value='{quote_char}\n{indent} {quote_char}'.format(
+            quote_char=quote_char,
+            indent=indent,
+        ).join(segments),
         newline='\n' if _chars_in_current_line >= wrap - 1 else '',
         indent=indent if _chars_in_current_line >= wrap - 1 else '',
         quote_char=quote_char,
     )
-    return response
 
 
 def dict_definition(
@@ -0,0 +1,321 @@
+'''Python httpx asynchronous client code snippets generator.'''
+
+from http_request_codegen.generators.python import requests
+from http_request_codegen.generators.python._utils import (
+    DEFAULT_INDENT,
+    DEFAULT_QUOTE_CHAR,
+    DEFAULT_WRAP,
+    dict_definition,
+    escape_by_quote,
+)
+from http_request_codegen.hrc_http import stream_response_filename
+from http_request_codegen.hrc_meta import declare_features
+from http_request_codegen.hrc_random import derive_seed
+from http_request_codegen.hrc_spec import RequestSpec, common_headers
+
+
+# keyword arguments of the features supported by the generators, one line
+# rendering is not included because the coroutine needs multiple lines
+FEATURES = (
+    'headers', 'parameters', 'locale', 'seed', 'indent', 'quote_char',
+    'setup', 'teardown', 'wrap', 'stream_response',
+)
+
+DEFAULT_CONCURRENCY = 10
+
+
+def _setup_code(setup):
+    if isinstance(setup, str):
+        return setup
+    return 'import asyncio\n\nimport httpx\n\n\n' if setup else ''
+
+
+def _render_call(
+    spec, indent_depth, indent=DEFAULT_INDENT, wrap=DEFAULT_WRAP,
+    oneline=False, assignment='', **kwargs,
+):
+    # renders the call of the client method using the requests generators,
+    # because the API of httpx clients is compatible with the requests one,
+    # except for raw text bodies, passed as ``content``
+    func = requests.post if spec.method == 'POST' else requests.get
+    if spec.method == 'POST':
+        kwargs['_text_kwarg'] = 'content'
+    _indent = indent * indent_depth
+    code = func(
+        spec, indent=indent, setup=False, teardown=None,
+        wrap=float('inf') if oneline else wrap - len(_indent),
+        _assignment=assignment, _client='client', **kwargs,
+    )
+    return '\n'.join(_indent + line for line in code.split('\n'))
+
+
+def _client_code(
+    headers, indent=DEFAULT_INDENT, quote_char=DEFAULT_QUOTE_CHAR,
+    wrap=DEFAULT_WRAP, oneline=False,
+):
+    # client creation, defining the headers shared by all the requests
+    if not headers:
+        return '%sasync with httpx.AsyncClient() as client:\n' % indent
+    headers_definition = dict_definition(
+        headers, indent='', quote_char=quote_char, newline='',
+    )
+    # 'async with httpx.AsyncClient(headers=' (38) + ') as client:' (12)
+    if not oneline and len(indent) + len(headers_definition) + 50 > wrap:
+        headers_definition = dict_definition(
+            headers, indent=indent, indent_depth=1, quote_char=quote_char,
+            wrap=wrap,
+        )
+    return '%sasync with httpx.AsyncClient(headers=%s) as client:\n' % (
+        indent, headers_definition,
+    )
+
+
+def _stream_code(
+    url, stream_response, indent=DEFAULT_INDENT,
+    quote_char=DEFAULT_QUOTE_CHAR, oneline=False,
+):
+    # body of the streaming context of the response, which writes their
+    # chunks into a file as they are received. In one line, only simple
+    # statements can follow the colon of the context, so the chunks are
+    # written by an asynchronous comprehension
+    if oneline:
+        schema = (
+            ' as response: f = open(%(quote_char)s%(filename)s'
+            '%(quote_char)s, %(quote_char)swb%(quote_char)s);'
+            ' [f.write(chunk) async for chunk in'
+            ' response.aiter_bytes(chunk_size=%(chunk_size)d)]; f.close()\n'
+            '%(indent)s%(indent)sreturn response'
+        )
+    else:
+        schema = (
+            ' as response:\n'
+            '%(indent)s%(indent)s%(indent)swith open(%(quote_char)s'
+            '%(filename)s%(quote_char)s, %(quote_char)swb%(quote_char)s)'
+            ' as f:\n'
+            '%(indent)s%(indent)s%(indent)s%(indent)sasync for chunk in'
+            ' response.aiter_bytes(chunk_size=%(chunk_size)d):\n'
+            '%(indent)s%(indent)s%(indent)s%(indent)s%(indent)s'
+            'f.write(chunk)\n'
+            '%(indent)s%(indent)s%(indent)sreturn response'
+        )
+    return schema % {
+        'indent': indent,
+        'quote_char': quote_char,
+        'filename': escape_by_quote(
+            stream_response_filename(url, stream_response), quote_char,
+        ),
+        'chunk_size': requests.DEFAULT_CHUNK_SIZE,
+    }
+
+
+def _request(
+    method, url, parameters=[], files={}, headers={}, indent=DEFAULT_INDENT,
+    quote_char=DEFAULT_QUOTE_CHAR, setup=True, teardown=None, oneline=False,
+    wrap=DEFAULT_WRAP, seed=None, locale=None, stream_response=False,
+    **kwargs,
+):
+    spec = RequestSpec.from_arguments(
+        url, method=method, parameters=parameters, headers=headers,
+        files=files, options=kwargs,
+    ).resolve(seed=seed, locale=locale)
+
+    response = _setup_code(setup)
+    response += 'async def main():\n'
+    response += '%sasync with httpx.AsyncClient() as client:\n' % indent
+    if stream_response:
+        response += _render_call(
+            spec, 2, indent=indent, quote_char=quote_char, oneline=oneline,
+            wrap=wrap - 13, seed=seed, locale=locale,  # ' as response:' (13)
+            assignment='async with ', _function='stream', _method_arg=True,
+        )
+        response += _stream_code(
+            spec.url, stream_response, indent=indent, quote_char=quote_char,
+            oneline=oneline,
+        )
+    else:
+        response += _render_call(
+            spec, 2, indent=indent, quote_char=quote_char, oneline=oneline,
+            wrap=wrap, seed=seed, locale=locale, assignment='return await ',
+        )
+    response += '\n\n\nreq = asyncio.run(main())'
+
+    if teardown:
+        response += str(teardown)
+    return response
+
+
+@declare_features(*FEATURES)
+def get(
+    url, parameters=[], headers={}, indent=DEFAULT_INDENT,
+    quote_char=DEFAULT_QUOTE_CHAR, setup=True, teardown=None,
+    oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
+    stream_response=False, **kwargs,
+):
+    '''The request is performed by an
+    [``httpx.AsyncClient``](https://www.python-httpx.org/async/) inside a
+    coroutine executed by ``asyncio.run``, so the response is stored in the
+    ``req`` variable like in the other Python implementations. Parameters
+    are passed using the ``params`` argument of the client method.
+
+    The coroutine definition needs multiple lines, so one line rendering is
+    not supported by this implementation. Passing ``oneline``, only the call
+    of the client method is rendered in one line.
+
+    If you want to import more modules in the initialization snippet, keep
+    in mind that you must provide ``import asyncio`` and ``import httpx``
+    lines also in the ``setup`` argument.
+
+    To render multiple requests performed concurrently by the same client,
+    use the function
+    ``http_request_codegen.generators.python.httpx.gather``.
+
+    Passing ``stream_response``, the request is sent by ``client.stream``
+    and the content of the response is written to the file in chunks as they
+    are received, iterating over ``response.aiter_bytes``. Rendering with
+    ``oneline``, the streaming context, opening the file and writing the
+    chunks, is rendered in one line too.
+    '''
+    return _request(
+        'GET', url, parameters=parameters, headers=headers, indent=indent,
+        quote_char=quote_char, setup=setup, teardown=teardown,
+        oneline=oneline, wrap=wrap, seed=seed, locale=locale,
+        stream_response=stream_response, **kwargs,
+    )
+
+
+@declare_features(*FEATURES)
+def post(
+    url, parameters=[], files={}, headers={}, indent=DEFAULT_INDENT,
+    quote_char=DEFAULT_QUOTE_CHAR, setup=True, teardown=None,
+    oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
+    stream_response=False, **kwargs,
+):
+    '''POST method code generator for Python httpx asynchronous client.
+    Bodies are rendered like in the requests implementation, except
+    ``text/plain`` ones, which are passed using the ``content`` argument.
+    '''
+    return _request(
+        'POST', url, parameters=parameters, files=files, headers=headers,
+        indent=indent, quote_char=quote_char, setup=setup, teardown=teardown,
+        oneline=oneline, wrap=wrap, seed=seed, locale=locale,
+        stream_response=stream_response, **kwargs,
+    )
+
+
+def gather(
+    specs, concurrency=DEFAULT_CONCURRENCY, indent=DEFAULT_INDENT,
+    quote_char=DEFAULT_QUOTE_CHAR, setup=True, teardown=None,
+    oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
+):
+    '''Renders multiple requests performed concurrently by the same
+    ``httpx.AsyncClient`` using ``asyncio.gather``, limiting the number of
+    requests in flight with an ``asyncio.Semaphore``. The responses are
+    stored in the ``responses`` list, in the same order as the requests.
+
+    The headers defined with the same value in all the requests, except
+    ``Content-Type``, are hoisted to the client and only the rest are passed
+    to each request.
+
+    Args:
+        specs (list): Request specifications, as
+            [``RequestSpec``](/reference#requestspec) objects or
+            dictionaries with their arguments. Only GET and POST requests
+            are supported.
+        concurrency (int): Maximum number of requests performed at the
+            same time.
+        indent (str): Indentation used in the snippet.
+        quote_char (str): Quotation character used for strings.
+        setup (bool, str): If ``True``, the modules used are imported at the
+            beginning of the snippet. If a string is passed, it replaces the
+            imports.
+        teardown (str): Code appended at the end of the snippet.
+        oneline (bool): Render each request call in one line.
+        wrap (int): Maximum width of the lines of the snippet.
+        seed (int): Seed used randomizing the values of the requests. The
+            seed of each request is derived from it and their position in
+            the sequence.
+        locale (str): Locale used for ``faker`` providers.
+
+    Raises:
+        ValueError: No request specifications are passed, one of them uses
+            an HTTP method not supported or ``concurrency`` is lower than 1.
+
+    Examples:
+        >>> print(gather([{'url': 'http://localhost/foo'},
+        ...               {'url': 'http://localhost/bar'}],
+        ...              concurrency=2, setup=False))
+        async def send(semaphore, request):
+            async with semaphore:
+                return await request
+        <BLANKLINE>
+        <BLANKLINE>
+        async def main():
+            semaphore = asyncio.Semaphore(2)
+            async with httpx.AsyncClient() as client:
+                requests = [
+                    client.get('http://localhost/foo'),
+                    client.get('http://localhost/bar'),
+                ]
+                return await asyncio.gather(*(
+                    send(semaphore, request) for request in requests
+                ))
+        <BLANKLINE>
+        <BLANKLINE>
+        responses = asyncio.run(main())
+
+    Returns:
+        str: Code snippet of the concurrent requests.
+    '''
+    specs = [
+        spec if isinstance(spec, RequestSpec) else RequestSpec(**spec)
+        for spec in specs
+    ]
+    if not specs:
+        raise ValueError('At least one request specification must be passed')
+    for spec in specs:
+        if spec.method not in ('GET', 'POST'):
+            raise ValueError(
+                'HTTP %s method is not supported by httpx gathering' % (
+                    spec.method
+                ),
+            )
+    if concurrency < 1:
+        raise ValueError('The concurrency must be greater than 0')
+
+    client_headers = common_headers(specs)
+
+    response = _setup_code(setup)
+    response += (
+        'async def send(semaphore, request):\n'
+        '%(indent)sasync with semaphore:\n'
+        '%(indent)s%(indent)sreturn await request\n\n\n'
+        'async def main():\n'
+        '%(indent)ssemaphore = asyncio.Semaphore(%(concurrency)d)\n'
+    ) % {'indent': indent, 'concurrency': concurrency}
+    response += _client_code(
+        client_headers, indent=indent, quote_char=quote_char, wrap=wrap,
+        oneline=oneline,
+    )
+    response += '%srequests = [\n' % (indent * 2)
+    for i, spec in enumerate(specs):
+        if client_headers:
+            spec = spec.without_headers(client_headers)
+        _seed = None if seed is None else derive_seed(seed, i)
+        response += _render_call(
+            spec.resolve(seed=_seed, locale=locale), 3, indent=indent,
+            quote_char=quote_char, oneline=oneline, wrap=wrap - 1,
+            seed=_seed, locale=locale,
+        )
+        response += ',\n'
+    response += (
+        '%(indent)s%(indent)s]\n'
+        '%(indent)s%(indent)sreturn await asyncio.gather(*(\n'
+        '%(indent)s%(indent)s%(indent)s'
+        'send(semaphore, request) for request in requests\n'
+        '%(indent)s%(indent)s))\n\n\n'
+        'responses = asyncio.run(main())'
+    ) % {'indent': indent}
+
+    if teardown:
+        response += str(teardown)
+    return response
@@ -12,20 +12,80 @@ from http_request_codegen.generators.python._utils import (
     kwarg_definition_dict_valued,
     str_definition,
 )
-from http_request_codegen.hrc_exceptions import (
-    raise_post_text_plain_n_parameters_not_1,
-)
-from http_request_codegen.hrc_valuer import (
-    lazy_name_by_parameter,
-    lazy_value_by_parameter,
+from http_request_codegen.hrc_http import stream_response_filename
+from http_request_codegen.hrc_meta import declare_features
+from http_request_codegen.hrc_random import derive_seed
+from http_request_codegen.hrc_spec import RequestSpec, common_headers
+
+
+# keyword arguments of the features supported by the generators
+FEATURES = (
+    'headers', 'parameters', 'locale', 'seed', 'indent', 'quote_char',
+    'oneline', 'setup', 'teardown', 'wrap', 'stream_response',
 )
 
+# size of the chunks in which streamed responses are consumed
+DEFAULT_CHUNK_SIZE = 8192
+
+# The private arguments of the generators (``_assignment``, ``_client``,
+# ``_function``, ``_method_arg`` and ``_text_kwarg``) are used to render the
+# calls of clients with the same API than requests, like sessions or the
+# httpx implementation.
+
 
+def _stream_response_render(
+    url, stream_response, indent=DEFAULT_INDENT,
+    quote_char=DEFAULT_QUOTE_CHAR, oneline=False,
+):
+    # writes the chunks of the streamed response into a file as they are
+    # received, so the whole response is not stored in memory. In one line
+    # compound statements can't follow others, so the file is not opened
+    # by a ``with`` statement
+    if oneline:
+        schema = (
+            'f = open(%(quote_char)s%(filename)s%(quote_char)s,'
+            ' %(quote_char)swb%(quote_char)s);'
+            'f.writelines(req.iter_content(chunk_size=%(chunk_size)d));'
+            'f.close();'
+        )
+    else:
+        schema = (
+            '\n\nwith open(%(quote_char)s%(filename)s%(quote_char)s,'
+            ' %(quote_char)swb%(quote_char)s) as f:\n'
+            '%(indent)sfor chunk in req.iter_content('
+            'chunk_size=%(chunk_size)d):\n'
+            '%(indent)s%(indent)sf.write(chunk)'
+        )
+    return schema % {
+        'quote_char': quote_char,
+        'filename': escape_by_quote(
+            stream_response_filename(url, stream_response), quote_char,
+        ),
+        'indent': indent,
+        'chunk_size': DEFAULT_CHUNK_SIZE,
+    }
+
+
+def _method_arg_render(
+    method, indent=DEFAULT_INDENT, quote_char=DEFAULT_QUOTE_CHAR,
+    oneline=False,
+):
+    # HTTP method passed as first positional argument of the call
+    return '%(indent)s%(quote_char)s%(method)s%(quote_char)s,%(end)s' % {
+        'indent': indent if not oneline else '',
+        'quote_char': quote_char,
+        'method': method,
+        'end': '\n' if not oneline else ' ',
+    }
+
+
+@declare_features(*FEATURES)
 def get(
     url, parameters=[], headers={}, indent=DEFAULT_INDENT,
     quote_char=DEFAULT_QUOTE_CHAR, setup=True, teardown=None,
     oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
-    **kwargs,
+    stream_response=False, _assignment='req = ', _client='requests',
+    _function='get', _method_arg=False, **kwargs,
 ):
     '''Parameters are passed using
     [``requests.get``](https://requests.readthedocs.io/en/api/#requests.get)
@@ -46,7 +106,23 @@ def get(
 
     requests.get('<url>'...
     ```
+
+    Passing ``stream_response``, the request is performed with
+    ``stream=True`` and the content of the response is written to the file
+    in chunks of 8192 bytes using ``Response.iter_content``. Rendering
+    with ``oneline``, the file is opened and closed without a ``with``
+    statement, so all the snippet fits in one line.
     '''
+    spec = RequestSpec.from_arguments(
+        url, method='GET', parameters=parameters, headers=headers,
+        options=kwargs,
+    ).resolve(seed=seed, locale=locale)
+    url, parameters, headers, kwargs = (
+        spec.url, spec.parameters, spec.headers, spec.options,
+    )
+    if stream_response:
+        kwargs = dict(kwargs, stream=True)
+
     _oneline = oneline
     response = ''
 
@@ -67,7 +143,11 @@ def get(
             setup_length += len(response)
 
     # url length
-    url_length = len(url) + 21  # 'req = requests.get(' (19) + '' (2)
+    # assignment + client + '.' + function + '(' + '' (2)
+    url_length = len(url) + len(_assignment) + len(_client) + \
+        len(_function) + 4
+    if _method_arg:
+        url_length += len(quote_char) * 2 + 5  # 'GET', (5)
 
     # parameters length
     parameters_line_length = 0
@@ -75,12 +155,9 @@ def get(
         parameters_keys = OrderedDict({})
         parameters_line_length = 9  # 'params={}'
         for parameter in parameters:
-            name = escape_by_quote(
-                lazy_name_by_parameter(parameter, seed=seed),
-                quote_char,
-            )
+            name = escape_by_quote(parameter['name'], quote_char)
             value = str_definition(
-                lazy_value_by_parameter(parameter, seed=seed, locale=locale),
+                str(parameter['value']),
                 quote_char=quote_char,
                 indent=indent + (' ' * (8 + len(name))),
                 wrap=wrap,
@@ -125,9 +202,15 @@ def get(
 
     # url
     response += (
-        'req = requests.get(%(newline)s%(indent)s%(url)s%(newline2)s'
-        '%(comma)s%(space)s%(newline3)s'
+        '%(assignment)s%(client)s.%(function)s(%(newline)s%(method_arg)s'
+        '%(indent)s%(url)s%(newline2)s%(comma)s%(space)s%(newline3)s'
     ) % {
+        'assignment': _assignment,
+        'client': _client,
+        'function': _function,
+        'method_arg': _method_arg_render(
+            'GET', indent=indent, quote_char=quote_char, oneline=oneline,
+        ) if _method_arg else '',
         'url': (
             '{quote_char}{url}{quote_char}'.format(
                 url=url,
@@ -214,16 +297,24 @@ def get(
 
     response += '){separator}'.format(separator=';' if _oneline else '')
 
+    if stream_response:
+        response += _stream_response_render(
+            url, stream_response, indent=indent, quote_char=quote_char,
+            oneline=_oneline,
+        )
+
     if teardown:
         response += str(teardown)
     return response
 
 
+@declare_features(*FEATURES)
 def post(
     url, parameters=[], files={}, headers={}, indent=DEFAULT_INDENT,
     quote_char=DEFAULT_QUOTE_CHAR, setup=True, teardown=None,
     oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
-    **kwargs,
+    stream_response=False, _assignment='req = ', _client='requests',
+    _function='post', _method_arg=False, _text_kwarg='data', **kwargs,
 ):
     '''POST method code generator for Python requests library.'''
     # There are 4 possibilities of arguments build since we allow 4 forms
@@ -235,6 +326,17 @@ def post(
     #   - Content-Type: 'application/x-www-form-urlencoded' -> data={}
     #   - Content-Type: 'text/plain' -> data=''
     #   - Content-Type: 'application/json' -> json={}
+    spec = RequestSpec.from_arguments(
+        url, method='POST', parameters=parameters, headers=headers,
+        files=files, options=kwargs,
+    ).resolve(seed=seed, locale=locale)
+    url, parameters, files, headers, kwargs = (
+        spec.url, spec.parameters, spec.files, spec.headers, spec.options,
+    )
+    if stream_response:
+        kwargs = dict(kwargs, stream=True)
+    content_type = spec.content_type
+
     _oneline = oneline
     response = ''
 
@@ -255,16 +357,13 @@ def post(
             setup_length += len(response)
 
     # url length
-    url_length = len(url) + 22  # 'req = requests.post(' (20) + '' (2)
-
-    # headers length and content-type discovering
-    if files:
-        content_type = 'multipart/form-data'
-        _content_type_found = True
-    else:
-        content_type = 'application/x-www-form-urlencoded'
-        _content_type_found = False
+    # assignment + client + '.' + function + '(' + '' (2)
+    url_length = len(url) + len(_assignment) + len(_client) + \
+        len(_function) + 4
+    if _method_arg:
+        url_length += len(quote_char) * 2 + 6  # 'POST', (6)
 
+    # headers length
     headers_line_length = 0
     if headers:
         headers_keys = {} if not isinstance(headers, OrderedDict) \
@@ -277,22 +376,10 @@ def post(
             # 2 is ': '
             headers_line_length += \
                 len(quote_char) * 4 + 2 + len(escaped_key) + len(escaped_value)
-            if not _content_type_found:
-                _key_lower = str(key).lower()
-                if _key_lower == 'content-type':
-                    if 'text/plain' in value:
-                        content_type = 'text/plain'
-                        _content_type_found = True
-                    elif 'application/json' in value:
-                        content_type = 'application/json'
-                        _content_type_found = True
         headers_line_length += len(headers) - 1  # commas except last
         if kwargs:
             headers_line_length += 2  # ', '
 
-    if content_type == 'text/plain' and len(parameters) != 1:
-        raise_post_text_plain_n_parameters_not_1(len(parameters))
-
     # data/json length
     parameters_line_length = 0
     if parameters:
@@ -303,19 +390,16 @@ def post(
             'multipart/form-data': 0,                # files={}
             'application/json': 7,                   # json={}
             'application/x-www-form-urlencoded': 7,  # data={}
-        }.get(content_type, 5)  # (text/*)             data=
+        }.get(content_type, len(_text_kwarg) + 1)  # (text/*) data=
 
         for parameter in parameters:
             if content_type == 'text/plain':
                 name = ''
             else:
-                name = escape_by_quote(
-                    lazy_name_by_parameter(parameter, seed=seed),
-                    quote_char,
-                )
+                name = escape_by_quote(parameter['name'], quote_char)
 
             # JSON must accepts other data types than string
-            _param_value = parameter.get('value')
+            _param_value = parameter['value']
             if content_type == 'application/json' and isinstance(
                     _param_value, (int, float, bool),
             ):
@@ -323,15 +407,13 @@ def post(
                 parameters_line_length += len(name) + 4 + len(str(value))
             else:
                 if content_type == 'text/plain':
-                    _param_value_def_indent = indent + (' ' * 5)
+                    _param_value_def_indent = indent + (
+                        ' ' * (len(_text_kwarg) + 1)
+                    )
                 else:
                     _param_value_def_indent = indent + (' ' * (8 + len(name)))
                 value = str_definition(
-                    lazy_value_by_parameter(
-                        parameter,
-                        seed=seed,
-                        locale=locale,
-                    ),
+                    str(_param_value),
                     quote_char=quote_char,
                     indent=_param_value_def_indent,
                     wrap=wrap,
@@ -359,18 +441,7 @@ def post(
 
             files_keys[escaped_key] = []
 
-            if isinstance(value, str) or value is None:
-                # random filepath
-                if value is None:
-                    value = lazy_value_by_parameter(
-                        {
-                            'name': '',
-                            'faker': 'faker.providers.file::file_path',
-                        },
-                        seed=seed,
-                        locale=locale,
-                    )
-
+            if isinstance(value, str):
                 escaped_value = escape_by_quote(value, quote_char)
                 files_keys[escaped_key].append(escaped_value)
 
@@ -395,17 +466,6 @@ def post(
                     files_line_length += len(_escaped_value) + 4  # prev ', '
                     files_keys[escaped_key].insert(0, _escaped_value)
 
-                # random filepath
-                if value[0] is None:
-                    value = list(value)
-                    value[0] = lazy_value_by_parameter(
-                        {
-                            'name': '',
-                            'faker': 'faker.providers.file::file_path',
-                        },
-                        seed=seed,
-                        locale=locale,
-                    )
                 escaped_value = escape_by_quote(value[0], quote_char)
                 files_keys[escaped_key].insert(0, escaped_value)
 
@@ -456,9 +516,15 @@ def post(
 
     # url
     response += (
-        'req = requests.post(%(newline)s%(indent)s%(url)s%(newline2)s'
-        '%(comma)s%(space)s%(newline3)s'
+        '%(assignment)s%(client)s.%(function)s(%(newline)s%(method_arg)s'
+        '%(indent)s%(url)s%(newline2)s%(comma)s%(space)s%(newline3)s'
     ) % {
+        'assignment': _assignment,
+        'client': _client,
+        'function': _function,
+        'method_arg': _method_arg_render(
+            'POST', indent=indent, quote_char=quote_char, oneline=oneline,
+        ) if _method_arg else '',
         'url': (
             '{quote_char}{url}{quote_char}'.format(
                 url=url, quote_char=quote_char,
@@ -487,8 +553,10 @@ def post(
     if parameters:
         response += '{indent}{kwarg_name}='.format(
             indent=indent if not oneline else '',
-            kwarg_name='json' if content_type == 'application/json'
-            else 'data',
+            kwarg_name={
+                'application/json': 'json',
+                'text/plain': _text_kwarg,
+            }.get(content_type, 'data'),
         )
         if content_type == 'text/plain':
             response += '{value}{comma}{newline}'.format(
@@ -630,6 +698,170 @@ def post(
 
     response += '){separator}'.format(separator=';' if _oneline else '')
 
+    if stream_response:
+        response += _stream_response_render(
+            url, stream_response, indent=indent, quote_char=quote_char,
+            oneline=_oneline,
+        )
+
     if teardown:
         response += str(teardown)
     return response
+
+
+def session(
+    specs, pool_connections=None, pool_maxsize=None, indent=DEFAULT_INDENT,
+    quote_char=DEFAULT_QUOTE_CHAR, setup=True, teardown=None,
+    oneline=False, wrap=DEFAULT_WRAP, seed=None, locale=None,
+):
+    '''Renders a sequence of requests performed by the same
+    [``requests.Session``](https://requests.readthedocs.io/en/latest/user/advanced/#session-objects),
+    so the TCP and TLS connections to the same hosts are reused between
+    them instead of opening new ones for each request.
+
+    The headers defined with the same value in all the requests, except
+    ``Content-Type``, are hoisted to the session and only the rest are
+    passed to each request. If ``pool_connections`` or ``pool_maxsize`` are
+    defined, the session mounts an ``HTTPAdapter`` with these pool sizes
+    for HTTP and HTTPS URLs.
+
+    Args:
+        specs (list): Request specifications, as
+            [``RequestSpec``](/reference#requestspec) objects or
+            dictionaries with their arguments. Only GET and POST requests
+            are supported.
+        pool_connections (int): Number of connections pools cached by the
+            session adapter.
+        pool_maxsize (int): Maximum number of connections saved in each
+            pool of the session adapter.
+        indent (str): Indentation used in the snippet.
+        quote_char (str): Quotation character used for strings.
+        setup (bool, str): If ``True``, the modules used are imported at the
+            beginning of the snippet. If a string is passed, it replaces the
+            imports.
+        teardown (str): Code appended at the end of the snippet.
+        oneline (bool): Render the snippet in one line.
+        wrap (int): Maximum width of the lines of the snippet.
+        seed (int): Seed used randomizing the values of the requests. The
+            seed of each request is derived from it and their position in
+            the sequence.
+        locale (str): Locale used for ``faker`` providers.
+
+    Raises:
+        ValueError: No request specifications are passed or one of them
+            uses an HTTP method not supported.
+
+    Examples:
+        >>> print(session([{'url': 'http://localhost/login',
+        ...                 'method': 'POST',
+        ...                 'headers': {'User-Agent': 'foo'}},
+        ...                {'url': 'http://localhost/home',
+        ...                 'headers': {'User-Agent': 'foo'}}],
+        ...               pool_maxsize=4))
+        import requests
+        from requests.adapters import HTTPAdapter
+        <BLANKLINE>
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=4)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': 'foo'})
+        <BLANKLINE>
+        req = session.post('http://localhost/login')
+        req = session.get('http://localhost/home')
+
+    Returns:
+        str: Code snippet of the requests sequence.
+    '''
+    specs = [
+        spec if isinstance(spec, RequestSpec) else RequestSpec(**spec)
+        for spec in specs
+    ]
+    if not specs:
+        raise ValueError('At least one request specification must be passed')
+    for spec in specs:
+        if spec.method not in _FUNCS_BY_METHOD:
+            raise ValueError(
+                'HTTP %s method is not supported by requests sessions' % (
+                    spec.method
+                ),
+            )
+
+    session_headers = common_headers(specs)
+
+    separator = ';' if oneline else '\n'
+    pool_kwargs = OrderedDict(
+        (key, value) for key, value in (
+            ('pool_connections', pool_connections),
+            ('pool_maxsize', pool_maxsize),
+        ) if value is not None
+    )
+
+    response = ''
+
+    # initialization
+    if setup:
+        if isinstance(setup, str):
+            response += setup
+        else:
+            response += 'import requests%s' % separator
+            if pool_kwargs:
+                response += (
+                    'from requests.adapters import HTTPAdapter%s'
+                ) % separator
+            if not oneline:
+                response += '\n'
+
+    # session
+    response += 'session = requests.Session()%s' % separator
+    if pool_kwargs:
+        response += 'adapter = HTTPAdapter(%s)%s' % (
+            ', '.join(
+                '%s=%r' % (key, value) for key, value in pool_kwargs.items()
+            ),
+            separator,
+        )
+        for scheme in ('http', 'https'):
+            response += (
+                'session.mount(%(quote_char)s%(scheme)s://%(quote_char)s,'
+                ' adapter)%(separator)s'
+            ) % {
+                'quote_char': quote_char,
+                'scheme': scheme,
+                'separator': separator,
+            }
+    if session_headers:
+        headers_definition = dict_definition(
+            session_headers, indent='', quote_char=quote_char, newline='',
+        )
+        if not oneline and len(headers_definition) + 24 > wrap:
+            # 'session.headers.update(' (23) + ')' (1)
+            headers_definition = dict_definition(
+                session_headers, indent=indent, quote_char=quote_char,
+                wrap=wrap,
+            )
+        response += 'session.headers.update(%s)%s' % (
+            headers_definition, separator,
+        )
+    if not oneline:
+        response += '\n'
+
+    # requests
+    for i, spec in enumerate(specs):
+        if session_headers:
+            spec = spec.without_headers(session_headers)
+        _seed = None if seed is None else derive_seed(seed, i)
+        response += _FUNCS_BY_METHOD[spec.method](
+            spec.resolve(seed=_seed, locale=locale), indent=indent,
+            quote_char=quote_char, setup=False, oneline=oneline,
+            wrap=wrap, seed=_seed, locale=locale, _client='session',
+        )
+        if not oneline and i < len(specs) - 1:
+            response += '\n'
+
+    if teardown:
+        response += str(teardown)
+    return response
+
+
+_FUNCS_BY_METHOD = {'GET': get, 'POST': post}
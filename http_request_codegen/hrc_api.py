@@ -1,10 +1,49 @@
 '''http-request-codegen public API.'''
 
+import collections
+import importlib
+import inspect
+import io
+import itertools
+import os
+
 from http_request_codegen.hrc_factory import (
     DEFAULT_LANGUAGE,
     get_func_by_lang_impl_method,
+    get_generators_modules_by_lang_impl,
 )
-from http_request_codegen.hrc_string import lazy_string
+from http_request_codegen.hrc_random import derive_seed
+from http_request_codegen.hrc_spec import RequestSpec
+from http_request_codegen.hrc_valuer import _faker_by_locale
+
+
+def _compile_request(
+    url='http://localhost', method='GET', parameters=[], headers={},
+    files={}, indent=None, quote_char='\'', setup=None, teardown=None,
+    oneline=False, seed=None, locale=None, wrap=80, stream_response=False,
+    **kwargs,
+):
+    # Builds the resolved request specification, which is the intermediate
+    # representation rendered by the generators, and the keyword arguments
+    # that define how it is rendered
+    if not isinstance(url, RequestSpec):
+        url = RequestSpec(
+            method=method, url=url, parameters=parameters, headers=headers,
+            files=files if method.upper() == 'POST' else {}, **kwargs,
+        )
+    render_kwargs = {
+        'oneline': oneline, 'seed': seed, 'locale': locale,
+        'teardown': teardown, 'wrap': wrap or float('inf'),
+    }
+    if indent is not None:
+        render_kwargs['indent'] = indent
+    if quote_char is not None:
+        render_kwargs['quote_char'] = quote_char
+    if setup is not None:
+        render_kwargs['setup'] = setup
+    if stream_response:
+        render_kwargs['stream_response'] = stream_response
+    return url.resolve(seed=seed, locale=locale), render_kwargs
 
 
 def generate_http_request_code(
@@ -12,8 +51,8 @@ def generate_http_request_code(
     url='http://localhost', parameters=[],
     headers={}, files={}, indent=None,
     quote_char='\'', setup=None, teardown=None,
-    oneline=False, seed=None, locale=None, wrap=80,
-    **kwargs,
+    oneline=False, seed=None, locale=None, wrap=80, stream_response=False,
+    cache=None, **kwargs,
 ):
     '''Generates a code snippet of an HTTP request for a library of a given
     programming language or a CLI of a program, based on a valid HTTP method
@@ -49,7 +88,8 @@ def generate_http_request_code(
             library, a program, or a language API. See [Support](/#support)
             to check the supported implementations by language.
         method (str): HTTP method of the generated request.
-        url (str, iterable, callable): URL endpoint of the generated request.
+        url (str, iterable, callable, RequestSpec): URL endpoint of the
+            generated request.
 
             - Defined as a string, the url will be the string itself.
             - Defined as an iterable, the url will be selected randomly
@@ -58,6 +98,10 @@ def generate_http_request_code(
             - Defined as a callable, the url will be the returned value of
             the callable. Supports recursivity: until a string is returned the
             recursion will not be stopped.
+            - Defined as a [``RequestSpec``](#requestspec), the compiled
+            specification will be rendered and the ``method``,
+            ``parameters``, ``headers``, ``files`` and extra keyword
+            arguments will be ignored.
         headers (dict): Mapping of request header names and values.
         parameters (list): List of parameters for the request. Each parameter
             must be a dictionary. This dictionary defines, for each parameter,
@@ -91,8 +135,7 @@ def generate_http_request_code(
             - **type** (*str*, *iterable*, *callable*): Parameter data type.
                 If not defined and ``value``, ``values`` and ``faker`` are not
                 defined, will be considered as a string and the value of the
-                parameter will be a random word built using [faker](
-                https://faker.readthedocs.io) library. For some types, other
+                parameter will be a random word. For some types, other
                 parameter dictionary attributes are supported, documented, if
                 so, in each type. The following parameter data types are
                 supported as attributes of parameters dictionaries, as well as
@@ -100,7 +143,9 @@ def generate_http_request_code(
 
                 - ``'str'``: Basic string type. Can be defined with the Python
                     builtin type ``str`` or the strings ``'str'`` and
-                    ``'string'``.
+                    ``'string'``. Returns a random english word or, if
+                    ``locale`` is defined, a random word built using
+                    [faker](https://faker.readthedocs.io) library.
                 - ``'int'``: Basic integer type. Can be defined with the Python
                     builtin type ``int``, or the strings ``'int'`` and
                     ``'integer'``. As default will be an integer in the range
@@ -138,8 +183,7 @@ def generate_http_request_code(
 
             - **value** (*str*, *iterable*, *callable*): Parameter value. If
                 not defined and ``type``, ``values`` and ``faker`` are not
-                defined, the value of the parameter will be a random word built
-                using faker library.
+                defined, the value of the parameter will be a random word.
                 - Defined as a string, the value will be the string itself.
                 - Defined as an iterable, the value will be selected
                 randomly from the iterable. Supports recursivity: until a
@@ -206,6 +250,17 @@ def generate_http_request_code(
             multiples code snippets.
         locale (str): Locale used by [faker](https://faker.readthedocs.io)
             library to localize the faked random values for parameters.
+        stream_response (bool, str): Render the code consuming the response
+            in chunks as they are received, writing them to a file, instead
+            of reading the whole response in memory. If a string is passed,
+            it will be the path of the file. Otherwise, the file will be
+            named as the last segment of the path of the URL. See
+            [Support](/#support) to check the implementations that support
+            it.
+        cache (RenderCache): Cache where the rendered snippet is stored and
+            retrieved from if the same snippet is generated again. Snippets
+            with random values that are not seeded are never cached. See
+            [``RenderCache``](#rendercache).
 
     Raises:
         ValueError: Value is not a valid value in their context.
@@ -216,25 +271,360 @@ def generate_http_request_code(
     Returns:
         str: HTTP request code snippet.
     '''
-    _function_kwargs = {
-        'parameters': parameters, 'headers': headers,
-        'oneline': oneline, 'seed': seed, 'locale': locale,
-        'teardown': teardown, 'wrap': wrap or float('inf'),
-    }
-    if indent is not None:
-        _function_kwargs['indent'] = indent
-    if quote_char is not None:
-        _function_kwargs['quote_char'] = quote_char
-    if method.lower() == 'post':
-        _function_kwargs['files'] = files
-    if setup is not None:
-        _function_kwargs['setup'] = setup
-    kwargs.update(_function_kwargs)
-    return get_func_by_lang_impl_method(
-        language=language.lower() if language else language,
-        impl=impl,
-        method=method,
-    )(lazy_string(url), **kwargs)
+    arguments = dict(
+        language=language, impl=impl, method=method, url=url,
+        parameters=parameters, headers=headers, files=files, indent=indent,
+        quote_char=quote_char, setup=setup, teardown=teardown,
+        oneline=oneline, seed=seed, locale=locale, wrap=wrap,
+        stream_response=stream_response, **kwargs,
+    )
+    if cache is not None:
+        return cache.render(arguments, lambda: _render({}, **arguments))
+    return _render({}, **arguments)
+
+
+_GENERATE_DEFAULTS = {
+    name: parameter.default for name, parameter in inspect.signature(
+        generate_http_request_code,
+    ).parameters.items()
+    if parameter.default is not inspect.Parameter.empty and name != 'cache'
+}
+
+
+def _render(funcs, language=None, impl=None, **arguments):
+    # Renders a snippet, storing the generator functions in ``funcs`` by
+    # language, implementation and method to not resolve them again
+    spec, render_kwargs = _compile_request(**arguments)
+
+    func_key = (language, impl, spec.method)
+    try:
+        func = funcs[func_key]
+    except KeyError:
+        func = get_func_by_lang_impl_method(
+            language=language.lower() if language else language,
+            impl=impl,
+            method=spec.method,
+        )
+        funcs[func_key] = func
+    return func(spec, **render_kwargs)
+
+
+def _render_specs(specs, defaults, return_exceptions=False):
+    # Renders the specifications of a batch resolving the generator
+    # functions only once for each language, implementation and method
+    funcs = {}
+    for spec in specs:
+        arguments = defaults.copy()
+        arguments.update(spec)
+
+        cache = arguments.pop('cache', None)
+        try:
+            if cache is None:
+                code = _render(funcs, **arguments)
+            else:
+                arguments = dict(_GENERATE_DEFAULTS, **arguments)
+                code = cache.render(
+                    arguments, lambda: _render(funcs, **arguments),
+                )
+        except Exception as err:
+            if not return_exceptions:
+                raise
+            code = err
+        yield code
+
+
+def _render_specs_chunk(specs, defaults, return_exceptions=False):
+    return list(
+        _render_specs(specs, defaults, return_exceptions=return_exceptions),
+    )
+
+
+def _warm_worker():
+    # Imports all the generators and builds the default Faker instance
+    # once in each worker process, before rendering any chunk
+    for impls in get_generators_modules_by_lang_impl().values():
+        for modpath in impls.values():
+            importlib.import_module(modpath)
+    _faker_by_locale()
+
+
+def _chunked(iterable, chunksize):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _seeded_specs(specs, base_seed):
+    # the seeds are derived from the base seed and the position of the
+    # specifications in the batch, starting at 0
+    for index, spec in enumerate(specs):
+        if 'seed' not in spec:
+            spec = dict(spec)
+            spec['seed'] = derive_seed(base_seed, index)
+        yield spec
+
+
+def _generate_http_request_codes(
+    specs, jobs, chunksize, return_exceptions, kwargs,
+):
+    # generator of the snippets, separated from the public function so their
+    # arguments are validated when it's called, not when it's iterated
+    if jobs == 1:
+        yield from _render_specs(
+            specs, kwargs, return_exceptions=return_exceptions,
+        )
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    max_pending = 2 * (jobs or os.cpu_count() or 1)
+    pending = collections.deque()
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_warm_worker,
+    ) as executor:
+        for chunk in _chunked(specs, chunksize):
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(
+                _render_specs_chunk, chunk, kwargs,
+                return_exceptions=return_exceptions,
+            ))
+        while pending:
+            yield from pending.popleft().result()
+
+
+def generate_http_request_codes(
+    specs, jobs=1, chunksize=256, base_seed=None, return_exceptions=False,
+    **kwargs,
+):
+    '''Generates code snippets for multiple HTTP requests in one call.
+
+    Generator functions are resolved only once for each language,
+    implementation and method combination found in the batch, so this is
+    faster than calling
+    [``generate_http_request_code``](#generate_http_request_code) in a loop
+    when lots of snippets must be rendered.
+
+    Large batches can be rendered in parallel by multiple processes using
+    the ``jobs`` argument. In that case, the specifications are dispatched
+    to the processes in chunks, so they and their arguments must be
+    picklable (for example, lambdas can't be used as values), but the
+    snippets are yielded in the same order. No more than two chunks by
+    process are dispatched before their snippets are consumed, so the
+    memory used doesn't depend on the size of the batch.
+
+    Args:
+        specs (iterable): Iterable of dictionaries, each one defining the
+            arguments accepted by
+            [``generate_http_request_code``](#generate_http_request_code)
+            for a request.
+        jobs (int): Number of processes used to render the snippets. If
+            ``1``, the snippets are rendered in the current process and if
+            ``None``, as many processes as processors in the machine are
+            used.
+        chunksize (int): Number of specifications sent to a process at once
+            when rendering in parallel.
+        base_seed (int): If defined, the seed of each specification that
+            does not define their own ``seed`` is derived from this one and
+            their position in the batch, starting at 0, using
+            ``hrc_random.derive_seed``. This produces always the same
+            snippets no matter the number of processes used.
+        return_exceptions (bool): If ``True``, the exceptions raised
+            rendering a specification are yielded in place of their
+            snippet, so they don't stop the rendering of the batch.
+        **kwargs: Default arguments for all the requests of the batch. The
+            arguments defined in each specification take precedence over
+            them. A [``RenderCache``](#rendercache) can be passed as
+            ``cache`` to reuse the snippets already rendered.
+
+    Raises:
+        ValueError: ``jobs`` or ``chunksize`` are lower than 1, or a
+            ``cache`` is passed rendering in multiple processes. These are
+            raised calling the function, before the snippets are iterated.
+
+    Examples:
+        >>> codes = generate_http_request_codes(
+        ...     [{'url': 'http://localhost'}, {'url': 'http://127.0.0.1'}],
+        ...     setup=False,
+        ... )
+        >>> for code in codes:
+        ...     print(code)
+        req = requests.get('http://localhost')
+        req = requests.get('http://127.0.0.1')
+
+    Returns:
+        generator: HTTP request code snippet for each specification, in the
+            same order that the specifications were passed.
+    '''
+    if jobs is not None and jobs < 1:
+        raise ValueError('The number of jobs must be greater than 0')
+    if chunksize < 1:
+        raise ValueError('The chunk size must be greater than 0')
+    if jobs != 1 and kwargs.get('cache') is not None:
+        raise ValueError(
+            'Render caches can\'t be used rendering in multiple processes',
+        )
+
+    if base_seed is not None:
+        specs = _seeded_specs(specs, base_seed)
+    return _generate_http_request_codes(
+        specs, jobs, chunksize, return_exceptions, kwargs,
+    )
+
+
+def generate_http_request_codes_by_targets(
+    targets, method='GET', url='http://localhost', parameters=[],
+    files={}, seed=None, locale=None, cache=None, **kwargs,
+):
+    '''Generates code snippets of the same HTTP request for multiple
+    languages and implementations.
+
+    The request is compiled into a [``RequestSpec``](#requestspec) and their
+    URL, the names and values of the parameters and the random filepaths of
+    the files are resolved only once, so all the snippets render the same
+    values without the need of reseeding the generation for each target.
+
+    Args:
+        targets (iterable): Iterable of ``(language, impl)`` tuples for which
+            the snippets will be generated. Optionally, a dictionary with
+            rendering arguments for the target (like ``setup`` or
+            ``indent``) can be included as third element of the tuple, which
+            take precedence over the arguments of the function.
+        method (str): HTTP method of the generated request.
+        url (str, iterable, callable): URL endpoint of the generated request.
+        parameters (list): List of parameters for the request.
+        files (dict): Mapping of files to send to URL.
+        seed (int): Seed used generating random fake values of parameters.
+        locale (str): Locale used by [faker](https://faker.readthedocs.io)
+            library to localize the faked random values for parameters.
+        cache (RenderCache): Cache where the rendered snippets are stored
+            and retrieved from. See [``RenderCache``](#rendercache).
+        **kwargs: All other optional arguments are passed to
+            [``generate_http_request_code``](#generate_http_request_code)
+            function for each target.
+
+    Examples:
+        >>> codes = generate_http_request_codes_by_targets(
+        ...     [('python', 'requests'), ('bash', 'curl')],
+        ...     parameters=[{'name': 'foo', 'values': ['bar', 'baz']}],
+        ...     setup=False,
+        ... )
+        >>> ("'foo': 'bar'" in codes[0]) == ('foo=bar' in codes[1])
+        True
+
+    Returns:
+        list: HTTP request code snippets, in the same order that the targets
+            were passed.
+    '''
+    request, render_kwargs = _compile_request(
+        url=url, method=method, parameters=parameters, files=files,
+        seed=seed, locale=locale, **kwargs,
+    )
+    render_kwargs['url'] = request
+    if cache is not None:
+        render_kwargs['cache'] = cache
+
+    specs = []
+    for target in targets:
+        spec = {'language': target[0], 'impl': target[1]}
+        if len(target) > 2:
+            spec.update(target[2])
+        specs.append(spec)
+    return list(generate_http_request_codes(specs, **render_kwargs))
+
+
+def _text_writer(fp, encoding='utf-8'):
+    # returns a function that writes text to a text or binary writer
+    if isinstance(fp, io.TextIOBase):
+        return fp.write
+    elif isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or \
+            'b' in getattr(fp, 'mode', ''):
+        return lambda text: fp.write(text.encode(encoding))
+    return fp.write
+
+
+def _languages_recorder(specs, defaults, languages):
+    # stores the language of each specification when is consumed, so it can
+    # be retrieved in order when their snippet is rendered
+    default_language = defaults.get('language') or DEFAULT_LANGUAGE
+    for spec in specs:
+        languages.append(spec.get('language') or default_language)
+        yield spec
+
+
+def render_to(
+    fp, specs=None, end='\n', fence_string=None, encoding='utf-8', **kwargs,
+):
+    '''Renders HTTP request code snippets writing them into a file-like
+    object, so they are not joined in a string before being written.
+
+    The snippets are written one by one as they are rendered, so it's
+    possible to write big batches of snippets into files or sockets keeping
+    only one snippet in memory, or a few chunks of them rendering in
+    multiple processes. Each snippet is still built as a string by their
+    generator before being written.
+
+    Args:
+        fp (file-like): Text or binary writer where the snippets will be
+            written. Writers opened in binary mode receive the snippets
+            encoded using ``encoding``.
+        specs (iterable): Iterable of dictionaries, each one defining the
+            arguments for a request as
+            [``generate_http_request_codes``](#generate_http_request_codes)
+            does. If not defined, only one snippet is rendered using the
+            arguments passed as ``**kwargs``.
+        end (str): String written after each snippet.
+        fence_string (str): If defined, each snippet is wrapped in a
+            Markdown fenced code block using this fence.
+        encoding (str): Encoding used writing into binary writers.
+        **kwargs: Arguments passed to
+            [``generate_http_request_code``](#generate_http_request_code) or,
+            if ``specs`` is defined, to
+            [``generate_http_request_codes``](#generate_http_request_codes).
+
+    Examples:
+        >>> import io
+        >>> fp = io.StringIO()
+        >>> render_to(fp, [{'url': 'http://localhost'},
+        ...                {'url': 'http://127.0.0.1', 'language': 'bash'}],
+        ...           setup=False)
+        2
+        >>> print(fp.getvalue(), end='')
+        req = requests.get('http://localhost')
+        curl http://127.0.0.1
+
+    Returns:
+        int: Number of snippets written.
+    '''
+    write = _text_writer(fp, encoding=encoding)
+    languages = collections.deque()
+    if specs is None:
+        languages.append(kwargs.get('language') or DEFAULT_LANGUAGE)
+        codes = (generate_http_request_code(**kwargs),)
+    else:
+        codes = generate_http_request_codes(
+            _languages_recorder(specs, kwargs, languages), **kwargs,
+        )
+
+    n_codes = 0
+    for code in codes:
+        language = languages.popleft()
+        if fence_string is not None:
+            write(fence_string)
+            write(language)
+            write('\n')
+            write(code)
+            write('\n')
+            write(fence_string)
+        else:
+            write(code)
+        if end:
+            write(end)
+        n_codes += 1
+    return n_codes
 
 
 def generate_http_request_md_fenced_code_block(
@@ -245,6 +635,11 @@ def generate_http_request_md_fenced_code_block(
     """Wraps [``generate_http_request_code``](#generate_http_request_code)
     function result in a Markdown fenced code block.
 
+    The block is returned as a string formatted directly, because it's built
+    from only one snippet. To write fenced code blocks into a file without
+    joining them in a string, use [``render_to``](#render_to) with the
+    ``fence_string`` argument, which renders the same blocks.
+
     Args:
         fence_string (str): Code block fence string used wrapping the code.
             It does not perform any check about if the fenced string is a
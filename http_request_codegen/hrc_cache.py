@@ -0,0 +1,501 @@
+'''Rendered code snippets caching.'''
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Iterable, Mapping
+from types import GeneratorType
+
+from http_request_codegen.hrc_meta import CallableTypes
+from http_request_codegen.hrc_spec import RequestSpec
+
+
+CacheInfo = namedtuple(
+    'CacheInfo',
+    (
+        'hits', 'misses', 'bypasses', 'maxsize', 'maxbytes',
+        'currsize', 'currbytes',
+    ),
+)
+
+
+class Uncacheable(Exception):
+    '''Raised building the fingerprint of a value that can't be identified
+    in a stable way, like generators, which can be consumed only once.
+    '''
+
+
+_SCALAR_TYPES = frozenset({bool, int, float, type(None)})
+
+
+def _canonical(value):
+    # Builds a representation of a value which is stable between
+    # executions and processes, so it can be hashed to fingerprint it
+    _type = type(value)
+    if _type is str:
+        return value
+    elif _type in _SCALAR_TYPES:
+        # ``True``, ``1`` and ``1.0`` are equal but rendered different
+        return (_type.__name__, value)
+    elif _type is dict:
+        # the order of the items is preserved because it's rendered
+        return ('mapping',) + tuple(
+            (_canonical(key), _canonical(val)) for key, val in value.items()
+        )
+    elif _type is list or _type is tuple:
+        return (_type.__name__,) + tuple(_canonical(val) for val in value)
+    elif isinstance(value, (str, bool, int, float)):
+        # subclasses of builtin types, like enumerations
+        return (_type.__module__, _type.__qualname__, str(value))
+    elif isinstance(value, RequestSpec):
+        return (
+            'RequestSpec', value.method, _canonical(value.url),
+            _canonical(value.parameters), _canonical(value.headers),
+            _canonical(value.files), _canonical(value.options),
+            value.resolved,
+        )
+    elif isinstance(value, Mapping):
+        return ('mapping',) + tuple(
+            (_canonical(key), _canonical(val)) for key, val in value.items()
+        )
+    elif isinstance(value, CallableTypes) or isinstance(value, type):
+        func = getattr(value, '__func__', value)
+        if getattr(func, '__closure__', None) or \
+                getattr(func, '__defaults__', None) or \
+                getattr(func, '__kwdefaults__', None):
+            # captured and default values can differ between functions with
+            # the same definition, like closures built by the same factory
+            raise Uncacheable(
+                'Callables with captured or default values can\'t be'
+                ' fingerprinted',
+            )
+        if not isinstance(getattr(value, '__self__', type), type):
+            raise Uncacheable(
+                'Methods bound to instances can\'t be fingerprinted',
+            )
+        code = getattr(value, '__code__', None)
+        return (
+            'callable', value.__module__, value.__qualname__,
+            # lambdas of the same scope share their qualified name
+            code.co_firstlineno if code is not None else None,
+        )
+    elif isinstance(value, GeneratorType):
+        raise Uncacheable('Generators can\'t be fingerprinted')
+    elif isinstance(value, (set, frozenset)):
+        return ('set',) + tuple(
+            sorted((_canonical(val) for val in value), key=repr),
+        )
+    elif isinstance(value, Iterable):
+        return (value.__class__.__name__,) + tuple(
+            _canonical(val) for val in value
+        )
+    raise Uncacheable(
+        'Values of type \'%s\' can\'t be fingerprinted' % (
+            type(value).__name__
+        ),
+    )
+
+
+def _request_key(arguments):
+    return tuple(
+        (key, _canonical(arguments[key])) for key in sorted(arguments)
+    )
+
+
+def request_fingerprint(arguments):
+    '''Builds a fingerprint of the arguments of a code snippet generation.
+    The fingerprint is stable between executions and processes, so it can
+    be used as key for persistent caches. Callables are identified by their
+    module, qualified name and the line where they are defined, so closures,
+    functions with default values and methods bound to instances can't be
+    fingerprinted.
+
+    Args:
+        arguments (dict): Arguments accepted by
+            [``generate_http_request_code``](#generate_http_request_code).
+
+    Raises:
+        Uncacheable: some of the arguments can't be identified in a stable
+            way, like generators.
+
+    Examples:
+        >>> request_fingerprint({'url': 'http://localhost', 'seed': 5}) == \\
+        ...     request_fingerprint({'seed': 5, 'url': 'http://localhost'})
+        True
+        >>> request_fingerprint({'seed': 5}) == request_fingerprint(
+        ...     {'seed': 6})
+        False
+
+    Returns:
+        str: Hexadecimal SHA-256 digest of the arguments.
+    '''
+    return hashlib.sha256(
+        repr(_request_key(arguments)).encode('utf-8'),
+    ).hexdigest()
+
+
+def _is_random_string(value):
+    return not isinstance(value, (str, bool, int, float))
+
+
+def _has_callables(value, paths=False):
+    # generators are not inspected because they would be consumed, but
+    # they can't be fingerprinted anyway
+    if isinstance(value, str):
+        return paths and '::' in value
+    elif isinstance(value, CallableTypes):
+        return True
+    elif isinstance(value, Iterable) and \
+            not isinstance(value, GeneratorType):
+        return any(_has_callables(val, paths=paths) for val in value)
+    return False
+
+
+def has_unseeded_random(arguments):
+    '''Discovers if a code snippet generation includes random values that are
+    not seeded, so each generation can produce a different snippet. These
+    are URLs, parameters names and values defined as iterables or
+    callables, parameters values defined by types or ``faker`` providers and
+    files whose filepaths are not defined.
+
+    The seed is not applied to the random generators used by the callables
+    of URLs and parameters names and values, or by the objects of their
+    paths, so generations that include them are considered not seeded even
+    if a seed is passed.
+
+    Args:
+        arguments (dict): Arguments accepted by
+            [``generate_http_request_code``](#generate_http_request_code).
+
+    Examples:
+        >>> has_unseeded_random({'parameters': [{'name': 'foo',
+        ...                                      'value': 'bar'}]})
+        False
+        >>> has_unseeded_random({'parameters': [{'name': 'foo',
+        ...                                      'type': 'int'}]})
+        True
+        >>> has_unseeded_random({'parameters': [{'name': 'foo',
+        ...                                      'type': 'int'}],
+        ...                      'seed': 5})
+        False
+        >>> has_unseeded_random({'url': lambda: 'http://localhost',
+        ...                      'seed': 5})
+        True
+
+    Returns:
+        bool: If the generation has unseeded random values.
+    '''
+    url = arguments.get('url', 'http://localhost')
+    if isinstance(url, RequestSpec):
+        if url.resolved:
+            return False
+        parameters, files = url.parameters, url.files
+        url = url.url
+    else:
+        parameters = arguments.get('parameters', [])
+        files = arguments.get('files', {})
+
+    if _has_callables(url):
+        return True
+    for parameter in parameters:
+        for key in ('name', 'names', 'value', 'values'):
+            if _has_callables(
+                parameter.get(key, ''), paths=key in ('names', 'values'),
+            ):
+                return True
+
+    if arguments.get('seed') is not None:
+        return False
+
+    if _is_random_string(url):
+        return True
+    for parameter in parameters:
+        if 'names' in parameter or 'value' not in parameter:
+            return True
+        if _is_random_string(parameter.get('name', '')) or \
+                _is_random_string(parameter['value']):
+            return True
+    for value in files.values():
+        if value is None or (not isinstance(value, str) and value[0] is None):
+            return True
+    return False
+
+
+class RenderCache:
+    '''Least recently used cache of rendered code snippets.
+
+    Passed as ``cache`` argument to
+    [``generate_http_request_code``](#generate_http_request_code) or
+    [``generate_http_request_codes``](#generate_http_request_codes), the
+    snippets are stored by the fingerprint of their arguments (see
+    ``request_fingerprint``) and returned without rendering them again.
+    Generations with random values that are not seeded and generations
+    whose arguments can't be fingerprinted bypass the cache. It's safe to
+    use the same cache from multiple threads.
+
+    Args:
+        maxsize (int): Maximum number of snippets stored. If ``None``, the
+            number of snippets is not limited.
+        maxbytes (int): Maximum size of the snippets stored, in bytes of
+            their UTF-8 encoded content. If ``None``, the size is not
+            limited. Snippets bigger than this size are not stored.
+
+    Examples:
+        >>> from http_request_codegen import generate_http_request_code
+        >>> cache = RenderCache(maxsize=32)
+        >>> code = generate_http_request_code(cache=cache)
+        >>> code = generate_http_request_code(cache=cache)
+        >>> info = cache.cache_info()
+        >>> info.hits, info.misses, info.currsize
+        (1, 1, 1)
+    '''
+
+    def __init__(self, maxsize=1024, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def render(self, arguments, render_func):
+        '''Returns the code snippet for the arguments of a generation from the
+        cache, rendering and storing it if it's not cached.
+
+        Args:
+            arguments (dict): Arguments of the generation.
+            render_func (function): Function called without arguments to
+                render the snippet if it isn't cached.
+
+        Returns:
+            str: Code snippet.
+        '''
+        try:
+            if has_unseeded_random(arguments):
+                raise Uncacheable('Unseeded random values')
+            key = self._key(arguments)
+        except Uncacheable:
+            with self._lock:
+                self.bypasses += 1
+            return render_func()
+
+        code = self._lookup(key)
+        with self._lock:
+            if code is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if code is None:
+            code = render_func()
+            self._store(key, code)
+        return code
+
+    def _key(self, arguments):
+        # the fingerprint is not hashed, as it's only used in this process
+        return _request_key(arguments)
+
+    def _lookup(self, key):
+        with self._lock:
+            try:
+                code = self._entries[key][0]
+            except KeyError:
+                return None
+            self._entries.move_to_end(key)
+            return code
+
+    def _store(self, key, code):
+        size = len(code.encode('utf-8'))
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (code, size)
+            self._bytes += size
+            while self._entries and (
+                (self.maxsize is not None and
+                 len(self._entries) > self.maxsize) or
+                (self.maxbytes is not None and self._bytes > self.maxbytes)
+            ):
+                _, (_, _size) = self._entries.popitem(last=False)
+                self._bytes -= _size
+
+    def cache_info(self):
+        '''Returns the statistics of the cache.
+
+        Returns:
+            CacheInfo: Named tuple with the number of ``hits``, ``misses``
+                and ``bypasses`` of the cache, their limits (``maxsize`` and
+                ``maxbytes``) and their current number of snippets and size
+                (``currsize`` and ``currbytes``).
+        '''
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.bypasses, self.maxsize,
+                self.maxbytes, len(self._entries), self._bytes,
+            )
+
+    def clear(self):
+        '''Removes all the snippets of the cache and resets their
+        statistics.
+        '''
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.bypasses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskRenderCache(RenderCache):
+    '''Persistent cache of rendered code snippets stored in a SQLite
+    database, useful to not render again the same snippets between
+    executions, like documentation builds.
+
+    Works like [``RenderCache``](#rendercache), but the snippets are stored
+    by the SHA-256 fingerprint of their arguments (see
+    ``request_fingerprint``) and the version of http-request-codegen which
+    rendered them, so the snippets are rendered again after upgrading it.
+    The snippets rendered by other versions are removed opening the cache
+    and the snippets not used since it was opened can be removed calling
+    ``prune``. The number and size of the snippets stored is not limited.
+
+    Args:
+        path (str): Path to the SQLite database file. Their directory is
+            created if doesn't exist.
+        version (str): Version of the snippets. If not defined, the version
+            of http-request-codegen is used.
+
+    Examples:
+        >>> import os, tempfile
+        >>> from http_request_codegen import generate_http_request_code
+        >>> tempdir = tempfile.TemporaryDirectory()
+        >>> path = os.path.join(tempdir.name, 'snippets.sqlite')
+        >>> with DiskRenderCache(path) as cache:
+        ...     code = generate_http_request_code(cache=cache)
+        >>> with DiskRenderCache(path) as cache:
+        ...     code = generate_http_request_code(cache=cache)
+        ...     cache.cache_info().hits
+        1
+        >>> tempdir.cleanup()
+    '''
+
+    def __init__(self, path, version=None):
+        if version is None:
+            from http_request_codegen import __version__ as version
+        self.path = path
+        self.version = version
+        self.maxsize = None
+        self.maxbytes = None
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self._lock = threading.Lock()
+        # fingerprints of the snippets retrieved or stored, kept by ``prune``
+        self._used = set()
+
+        dirpath = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(dirpath):
+            os.makedirs(dirpath)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS snippets (fingerprint TEXT,'
+                ' version TEXT, code TEXT,'
+                ' PRIMARY KEY (fingerprint, version))',
+            )
+            self._connection.execute(
+                'DELETE FROM snippets WHERE version != ?', (self.version,),
+            )
+
+    def _key(self, arguments):
+        return request_fingerprint(arguments)
+
+    def _lookup(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT code FROM snippets WHERE fingerprint = ?'
+                ' AND version = ?', (key, self.version),
+            ).fetchone()
+            if row is None:
+                return None
+            self._used.add(key)
+            return row[0]
+
+    def _store(self, key, code):
+        with self._lock, self._connection:
+            self._used.add(key)
+            self._connection.execute(
+                'INSERT OR IGNORE INTO snippets VALUES (?, ?, ?)',
+                (key, self.version, code),
+            )
+
+    def cache_info(self):
+        '''Returns the statistics of the cache.
+
+        Returns:
+            CacheInfo: Named tuple with the number of ``hits``, ``misses``
+                and ``bypasses`` of the cache in this execution, their limits
+                (always ``None``) and their current number of snippets and
+                size (``currsize`` and ``currbytes``).
+        '''
+        with self._lock:
+            currsize, currbytes = self._connection.execute(
+                'SELECT COUNT(*), SUM(LENGTH(CAST(code AS BLOB)))'
+                ' FROM snippets',
+            ).fetchone()
+            return CacheInfo(
+                self.hits, self.misses, self.bypasses, self.maxsize,
+                self.maxbytes, currsize, currbytes or 0,
+            )
+
+    def clear(self):
+        '''Removes all the snippets of the cache and resets their
+        statistics.
+        '''
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM snippets')
+            self._used.clear()
+            self.hits = self.misses = self.bypasses = 0
+
+    def prune(self):
+        '''Removes the snippets that have not been retrieved nor stored since
+        the cache was opened, like the snippets of documentation pages that
+        have been changed or removed.
+
+        Returns:
+            int: Number of snippets removed.
+        '''
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TEMP TABLE IF NOT EXISTS used_snippets'
+                ' (fingerprint TEXT PRIMARY KEY)',
+            )
+            self._connection.execute('DELETE FROM used_snippets')
+            self._connection.executemany(
+                'INSERT INTO used_snippets VALUES (?)',
+                ((key,) for key in self._used),
+            )
+            return self._connection.execute(
+                'DELETE FROM snippets WHERE fingerprint NOT IN'
+                ' (SELECT fingerprint FROM used_snippets)',
+            ).rowcount
+
+    def close(self):
+        '''Closes the connection to the database.'''
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.cache_info().currsize
@@ -0,0 +1,196 @@
+'''http-request-codegen command line interface.'''
+
+import argparse
+import collections
+import json
+import sys
+
+from http_request_codegen import __version__
+from http_request_codegen.hrc_api import generate_http_request_codes
+from http_request_codegen.hrc_random import derive_seed
+
+
+DESCRIPTION = (
+    'Generates HTTP request code snippets in bulk. Reads the specifications'
+    ' of the requests as JSON lines, each one an object with the arguments'
+    ' of \'generate_http_request_code\', and writes a JSON line for each'
+    ' one with their snippet (\'code\') or the error raised rendering it'
+    ' (\'error\'), in the same order.'
+)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='http-request-codegen', description=DESCRIPTION,
+    )
+    parser.add_argument(
+        '-v', '--version', action='version',
+        version='%(prog)s ' + __version__,
+        help='Show program version number and exit.',
+    )
+    parser.add_argument(
+        'input', nargs='?', default='-',
+        help='JSON lines file with the requests specifications. If not'
+             ' defined or \'-\', they are read from the standard input.',
+        metavar='INPUT',
+    )
+    parser.add_argument(
+        '-o', '--output', dest='output', default='-',
+        help='File where the results will be written as JSON lines. If not'
+             ' defined or \'-\', they are written to the standard output.',
+        metavar='OUTPUT',
+    )
+    parser.add_argument(
+        '-l', '--language', dest='language', default=None,
+        help='Default language or platform of the requests.',
+        metavar='LANGUAGE',
+    )
+    parser.add_argument(
+        '-i', '--implementation', dest='impl', default=None,
+        help='Default implementation of the requests.',
+        metavar='IMPLEMENTATION',
+    )
+    parser.add_argument(
+        '-j', '--jobs', dest='jobs', type=int, default=1,
+        help='Number of processes used to render the snippets. If 0, as'
+             ' many processes as processors in the machine are used.',
+        metavar='N',
+    )
+    parser.add_argument(
+        '-c', '--chunksize', dest='chunksize', type=int, default=64,
+        help='Number of specifications sent to a process at once rendering'
+             ' in multiple processes.',
+        metavar='N',
+    )
+    parser.add_argument(
+        '-s', '--base-seed', dest='base_seed', type=int, default=None,
+        help='Seed from which the seeds of the requests that don\'t define'
+             ' their own seed are derived, using their position in the'
+             ' input starting at 0 and not counting blank lines.',
+        metavar='SEED',
+    )
+    return parser
+
+
+def parse_options(args=[]):
+    parser = build_parser()
+    opts = parser.parse_args(args)
+    if opts.jobs < 0:
+        parser.error('the number of jobs can\'t be negative')
+    if opts.chunksize < 1:
+        parser.error('the chunk size must be greater than 0')
+    return opts
+
+
+def _parse_lines(fp, records, base_seed=None):
+    # parses the non-blank lines recording their number and the error
+    # parsing them, if any, and yields only the valid specifications, so
+    # the results can be written in the same order as the lines
+    for index, (lineno, line) in enumerate(_numbered_lines(fp)):
+        try:
+            spec = json.loads(line)
+            if not isinstance(spec, dict):
+                raise TypeError(
+                    'The request specification must be a JSON object,'
+                    ' got %s' % type(spec).__name__,
+                )
+        except Exception as err:
+            records.append((lineno, err))
+            continue
+        if base_seed is not None and 'seed' not in spec:
+            spec['seed'] = derive_seed(base_seed, index)
+        records.append((lineno, None))
+        yield spec
+
+
+def _numbered_lines(fp):
+    for lineno, line in enumerate(fp, 1):
+        if line.strip():
+            yield lineno, line
+
+
+def _write_record(fp, lineno, result):
+    record = collections.OrderedDict({'line': lineno})
+    if isinstance(result, Exception):
+        record['error'] = '%s: %s' % (type(result).__name__, result)
+    else:
+        record['code'] = result
+    fp.write(json.dumps(record, ensure_ascii=False))
+    fp.write('\n')
+    fp.flush()
+    return 'error' in record
+
+
+def render_jsonl(
+    input_fp, output_fp, jobs=1, chunksize=64, base_seed=None, **defaults,
+):
+    '''Renders the requests specifications of a JSON lines stream writing
+    the results as JSON lines into other stream, in the same order.
+
+    The lines are read and the results are written as they are rendered
+    by :py:func:`http_request_codegen.generate_http_request_codes`, so the
+    memory used doesn't depend on the number of lines.
+
+    Args:
+        input_fp (file-like): Text stream with a request specification by
+            line. Blank lines are ignored.
+        output_fp (file-like): Text stream where the results are written.
+        jobs (int): Number of processes used to render the snippets. If
+            ``None``, as many processes as processors in the machine are
+            used.
+        chunksize (int): Number of specifications sent to a process at
+            once.
+        base_seed (int): Seed from which the seeds of the specifications
+            without ``seed`` are derived, using their position in the
+            input starting at 0 and not counting blank lines, as
+            ``generate_http_request_codes`` does for a batch.
+        **defaults: Default arguments for all the requests.
+
+    Returns:
+        int: Number of lines whose rendering failed.
+    '''
+    records = collections.deque()
+    codes = generate_http_request_codes(
+        _parse_lines(input_fp, records, base_seed=base_seed),
+        jobs=jobs, chunksize=chunksize, return_exceptions=True, **defaults,
+    )
+
+    n_errors = 0
+    for code in codes:
+        # lines that couldn't be parsed are written before the next valid one
+        lineno, err = records.popleft()
+        while err is not None:
+            n_errors += _write_record(output_fp, lineno, err)
+            lineno, err = records.popleft()
+        n_errors += _write_record(output_fp, lineno, code)
+    while records:
+        n_errors += _write_record(output_fp, *records.popleft())
+    return n_errors
+
+
+def main(args=None):
+    opts = parse_options(args=sys.argv[1:] if args is None else args)
+
+    defaults = {}
+    if opts.language is not None:
+        defaults['language'] = opts.language
+    if opts.impl is not None:
+        defaults['impl'] = opts.impl
+
+    input_fp = sys.stdin if opts.input == '-' else open(
+        opts.input, encoding='utf-8',
+    )
+    output_fp = sys.stdout if opts.output == '-' else open(
+        opts.output, 'w', encoding='utf-8',
+    )
+    try:
+        n_errors = render_jsonl(
+            input_fp, output_fp, jobs=opts.jobs or None,
+            chunksize=opts.chunksize, base_seed=opts.base_seed, **defaults,
+        )
+    finally:
+        if input_fp is not sys.stdin:
+            input_fp.close()
+        if output_fp is not sys.stdout:
+            output_fp.close()
+    return 1 if n_errors else 0
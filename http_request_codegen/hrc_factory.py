@@ -2,8 +2,10 @@
 
 import importlib
 import os
+from collections import OrderedDict
 from functools import lru_cache
 
+from http_request_codegen.generators import GENERATORS_MANIFEST
 from http_request_codegen.hrc_http import HTTP_METHODS
 
 
@@ -15,31 +17,102 @@ GENERATORS_DIR = os.path.abspath(
 )
 
 
-@lru_cache(maxsize=1)
+# entry points group where external packages can register generators, using
+# '<language>.<implementation>' as name and the path to the module as value
+ENTRY_POINTS_GROUP = 'http_request_codegen.generators'
+
+_GENERATORS_BY_LANG_IMPL = OrderedDict(
+    (language, OrderedDict(impls))
+    for language, impls in GENERATORS_MANIFEST.items()
+)
+_ENTRY_POINTS_LOADED = False
+# incremented each time that the registered generators change, so the data
+# computed from them can be invalidated
+GENERATORS_VERSION = 0
+
+
+def _generators_entry_points():
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python 3.7
+        return ()
+    _entry_points = entry_points()
+    if hasattr(_entry_points, 'select'):
+        return _entry_points.select(group=ENTRY_POINTS_GROUP)
+    return _entry_points.get(ENTRY_POINTS_GROUP, ())
+
+
+def register_generator(language, impl, module_path):
+    '''Registers the module of a generator for an implementation of a language,
+    so their functions can be used to generate code snippets. The module must
+    define a function by each supported HTTP method, named as the method in
+    lowercase (``get``, ``post``...).
+
+    External packages can register their generators without calling this
+    function defining entry points in the group
+    ``http_request_codegen.generators``, using as name
+    ``'<language>.<implementation>'`` and as value the path to the module.
+
+    Args:
+        language (str): Language or platform of the implementation.
+        impl (str): Implementation name.
+        module_path (str): Python path to the module of the generator.
+
+    Examples:
+        >>> register_generator(
+        ...     'python', 'requests',
+        ...     'http_request_codegen.generators.python.requests',
+        ... )
+    '''
+    global GENERATORS_VERSION
+
+    _GENERATORS_BY_LANG_IMPL.setdefault(
+        language, OrderedDict(),
+    )[impl] = module_path
+    GENERATORS_VERSION += 1
+    get_func_by_lang_impl_method.cache_clear()
+
+
 def get_generators_modules_by_lang_impl():
-    response = {}
-
-    for fname in os.listdir(GENERATORS_DIR):
-        if fname.startswith('_'):
-            continue
-        fpath = os.path.join(GENERATORS_DIR, fname)
-        if not os.path.isdir(fpath):
-            continue
-        response[fname] = {}
-
-        for modfname in os.listdir(fpath):
-            if modfname.startswith('_'):
-                continue
-            modname = modfname.rstrip('.py')
-            response[fname][modname] = (
-                'http_request_codegen.generators.%s.%s'
-            ) % (fname, modname)
-    return response
+    global _ENTRY_POINTS_LOADED, GENERATORS_VERSION
+
+    if not _ENTRY_POINTS_LOADED:
+        # generators defined by entry points are loaded the first time that
+        # all the generators are needed, the included ones take precedence
+        for entry_point in _generators_entry_points():
+            language, _, impl = entry_point.name.partition('.')
+            if not impl:
+                raise ValueError(
+                    (
+                        'The name of the entry point \'%s\' must follow'
+                        ' the format \'<language>.<implementation>\''
+                    ) % entry_point.name,
+                )
+            _GENERATORS_BY_LANG_IMPL.setdefault(
+                language, OrderedDict(),
+            ).setdefault(impl, entry_point.value)
+            GENERATORS_VERSION += 1
+        _ENTRY_POINTS_LOADED = True
+    return _GENERATORS_BY_LANG_IMPL
+
+
+def _is_registered_generator(language, impl):
+    if language is None:
+        return impl is None or any(
+            impl in impls for impls in _GENERATORS_BY_LANG_IMPL.values()
+        )
+    elif language not in _GENERATORS_BY_LANG_IMPL:
+        return False
+    return impl is None or impl in _GENERATORS_BY_LANG_IMPL[language]
 
 
 @lru_cache(maxsize=32)
 def get_func_by_lang_impl_method(language=None, impl=None, method=None):
-    generators_by_lang_impl = get_generators_modules_by_lang_impl()
+    if _is_registered_generator(language, impl):
+        # known generators are found without loading the entry points
+        generators_by_lang_impl = _GENERATORS_BY_LANG_IMPL
+    else:
+        generators_by_lang_impl = get_generators_modules_by_lang_impl()
 
     if language is None:
         if impl is None:
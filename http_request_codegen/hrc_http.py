@@ -1,5 +1,9 @@
 '''HTTP utitlities of http-request-codegen.'''
 
+import posixpath
+from urllib.parse import unquote, urlsplit
+
+
 HTTP_METHODS = [
     'GET',
     'POST',
@@ -9,3 +13,33 @@ HTTP_METHODS = [
     'PATCH',
     'OPTIONS',
 ]
+
+DEFAULT_STREAM_FILENAME = 'response'
+
+
+def stream_response_filename(url, stream_response=True):
+    '''Returns the path of the file where the response of a request is
+    written when it's streamed by the generated code snippets.
+
+    Args:
+        url (str): URL of the request.
+        stream_response (bool, str): Value of the ``stream_response``
+            argument of the generators. If it's a string, is the path of the
+            file. Otherwise, the path is the last segment of the path of the
+            URL or, if it's empty, ``'response'``.
+
+    Examples:
+        >>> stream_response_filename('http://localhost/exports/foo.csv?p=1')
+        'foo.csv'
+        >>> stream_response_filename('http://localhost/')
+        'response'
+        >>> stream_response_filename('http://localhost', 'foo.json')
+        'foo.json'
+
+    Returns:
+        str: Path of the file.
+    '''
+    if isinstance(stream_response, str):
+        return stream_response
+    path = unquote(urlsplit(url).path)
+    return posixpath.basename(path) or DEFAULT_STREAM_FILENAME
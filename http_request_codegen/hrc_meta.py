@@ -81,3 +81,57 @@ def function_has_kwarg(func, kwarg_name):
         if _inside_func_def and line.rstrip().endswith('):'):
             break
     return response
+
+
+def declare_features(*kwarg_names):
+    '''Decorator that declares the features supported by a generator function,
+    defined by the names of the keyword arguments of the function that
+    implement them. The declared features are used to build the support matrix
+    of the library without inspecting the generators.
+
+    Args:
+        kwarg_names (str): Keyword arguments names of the supported features.
+
+    Examples:
+        >>> @declare_features('headers', 'oneline')
+        ... def get(url, headers={}, oneline=False, wrap=80):
+        ...     pass
+        >>> sorted(function_features(get))
+        ['headers', 'oneline']
+
+    Returns:
+        function: Decorator that stores the features in the function.
+    '''
+    def _declare_features(func):
+        func.__hrc_features__ = frozenset(kwarg_names)
+        return func
+    return _declare_features
+
+
+def function_features(func):
+    '''Returns the features supported by a generator function as the names of
+    their keyword arguments. If the function doesn't declare their features
+    using [``declare_features``](#declare_features), all keyword arguments
+    with default values defined in their signature are considered supported.
+
+    Args:
+        func (function): Generator function.
+
+    Examples:
+        >>> def get(url, headers={}, oneline=False, **kwargs):
+        ...     pass
+        >>> sorted(function_features(get))
+        ['headers', 'oneline']
+
+    Returns:
+        frozenset: Keyword arguments names of the supported features.
+    '''
+    try:
+        return func.__hrc_features__
+    except AttributeError:
+        return frozenset(
+            name for name, parameter in inspect.signature(
+                func,
+            ).parameters.items()
+            if parameter.default is not parameter.empty
+        )
@@ -0,0 +1,54 @@
+'''Random numbers generators management.'''
+
+import random
+
+
+def random_by_seed(seed=None):
+    '''Returns the random numbers generator that must be used to perform a
+    randomization call given a seed.
+
+    If a seed is passed, a new generator seeded with it is returned, so
+    seeded randomizations don't depend on nor modify the global random state
+    of the interpreter. This allows to generate seeded values in multiple
+    threads at the same time obtaining deterministic results. If the seed is
+    ``None``, the module :py:mod:`random` is returned, so the functions of
+    the global random numbers generator are used.
+
+    Args:
+        seed (int): Seed for the random numbers generator.
+
+    Examples:
+        >>> random_by_seed(4).randint(1, 100) == random_by_seed(4).randint(
+        ...     1, 100)
+        True
+        >>> random_by_seed() is random
+        True
+
+    Returns:
+        random.Random: Random numbers generator.
+    '''
+    if seed is None:
+        return random
+    return random.Random(seed)
+
+
+def derive_seed(base_seed, index):
+    '''Derives a seed for an item of a sequence from a base seed. The
+    derived seeds are stable between processes and executions, so they can
+    be used to generate the same values no matter how the items of the
+    sequence are distributed between processes.
+
+    Args:
+        base_seed (int): Base seed of the sequence.
+        index (int): Index of the item in the sequence.
+
+    Examples:
+        >>> derive_seed(5, 0) == derive_seed(5, 0)
+        True
+        >>> derive_seed(5, 0) == derive_seed(5, 1)
+        False
+
+    Returns:
+        int: Seed for the item.
+    '''
+    return random.Random('%s:%d' % (base_seed, index)).getrandbits(32)
@@ -0,0 +1,332 @@
+'''Compiled HTTP requests specifications.'''
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from http_request_codegen.hrc_exceptions import (
+    raise_post_text_plain_n_parameters_not_1,
+)
+from http_request_codegen.hrc_http import HTTP_METHODS
+from http_request_codegen.hrc_meta import CallableTypes
+from http_request_codegen.hrc_string import lazy_string
+from http_request_codegen.hrc_valuer import compile_parameters, resolve_files
+
+
+DEFAULT_CONTENT_TYPE = 'application/x-www-form-urlencoded'
+
+
+def _copy_mapping(mapping):
+    if isinstance(mapping, MappingProxyType):
+        # copy the mapping wrapped by the proxy, preserving their type
+        return mapping.copy()
+    return mapping.__class__(mapping)
+
+
+def _validate_parameter(parameter, name_required=True):
+    if not isinstance(parameter, Mapping):
+        raise TypeError(
+            'Parameter must be a dictionary, got \'%s\'' % (
+                type(parameter).__name__
+            ),
+        )
+    if name_required and 'name' not in parameter and \
+            'names' not in parameter:
+        raise ValueError((
+            'Parameter must contain \'name\' or \'names\''
+            ' attribute, got "%s"'
+        ) % str(parameter))
+    if 'faker' in parameter and not isinstance(
+        parameter['faker'], (str,) + CallableTypes,
+    ):
+        raise TypeError(
+            (
+                '\'faker\' \'%s\' attribute of parameter \'%s\' must be an'
+                ' instance of \'str\' or \'callable\''
+            ) % (
+                str(parameter['faker']), parameter.get('name'),
+            ),
+        )
+
+
+class RequestSpec:
+    '''Compiled and immutable specification of an HTTP request.
+
+    The request definition is validated and normalized once at
+    initialization, so it can be rendered multiple times by any generator
+    without checking and scanning the definition again. Instances can be
+    passed as the ``url`` argument of
+    [``generate_http_request_code``](#generate_http_request_code) and of the
+    functions of all generators, in which case the ``method``,
+    ``parameters``, ``headers``, ``files`` and extra keyword arguments
+    passed to them are ignored in favour of those defined by the
+    specification.
+
+    Args:
+        method (str): HTTP method of the request.
+        url (str, iterable, callable): URL endpoint of the request.
+        parameters (list): List of parameters for the request.
+        headers (dict): Mapping of request header names and values.
+        files (dict): Mapping of files to send to URL.
+        **options: Extra implementation optional arguments.
+
+    Raises:
+        ValueError: the method is not a valid HTTP method, a parameter does
+            not define their name or the number of parameters is not 1 for
+            ``text/plain`` encoded POST requests.
+        TypeError: a parameter is not a dictionary or their ``faker``
+            attribute is not a string nor a callable.
+
+    Examples:
+        >>> spec = RequestSpec('post', 'http://localhost',
+        ...                    headers={'content-type': 'application/json'})
+        >>> spec.method
+        'POST'
+        >>> spec.content_type
+        'application/json'
+        >>> spec.header('Content-Type')
+        'application/json'
+        >>> spec.method = 'GET'
+        Traceback (most recent call last):
+        ...
+        AttributeError: RequestSpec objects are immutable
+    '''
+    __slots__ = (
+        'method',
+        'url',
+        'parameters',
+        'headers',
+        'headers_index',
+        'content_type',
+        'files',
+        'options',
+        'resolved',
+        '_parameters_resolvers',
+    )
+
+    def __init__(
+        self, method='GET', url='http://localhost', parameters=[],
+        headers={}, files={}, **options,
+    ):
+        _method = method.upper()
+        if _method not in HTTP_METHODS:
+            raise ValueError('Invalid HTTP method \'%s\'' % _method)
+
+        # case insensitive headers index, first definition takes precedence
+        headers_index = {}
+        for name, value in headers.items():
+            headers_index.setdefault(str(name).lower(), value)
+
+        if files:
+            content_type = 'multipart/form-data'
+        else:
+            content_type = DEFAULT_CONTENT_TYPE
+            _content_type_header = headers_index.get('content-type', '')
+            if 'text/plain' in _content_type_header:
+                content_type = 'text/plain'
+            elif 'application/json' in _content_type_header:
+                content_type = 'application/json'
+
+        _text_plain_body = _method == 'POST' and content_type == 'text/plain'
+        if _text_plain_body and len(parameters) != 1:
+            raise_post_text_plain_n_parameters_not_1(len(parameters))
+        for parameter in parameters:
+            _validate_parameter(parameter, name_required=not _text_plain_body)
+
+        _setattr = super().__setattr__
+        _setattr('method', _method)
+        _setattr('url', url)
+        _setattr('parameters', tuple(dict(param) for param in parameters))
+        _setattr('headers', MappingProxyType(_copy_mapping(headers)))
+        _setattr('headers_index', MappingProxyType(headers_index))
+        _setattr('content_type', content_type)
+        _setattr('files', MappingProxyType(_copy_mapping(files)))
+        _setattr('options', MappingProxyType(options))
+        _setattr('resolved', False)
+        # compiled parameters resolvers by locale, built the first time that
+        # the specification is resolved using each locale
+        _setattr('_parameters_resolvers', {})
+
+    @classmethod
+    def from_arguments(
+        cls, url, method='GET', parameters=[], headers={}, files={},
+        options={},
+    ):
+        '''Builds a request specification from the arguments received by a
+        generator function. If ``url`` is already a request specification,
+        it is returned as is, after checking that their method is ``method``.
+
+        Args:
+            url (str, iterable, callable, RequestSpec): URL endpoint of the
+                request or compiled request specification.
+            method (str): HTTP method of the request.
+            parameters (list): List of parameters for the request.
+            headers (dict): Mapping of request header names and values.
+            files (dict): Mapping of files to send to URL.
+            options (dict): Extra implementation optional arguments.
+
+        Raises:
+            ValueError: ``url`` is a request specification for other method.
+
+        Returns:
+            RequestSpec: Request specification.
+        '''
+        if isinstance(url, cls):
+            if url.method != method.upper():
+                raise ValueError(
+                    (
+                        'Request specification of HTTP %s method can\'t be'
+                        ' rendered as HTTP %s method'
+                    ) % (url.method, method.upper()),
+                )
+            return url
+        return cls(
+            method=method, url=url, parameters=parameters,
+            headers=headers, files=files, **options,
+        )
+
+    def resolve(self, seed=None, locale=None):
+        '''Resolves the URL, the names and values of the parameters and the
+        random filepaths of the request, building a specification with
+        concrete values. This is the intermediate representation of the
+        request rendered by the generators, so it can be rendered multiple
+        times for different implementations or using different rendering
+        arguments (``wrap``, ``indent``, ``quote_char``...) obtaining always
+        the same values.
+
+        The parameters specifications are compiled the first time that the
+        request is resolved, so next resolutions of the same specification
+        only generate the new values.
+
+        Args:
+            seed (int): Seed used randomizing the values.
+            locale (str): Locale used for ``faker`` providers.
+
+        Examples:
+            >>> spec = RequestSpec(url=['http://localhost'],
+            ...                    parameters=[{'name': 'foo',
+            ...                                 'values': ['bar']}])
+            >>> resolved_spec = spec.resolve()
+            >>> resolved_spec.url, resolved_spec.parameters
+            ('http://localhost', ({'name': 'foo', 'value': 'bar'},))
+            >>> resolved_spec.resolve() is resolved_spec
+            True
+
+        Returns:
+            RequestSpec: Resolved request specification. If the
+                specification is already resolved, returns itself.
+        '''
+        if self.resolved:
+            return self
+        # the specification is already validated and normalized, so only
+        # the resolved attributes are built, sharing the immutable ones
+        spec = object.__new__(self.__class__)
+        _setattr = super(RequestSpec, spec).__setattr__
+        for attr in ('method', 'headers', 'headers_index', 'content_type',
+                     'options'):
+            _setattr(attr, getattr(self, attr))
+        _setattr('url', lazy_string(self.url, seed=seed))
+        try:
+            resolve_parameters = self._parameters_resolvers[locale]
+        except KeyError:
+            resolve_parameters = self._parameters_resolvers[locale] = \
+                compile_parameters(self.parameters, locale=locale)
+        _setattr('parameters', tuple(resolve_parameters(seed=seed)))
+        _setattr('files', MappingProxyType(resolve_files(
+            _copy_mapping(self.files), seed=seed, locale=locale,
+        )))
+        _setattr('resolved', True)
+        _setattr('_parameters_resolvers', {})
+        return spec
+
+    def header(self, name, default=None):
+        '''Returns the value of a header of the request performing a case
+        insensitive search by their name.
+
+        Args:
+            name (str): Header name.
+            default (object): Value returned if the header is not defined.
+
+        Returns:
+            str: Header value.
+        '''
+        return self.headers_index.get(name.lower(), default)
+
+    def without_headers(self, names):
+        '''Builds a copy of the specification without some headers, for
+        example to render them in other place, like a client shared by
+        multiple requests.
+
+        Args:
+            names (iterable): Names of the headers removed, case insensitive.
+
+        Examples:
+            >>> spec = RequestSpec(headers={'Accept': '*/*', 'Foo': 'bar'})
+            >>> dict(spec.without_headers(['accept']).headers)
+            {'Foo': 'bar'}
+
+        Returns:
+            RequestSpec: Request specification without the headers. If the
+                specification is resolved, the copy is resolved too.
+        '''
+        names = {str(name).lower() for name in names}
+        headers = _copy_mapping(self.headers)
+        for name in list(headers):
+            if str(name).lower() in names:
+                del headers[name]
+        spec = self.__class__(
+            method=self.method, url=self.url, parameters=self.parameters,
+            headers=headers, files=self.files, **self.options,
+        )
+        if self.resolved:
+            super(RequestSpec, spec).__setattr__('resolved', True)
+        return spec
+
+    def __setattr__(self, name, value):
+        raise AttributeError('RequestSpec objects are immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('RequestSpec objects are immutable')
+
+    def __repr__(self):
+        return (
+            'RequestSpec(method=%r, url=%r, parameters=%r, headers=%r,'
+            ' files=%r, options=%r)'
+        ) % (
+            self.method, self.url, list(self.parameters), dict(self.headers),
+            dict(self.files), dict(self.options),
+        )
+
+
+def common_headers(specs, exclude=['Content-Type']):
+    '''Returns the headers defined with the same value by all the request
+    specifications passed, which can be hoisted to a client shared by all
+    the requests.
+
+    Args:
+        specs (list): Request specifications.
+        exclude (list): Names of the headers never returned, case
+            insensitive. By default, ``Content-Type`` is excluded because it
+            defines how the body of each request is rendered.
+
+    Examples:
+        >>> common_headers([
+        ...     RequestSpec(headers={'Accept': '*/*', 'Foo': 'bar'}),
+        ...     RequestSpec(headers={'accept': '*/*', 'Foo': 'baz'}),
+        ... ])
+        OrderedDict([('Accept', '*/*')])
+
+    Returns:
+        OrderedDict: Common headers, using their names as are defined by the
+            first specification.
+    '''
+    headers = OrderedDict()
+    if not specs:
+        return headers
+    exclude = {str(name).lower() for name in exclude}
+    for name, value in specs[0].headers.items():
+        if str(name).lower() in exclude:
+            continue
+        if all(spec.header(str(name)) == value for spec in specs[1:]):
+            headers[name] = value
+    return headers
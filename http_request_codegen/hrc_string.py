@@ -1,11 +1,104 @@
 """http-request-codegen string utilities."""
 
+import functools
 import importlib
-import random
 from collections.abc import Iterable
 from types import GeneratorType
 
 from http_request_codegen.hrc_meta import CallableTypes
+from http_request_codegen.hrc_random import random_by_seed
+
+
+# maximum number of nested levels resolved building a lazy string
+LAZY_STRING_MAX_DEPTH = 100
+
+
+@functools.lru_cache(maxsize=256)
+def _import_module(module_path):
+    # modules are reloaded in place, so the cached modules are never stale
+    return importlib.import_module(module_path)
+
+
+@functools.lru_cache(maxsize=1024)
+def resolve_object_path(path):
+    """Resolves the object of a module defined by a path with the form
+    ``'path.to.module::object'``.
+
+    The resolved objects are cached by path, so the module is imported and
+    the object is searched only the first time that each path is resolved.
+    Call ``resolve_object_path.cache_clear()`` to resolve them again, for
+    example after reloading a module.
+
+    Args:
+        path (str): Path to the object.
+
+    Examples:
+        >>> import os
+        >>> resolve_object_path('os.path::join') is os.path.join
+        True
+
+    Raises:
+        ValueError: if ``'::'`` is not used once to separate the module and
+            the object of the path.
+        ModuleNotFoundError: if the module can't be imported.
+        ImportError: if the object does not exists in the module.
+
+    Returns:
+        object: Object of the module.
+    """
+    module_path, resolver_name = path.split('::')
+    # here raises ``ModuleNotFoundError`` if not module
+    mod = _import_module(module_path)
+    try:
+        return getattr(mod, resolver_name)
+    except AttributeError:
+        raise ImportError(
+            ('Object \'%s\' not found in module \'%s\'') % (
+                resolver_name, module_path,
+            ),
+        )
+
+
+def _materialize_set(choices):
+    # the iteration order of sets depends on the hashes of their elements,
+    # which change between interpreters for strings, so they are sorted to
+    # select the same choices with the same seeds in all the processes
+    return tuple(sorted(choices, key=repr))
+
+
+@functools.lru_cache(maxsize=256)
+def _materialize_frozenset(choices):
+    return _materialize_set(choices)
+
+
+def materialize_choices(choices):
+    """Converts a collection of choices into an indexable sequence, so a
+    choice can be selected randomly from it. Frozen sets are materialized
+    only once and their sequences are reused in next calls, sets and
+    generators are materialized in each call and other iterables are
+    returned as is. The choices of sets and frozen sets are sorted by their
+    representation, so their order doesn't depend on the hash seed of the
+    interpreter.
+
+    Args:
+        choices (iterable): Collection of choices.
+
+    Examples:
+        >>> materialize_choices(frozenset({'foo', 'bar'}))
+        ('bar', 'foo')
+        >>> materialize_choices(['foo', 'bar'])
+        ['foo', 'bar']
+
+    Returns:
+        sequence: Indexable choices.
+    """
+    if isinstance(choices, frozenset):
+        return _materialize_frozenset(choices)
+    elif isinstance(choices, set):
+        return _materialize_set(choices)
+    elif isinstance(choices, GeneratorType):
+        return tuple(choices)
+    return choices
 
 
 def lazy_string(string, seed=None, string_func_path=False):
@@ -14,21 +107,28 @@ def lazy_string(string, seed=None, string_func_path=False):
     multiple strategies. Using ``string_func_path``, takes the string as
     a module-callable/iterable path.
 
-    This function is recursive, so if you passes callables as result of your
-    callable, make sure that one of them returns other non callable object
-    or a ``RecursionError`` will be raised.
+    The values returned by callables, the objects of the paths and the choices
+    of the iterables are resolved again until a string is built, so if you
+    passes callables as result of your callable, make sure that one of them
+    returns other non callable object. A ``RecursionError`` is raised if a
+    callable or path is resolved twice without random choices between them
+    or if more than ``LAZY_STRING_MAX_DEPTH`` levels are resolved.
 
     Args:
         string (str/iterable/callable): String or possibilities of strings that
             can be used to build the output. Any other type like numbers or
             booleans will return the ``__repr__`` method of the object.
-        seed (int): Seed used in randomization calls.
+        seed (int): Seed used choosing between the items of iterables. It's
+            not applied to the random generators used by callables, which
+            are called as they are, so their results are not reproduced
+            by the seed.
         string_func_path (bool): If ``True`` and ``string`` is of type ``str``,
             will try to import an object of a module assuming that the string
             has the form ``'path.to.module::object'``. Will raise a
             ``ModuleNotFoundError`` if the module can't be imported or a
             ``ImportError`` if the object to import does not exists in the
-            module.
+            module. The imported objects are cached by
+            [``resolve_object_path``](#resolve_object_path).
 
     Examples:
         >>> # String input
@@ -65,10 +165,11 @@ def lazy_string(string, seed=None, string_func_path=False):
         >>> # Function that returns itself
         >>> def func_returning_itself():
         ...     return func_returning_itself
-        >>> result = lazy_string(func_returning_itself)
+        >>> result = lazy_string(
+        ...     func_returning_itself)  # doctest: +IGNORE_EXCEPTION_DETAIL
         Traceback (most recent call last):
         ...
-        RecursionError: maximum recursion depth exceeded in comparison
+        RecursionError: Cycle detected building a lazy string
 
         >>> # Lambda input
         >>> result = lazy_string(lambda: ('foo', 'bar'))
@@ -105,63 +206,49 @@ def lazy_string(string, seed=None, string_func_path=False):
             '::' is not used to define the path to a Python function.
         ModuleNotFoundError: if ``string_func_path`` is ``True`` but the
             provided module can't be imported.
+        RecursionError: if the resolution of the string never ends.
 
     Returns:
         str: A string resulted from one of the strategies, depends on the input
             data type.
     """
-    if isinstance(string, str):
-        if not string_func_path:
-            return string
-        try:
-            module_path, resolver_name = string.split('::')
-        except ValueError as err:
-            if '::' not in string:
+    # deterministic steps (calls and paths resolutions) taken since the last
+    # random choice, a repeated one means that the resolution never ends
+    seen = set()
+    for _ in range(LAZY_STRING_MAX_DEPTH):
+        if isinstance(string, str):
+            if not string_func_path or '::' not in string:
                 return string
-            raise err
-        # here raises ``ModuleNotFoundError`` if not module
-        mod = importlib.import_module(module_path)
-        try:
-            resolved = getattr(mod, resolver_name)
-        except AttributeError:
-            raise ImportError(
-                ('Object \'%s\' not found in module \'%s\'') % (
-                    resolver_name, module_path,
-                ),
-            )
-        return lazy_string(
-            resolved,
-            seed=seed,
-            string_func_path=string_func_path,
-        )
-    elif isinstance(string, Iterable):
-        if not string:
-            # Prevent IndexError in ``random.choice``
-            raise ValueError(
-                'The iterable used to build a lazy string can'
-                ' not be empty.',
+            step, string = string, resolve_object_path(string)
+        elif isinstance(string, Iterable):
+            choices = materialize_choices(string)
+            if not choices:
+                # Prevent IndexError in ``random.choice``
+                raise ValueError(
+                    'The iterable used to build a lazy string can'
+                    ' not be empty.',
+                )
+            string = random_by_seed(seed).choice(choices)
+            if len(choices) > 1:
+                seen.clear()
+            continue
+        elif isinstance(string, CallableTypes):
+            step, string = string, string()
+        elif hasattr(string, '__name__'):
+            return string.__name__
+        else:
+            return str(string)
+
+        if step in seen:
+            raise RecursionError(
+                'Cycle detected building a lazy string at %r' % (step,),
             )
-
-        if isinstance(string, (set, GeneratorType)):
-            string = list(string)
-        if seed is not None:
-            random.seed(seed)
-        return lazy_string(
-            random.choice(string),
-            seed=seed,
-            string_func_path=string_func_path,
-        )
-    elif isinstance(string, CallableTypes):
-        if seed is not None:
-            random.seed(seed)
-        return lazy_string(
-            string(),
-            seed=seed,
-            string_func_path=string_func_path,
-        )
-    elif hasattr(string, '__name__'):
-        return string.__name__
-    return str(string)
+        seen.add(step)
+    raise RecursionError(
+        'Maximum depth of %d exceeded building a lazy string' % (
+            LAZY_STRING_MAX_DEPTH
+        ),
+    )
 
 
 def replace_multiple(string, replacements={}):
@@ -184,6 +271,41 @@ def replace_multiple(string, replacements={}):
     return string
 
 
+def wrap_string_segments(string, first_line_width, lines_width):
+    """Splits a string in the segments that fit in each line wrapping it.
+    Does not handle spaces at all, the string is sliced by widths, which
+    makes it useful to efficiently wrap long non-spaced strings like URLs.
+    At least one character is included in each segment, even if the width
+    available for a line is lower than 1.
+
+    Args:
+        string (str): String to split.
+        first_line_width (int): Number of characters that fit in the first
+            line.
+        lines_width (int): Number of characters that fit in the next lines.
+
+    Examples:
+        >>> wrap_string_segments('abcdefghij', 4, 3)
+        ['abcd', 'efg', 'hij']
+        >>> wrap_string_segments('abc', 0, -2)
+        ['a', 'b', 'c']
+        >>> wrap_string_segments('', 4, 3)
+        []
+
+    Returns:
+        list: Segments of the string, one for each line.
+    """
+    first_line_width = max(1, first_line_width)
+    lines_width = max(1, lines_width)
+
+    segments = [string[:first_line_width]] if string else []
+    segments.extend(
+        string[i:i + lines_width]
+        for i in range(first_line_width, len(string), lines_width)
+    )
+    return segments
+
+
 def escape_single_quote(value):
     '''Escapes single quotes inside a string.
 
@@ -1,14 +1,15 @@
-'''Library supported features discovering through code inspection.'''
+'''Library supported features discovering through generators metadata.'''
 
 import importlib
 from collections import OrderedDict
+from functools import lru_cache
 
+from http_request_codegen import hrc_factory
 from http_request_codegen.hrc_factory import (
-    get_func_by_lang_impl_method,
     get_generators_modules_by_lang_impl,
 )
 from http_request_codegen.hrc_http import HTTP_METHODS
-from http_request_codegen.hrc_meta import function_has_kwarg
+from http_request_codegen.hrc_meta import function_features
 
 
 FEATURES_KWARGS = OrderedDict({
@@ -22,23 +23,39 @@ FEATURES_KWARGS = OrderedDict({
     'Custom initialization': 'setup',
     'Custom teardown': 'teardown',
     'Line wrapping': 'wrap',
+    'Streaming responses': 'stream_response',
 })
 
 
-def _func_has_kwarg_support_factory(kwarg_name):
-    def _func_has_kwarg(language, impl, method):
-        func = get_func_by_lang_impl_method(
-            language=language, impl=impl, method=method,
-        )
-        return function_has_kwarg(func, kwarg_name)
-    return _func_has_kwarg
+@lru_cache(maxsize=1)
+def _support_matrix(generators_version):
+    # features supported by each method of the implementations and, indexed
+    # by method and feature, the implementations that supports them, built
+    # only once for each version of the registered generators
+    features_by_lang_impl_method = OrderedDict()
+    impls_by_method_feature = {}
+    for lang, impls in get_generators_modules_by_lang_impl().items():
+        for impl, module_path in impls.items():
+            mod = importlib.import_module(module_path)
+            for method in HTTP_METHODS:
+                try:
+                    func = getattr(mod, method.lower())
+                except AttributeError:
+                    continue
+                features = function_features(func)
+                features_by_lang_impl_method[(lang, impl, method)] = features
+                # ``None`` indexes all the implementations of the method
+                for kwarg in (None,) + tuple(features):
+                    impls_by_method_feature.setdefault(
+                        (method, kwarg), OrderedDict(),
+                    )[(lang, impl)] = None
+    return features_by_lang_impl_method, impls_by_method_feature
 
 
-def _get_supports_parameters_funcs():
-    return OrderedDict({
-        feature: _func_has_kwarg_support_factory(kwarg) for feature, kwarg in
-        FEATURES_KWARGS.items()
-    })
+def _get_support_matrix():
+    # entry points must be loaded before reading the version of generators
+    get_generators_modules_by_lang_impl()
+    return _support_matrix(hrc_factory.GENERATORS_VERSION)
 
 
 def supported_features():
@@ -64,10 +81,13 @@ def supported_features():
     }
     ```
 
-    A feature is supported is a function that reproduces a method in their
-    implementation has a certain keyword argument in his definition. The
-    mapping of features and keyword arguments are defined in the global
-    variable ``FEATURES_KWARGS`` of this module.
+    A feature is supported if the function that reproduces a method in their
+    implementation declares the keyword argument of the feature using the
+    decorator ``http_request_codegen.hrc_meta.declare_features`` or, if it
+    doesn't declare their features, has that keyword argument in their
+    signature. The mapping of features and keyword arguments are defined in
+    the global variable ``FEATURES_KWARGS`` of this module. The support
+    matrix is computed only once, unless new generators are registered.
 
     This function is used to build the "Support" section of the documentation.
 
@@ -75,31 +95,18 @@ def supported_features():
         dict: Mapping with all features supported by method for each
             implementation.
     '''
-    _supports_params_funcs = _get_supports_parameters_funcs()
+    features_by_lang_impl_method, _ = _get_support_matrix()
 
     response = {}
-
-    for lang, impls in get_generators_modules_by_lang_impl().items():
-        response[lang] = {}
-        for impl, module_path in impls.items():
-            response[lang][impl] = {}
-            mod = importlib.import_module(module_path)
-
-            for method in HTTP_METHODS:
-                _method_supported = False
-
-                try:
-                    getattr(mod, method.lower())
-                except AttributeError:
-                    continue
-                response[lang][impl][method] = OrderedDict({})
-                for feature, support_func in _supports_params_funcs.items():
-                    supported = support_func(lang, impl, method)
-                    response[lang][impl][method][feature] = supported
-                    if supported:
-                        _method_supported = True
-                response[lang][impl][method]['_supported'] = _method_supported
-
+    for (lang, impl, method), features in \
+            features_by_lang_impl_method.items():
+        response.setdefault(lang, {}).setdefault(impl, {})
+        response[lang][impl][method] = OrderedDict({})
+        for feature, kwarg in FEATURES_KWARGS.items():
+            response[lang][impl][method][feature] = kwarg in features
+        response[lang][impl][method]['_supported'] = any(
+            kwarg in features for kwarg in FEATURES_KWARGS.values()
+        )
     return response
 
 
@@ -122,15 +129,61 @@ def supported_methods():
     Returns:
         dict: Mapping with all supported methods for each implementation.
     '''
+    features_by_lang_impl_method, _ = _get_support_matrix()
+
     response = {}
-    for lang, impls in supported_features().items():
-        response[lang] = {}
-        for impl, methods in impls.items():
-            _impl_methods = []
-            for method, features in methods.items():
-                if not features['_supported']:
-                    continue
-                _impl_methods.append(method)
-            if _impl_methods:
-                response[lang][impl] = _impl_methods
+    for (lang, impl, method), features in \
+            features_by_lang_impl_method.items():
+        response.setdefault(lang, {})
+        if any(kwarg in features for kwarg in FEATURES_KWARGS.values()):
+            response[lang].setdefault(impl, []).append(method)
     return response
+
+
+@lru_cache(maxsize=128)
+def _supported_implementations(generators_version, method, kwargs):
+    _, impls_by_method_feature = _support_matrix(generators_version)
+    candidates = [
+        impls_by_method_feature.get((method, kwarg), {})
+        for kwarg in (kwargs or (None,))
+    ]
+    return tuple(
+        lang_impl for lang_impl in min(candidates, key=len)
+        if all(lang_impl in impls for impls in candidates)
+    )
+
+
+def supported_implementations(method, features=[]):
+    '''Returns the implementations that support a HTTP method with a set of
+    features. The queries are resolved using an index of the implementations
+    by method and feature, and their results are cached.
+
+    Args:
+        method (str): HTTP method.
+        features (list): Names of the features, as the keys or the keyword
+            arguments of the mapping ``FEATURES_KWARGS`` of this module.
+
+    Raises:
+        ValueError: a feature is not defined in ``FEATURES_KWARGS``.
+
+    Examples:
+        >>> ('python', 'requests') in supported_implementations(
+        ...     'POST', ['oneline', 'Line wrapping'])
+        True
+
+    Returns:
+        list: Tuples of language and implementation names.
+    '''
+    kwargs = set()
+    for feature in features:
+        if feature in FEATURES_KWARGS:
+            kwargs.add(FEATURES_KWARGS[feature])
+        elif feature in FEATURES_KWARGS.values():
+            kwargs.add(feature)
+        else:
+            raise ValueError('Unknown feature \'%s\'' % feature)
+
+    _get_support_matrix()
+    return list(_supported_implementations(
+        hrc_factory.GENERATORS_VERSION, method.upper(), frozenset(kwargs),
+    ))
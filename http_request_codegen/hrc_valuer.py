@@ -1,25 +1,151 @@
 '''Parameter value formatter factory.'''
 
-import importlib
+import functools
 import random
+import threading
 import uuid
-from functools import lru_cache
-
-from faker import Faker
-from faker.providers import lorem as faker_lorem_provider
 
 from http_request_codegen.hrc_meta import CallableTypes
-from http_request_codegen.hrc_string import lazy_string
+from http_request_codegen.hrc_random import derive_seed, random_by_seed
+from http_request_codegen.hrc_string import (
+    _import_module,
+    lazy_string,
+    materialize_choices,
+)
+
+
+# compact list of words used to build random strings without Faker, subset
+# of the words of the english Faker lorem provider
+WORDS = (
+    'ability', 'across', 'address', 'against', 'ahead', 'along', 'amount',
+    'any', 'area', 'article', 'audience', 'bad', 'beat', 'behavior',
+    'between', 'black', 'born', 'brother', 'buy', 'car', 'catch',
+    'certain', 'child', 'civil', 'coach', 'compare', 'continue', 'course',
+    'culture', 'data', 'decide', 'design', 'discover', 'draw', 'each',
+    'economy', 'election', 'enough', 'ever', 'exist', 'fact', 'father',
+    'field', 'finally', 'first', 'follow', 'forget', 'friend', 'game',
+    'give', 'ground', 'guy', 'hard', 'heavy', 'him', 'home', 'house',
+    'husband', 'improve', 'inside', 'item', 'keep', 'land', 'laugh',
+    'learn', 'let', 'likely', 'local', 'low', 'majority', 'market', 'mean',
+    'member', 'might', 'mission', 'more', 'movement', 'name', 'nearly',
+    'next', 'not', 'occur', 'often', 'onto', 'our', 'page', 'party',
+    'people', 'phone', 'plan', 'policy', 'possible', 'pretty', 'product',
+    'provide', 'quality', 'raise', 'ready', 'receive', 'reflect',
+    'require', 'result', 'risk', 'run', 'school', 'second', 'sell',
+    'serve', 'share', 'side', 'sing', 'size', 'society', 'song',
+    'southern', 'spend', 'standard', 'step', 'strategy', 'style',
+    'suggest', 'table', 'teacher', 'test', 'them', 'thing', 'thought',
+    'thus', 'top', 'training', 'trouble', 'type', 'usually', 'voice',
+    'war', 'weight', 'when', 'who', 'wife', 'with', 'work', 'writer', 'yet',
+)
+
+# types between which the values of ``'random'`` type are chosen by default
+RANDOM_TYPES = ('str', 'int', 'float', 'bool', 'uuid', 'id')
+
+# bounds of the integers that can be drawn by NumPy
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+# mask applied to negative seeds, because NumPy only accepts positive ones
+_UINT64_MASK = 2 ** 64 - 1
+
+_FAKERS = threading.local()
 
 
-@lru_cache(maxsize=32)
-def _instanciate_faker(seed=None, locale=None):
-    if seed is not None:
-        Faker.seed(seed)
-    faker = Faker(locale)
+def _faker_by_locale(locale=None):
+    try:
+        fakers = _FAKERS.by_locale
+    except AttributeError:
+        fakers = _FAKERS.by_locale = {}
+    try:
+        return fakers[locale]
+    except KeyError:
+        # Faker is imported here because their import is slow, so it's
+        # deferred until a value needs it
+        from faker import Faker
+
+        faker = fakers[locale] = Faker(locale)
+        return faker
+
+
+def _instanciate_faker(seed=None, locale=None, provider=None):
+    # Faker instantiation is expensive, so only one instance is built by
+    # locale in each thread and the seed is applied to its own random state
+    # for each call, which is not shared with other threads
+    faker = _faker_by_locale(locale)
+    if provider is not None:
+        # registering a provider is expensive and Faker appends it to their
+        # providers list each time, so each one is registered only once
+        try:
+            providers_by_locale = _FAKERS.providers_by_locale
+        except AttributeError:
+            providers_by_locale = _FAKERS.providers_by_locale = {}
+        providers = providers_by_locale.setdefault(locale, set())
+        if provider not in providers:
+            faker.add_provider(provider)
+            providers.add(provider)
+    faker.seed_instance(seed)
     return faker
 
 
+def compile_name_generator(parameter_data):
+    '''Compiles a dictionary of parameter options into a function that
+    returns the corresponding parameter name each time that it's called,
+    following the rules listed in ``parameters`` argument of
+    [``generate_http_request_code``](#generate_http_request_code) function
+    documentation.
+
+    The parameter specification is interpreted only once, so the compiled
+    function can be called multiple times to build names of the same
+    parameter without parsing it again. The compiled function accepts an
+    optional ``seed`` argument used randomizing the names.
+
+    Args:
+        parameter_data (dict): Parameter specification data. It's defined at
+            **name** and **names** sections of ``parameters`` argument of
+            [``generate_http_request_code``](#generate_http_request_code)
+            function documentation.
+
+    Raises:
+        ValueError: none of the ``name`` or ``names`` attributes are defined
+            inside ``parameter_data`` dictionary.
+
+    Examples:
+        >>> name_generator = compile_name_generator({'names': ['foo', 'bar']})
+        >>> name_generator() in ['foo', 'bar']
+        True
+        >>> name_generator(seed=4) == name_generator(seed=4)
+        True
+
+    Returns:
+        function: Parameter names generator.
+    '''
+    if 'name' in parameter_data:
+        name = materialize_choices(parameter_data['name'])
+        if isinstance(name, str):
+            return lambda seed=None: name
+        return lambda seed=None: lazy_string(name, seed=seed)
+    elif 'names' in parameter_data:
+        names = materialize_choices(parameter_data['names'])
+
+        def _name_by_names(seed=None):
+            try:
+                return lazy_string(names, seed=seed, string_func_path=True)
+            except (ModuleNotFoundError, ImportError):
+                raise ValueError(
+                    (
+                        '\'names\' \'%s\' attribute of parameter is pointing'
+                        ' to an inexistent Python callable object'
+                    ) % (
+                        names
+                    ),
+                )
+        return _name_by_names
+    raise ValueError((
+        'Parameter must contain \'name\' or \'names\''
+        ' attribute, got "%s"'
+    ) % str(parameter_data))
+
+
 def lazy_name_by_parameter(parameter_data, seed=None):
     '''Given a dictionary of parameter options, returns the corresponding
     parameter name built following the rules listed in ``parameters`` argument
@@ -34,7 +160,9 @@ def lazy_name_by_parameter(parameter_data, seed=None):
     You can use this function to build the parameters at lower level. This can
     be used, for example, to append the parameters to an URL generating GET
     method code snippets if an implementation does by building the parameters
-    as arguments of a function.
+    as arguments of a function. If you need to build multiple names for the
+    same parameter, use
+    [``compile_name_generator``](#compile_name_generator) instead.
 
     Args:
         parameter_data (dict): Parameter specification data. It's defined at
@@ -58,33 +186,185 @@ def lazy_name_by_parameter(parameter_data, seed=None):
     Returns:
         str: Parameter name.
     '''
-    if 'name' in parameter_data:
-        return lazy_string(parameter_data['name'], seed=seed)
-    elif 'names' in parameter_data:
-        try:
-            return lazy_string(
-                parameter_data['names'],
-                seed=seed,
-                string_func_path=True,
+    return compile_name_generator(parameter_data)(seed=seed)
+
+
+def _normalize_type(_type):
+    _type = lazy_string(_type)
+    return _type.lower() if isinstance(_type, str) else _type
+
+
+def _compile_value_generator_by_type(_type, parameter_data, locale=None):
+    if _type in ('str', 'string'):
+        if locale is None:
+            # built-in words don't need the instantiation of Faker
+            return lambda seed=None: random_by_seed(seed).choice(WORDS)
+
+        def _faker_word(seed=None):
+            from faker.providers import lorem as faker_lorem_provider
+
+            return _instanciate_faker(
+                seed=seed, locale=locale, provider=faker_lorem_provider,
+            ).word()
+        return _faker_word
+    elif _type in ('int', 'integer'):
+        # Document max and min in public API
+        _max = parameter_data.get('max', 65536)
+        _min = parameter_data.get('min', -65536)
+        return lambda seed=None: str(random_by_seed(seed).randint(_min, _max))
+    elif _type in ('float', 'number'):
+        # Document step in public API
+        _max = parameter_data.get('max', 65536)
+        _min = parameter_data.get('min', -65536)
+        if 'round' not in parameter_data:
+            return lambda seed=None: str(
+                random_by_seed(seed).uniform(_min, _max),
             )
-        except (ModuleNotFoundError, ImportError):
-            raise ValueError(
-                (
-                    '\'names\' \'%s\' attribute of parameter is pointing to an'
-                    ' inexistent Python callable object'
-                ) % (
-                    parameter_data['names']
-                ),
+        _round = parameter_data['round']
+        return lambda seed=None: str(
+            round(random_by_seed(seed).uniform(_min, _max), _round),
+        )
+    elif _type in ('bool', 'boolean'):
+        _possibles = ('true', 'false', 'null') if parameter_data.get('null') \
+            else ('true', 'false')
+        return lambda seed=None: random_by_seed(seed).choice(_possibles)
+    elif _type in ('uuid', 'uuid4'):
+        # same values as ``Faker.uuid4`` for the same seed
+        return lambda seed=None: uuid.UUID(
+            int=random_by_seed(seed).getrandbits(128), version=4,
+        ).hex
+    elif _type in ('id', 'identifier'):
+        _max = parameter_data.get('max', 65536)
+        return lambda seed=None: str(random_by_seed(seed).randint(1, _max))
+    elif _type == 'random':
+        return _compile_value_generator_by_lazy_type(
+            parameter_data.get('types', RANDOM_TYPES),
+            parameter_data,
+            locale=locale,
+        )
+    raise TypeError(
+        ('Data type \'%s\' of parameter \'%s\' not supported') % (
+            parameter_data['type'], parameter_data.get('name'),
+        ),
+    )
+
+
+def _compile_value_generator_by_lazy_type(lazy_type, parameter_data,
+                                          locale=None):
+    # the type is resolved in each call, so the generators are compiled the
+    # first time that each type is resolved
+    generators = {}
+    lazy_type = materialize_choices(lazy_type)
+
+    def _value_by_lazy_type(seed=None):
+        _type = _normalize_type(lazy_string(lazy_type, seed=seed))
+        try:
+            generator = generators[_type]
+        except KeyError:
+            generator = generators[_type] = _compile_value_generator_by_type(
+                _type, parameter_data, locale=locale,
             )
+        return generator(seed=seed)
+    return _value_by_lazy_type
 
-        return lazy_string(
-            parameter_data['names'],
-            seed=seed, string_func_path=True,
+
+def compile_value_generator(parameter_data, locale=None):
+    '''Compiles a dictionary of parameter options into a function that
+    returns a value for the parameter each time that it's called, following
+    the rules listed in ``parameters`` argument of
+    [``generate_http_request_code``](#generate_http_request_code) function
+    documentation.
+
+    All the options of the parameter specification are interpreted only
+    once, so the compiled function can be called multiple times to build
+    fresh values of the same parameter without parsing it again, and sets
+    of choices are converted to sequences only once. The compiled function
+    accepts an optional ``seed`` argument used randomizing the values.
+
+    Args:
+        parameter_data (dict): Parameter specification data. It's defined at
+            **type**, **value**, **values** and **faker** sections of
+            ``parameters`` argument as is defined at
+            [``generate_http_request_code``](#generate_http_request_code)
+            function documentation.
+        locale (str): Locale used for ``faker`` providers.
+
+    Examples:
+        >>> value_generator = compile_value_generator({'type': 'int',
+        ...                                            'min': 1, 'max': 5})
+        >>> value_generator() in ['1', '2', '3', '4', '5']
+        True
+        >>> value_generator(seed=4) == value_generator(seed=4)
+        True
+
+    Raises:
+        TypeError: ``'faker'`` attribute value does not contains a string or
+            Python callable object, or if the ``'type'`` attribute value does
+            not support the defined type.
+
+    Returns:
+        function: Parameter values generator.
+    '''
+    if 'value' in parameter_data:
+        value = materialize_choices(parameter_data['value'])
+        if isinstance(value, str):
+            return lambda seed=None: value
+        return lambda seed=None: lazy_string(value, seed=seed)
+    elif 'values' in parameter_data:
+        values = materialize_choices(parameter_data['values'])
+
+        def _value_by_values(seed=None):
+            try:
+                return lazy_string(values, seed=seed, string_func_path=True)
+            except (ModuleNotFoundError, ImportError):
+                raise ImportError(
+                    (
+                        '\'values\' \'%s\' attribute of parameter \'%s\' is'
+                        ' pointing to an inexistent Python callable object'
+                    ) % (
+                        values, parameter_data.get('name'),
+                    ),
+                )
+        return _value_by_values
+    elif 'faker' in parameter_data:
+        if isinstance(parameter_data['faker'], str):
+            # Search provider by string
+            provider_mod_name, func_name = parameter_data['faker'].split('::')
+
+            def _value_by_faker_path(seed=None):
+                faker = _instanciate_faker(
+                    seed=seed,
+                    locale=locale,
+                    provider=_import_module(provider_mod_name),
+                )
+                return getattr(faker, func_name)()
+            return _value_by_faker_path
+        elif isinstance(parameter_data['faker'], CallableTypes):
+            provider_mod_name = parameter_data['faker'].__module__
+            func_name = parameter_data['faker'].__name__
+
+            def _value_by_faker_func(seed=None):
+                faker = _instanciate_faker(
+                    seed=seed, locale=locale, provider=provider_mod_name,
+                )
+                return getattr(faker, func_name)()
+            return _value_by_faker_func
+        raise TypeError(
+            (
+                '\'faker\' \'%s\' attribute of parameter \'%s\' must be an'
+                ' instance of \'str\' or \'callable\''
+            ) % (
+                str(parameter_data['faker']), parameter_data.get('name'),
+            ),
         )
-    raise ValueError((
-        'Parameter must contain \'name\' or \'names\''
-        ' attribute, got "%s"'
-    ) % str(parameter_data))
+    _type = parameter_data.get('type', 'str')
+    if isinstance(_type, (str, type)):
+        return _compile_value_generator_by_type(
+            _normalize_type(_type), parameter_data, locale=locale,
+        )
+    return _compile_value_generator_by_lazy_type(
+        _type, parameter_data, locale=locale,
+    )
 
 
 def lazy_value_by_parameter(parameter_data, seed=None, locale=None):
@@ -109,7 +389,9 @@ def lazy_value_by_parameter(parameter_data, seed=None, locale=None):
     You can use this function to build the parameters at lower level. This can
     be used, for example, to append the parameters to an URL generating GET
     method code snippets if an implementation does by building the parameters
-    as arguments of a function.
+    as arguments of a function. If you need to build multiple values for the
+    same parameter, use
+    [``compile_value_generator``](#compile_value_generator) instead.
 
     Args:
         parameter_data (dict): Parameter specification data. It's defined at
@@ -145,105 +427,254 @@ def lazy_value_by_parameter(parameter_data, seed=None, locale=None):
     Returns:
         str: Parameter value.
     '''
-    if 'value' in parameter_data:
-        return lazy_string(parameter_data['value'], seed=seed)
-    elif 'values' in parameter_data:
-        try:
-            return lazy_string(
-                parameter_data['values'],
-                seed=seed,
-                string_func_path=True,
-            )
-        except (ModuleNotFoundError, ImportError):
-            raise ImportError(
-                (
-                    '\'values\' \'%s\' attribute of parameter \'%s\' is'
-                    ' pointing to an inexistent Python callable object'
-                ) % (
-                    parameter_data['values'], parameter_data['name'],
-                ),
-            )
-    elif 'faker' in parameter_data:
-        if isinstance(parameter_data['faker'], str):
-            # Search provider by string
-            provider_mod_name, func_name = parameter_data['faker'].split('::')
-            mod = importlib.import_module(provider_mod_name)
-            faker = _instanciate_faker(seed=seed, locale=locale)
-            faker.add_provider(mod)
-            return getattr(faker, func_name)()
-        elif isinstance(parameter_data['faker'], CallableTypes):
-            faker = _instanciate_faker(seed=seed, locale=locale)
-            faker.add_provider(parameter_data['faker'].__module__)
-            return getattr(faker, parameter_data['faker'].__name__)()
-        raise TypeError(
-            (
-                '\'faker\' \'%s\' attribute of parameter \'%s\' must be an'
-                ' instance of \'str\' or \'callable\''
-            ) % (
-                str(parameter_data['faker']), parameter_data['name'],
-            ),
-        )
-    if 'type' not in parameter_data:
-        _type = 'str'
+    return compile_value_generator(parameter_data, locale=locale)(seed=seed)
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    # the result is cached, so the import is not retried in each call if
+    # NumPy is not installed
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _draw_values_by_type(_type, parameter_data, n, seed=None, locale=None,
+                         numpy=None):
+    # draws all the values of a type from the same random numbers generator,
+    # returning ``None`` if the values of the type can't be drawn in batches
+    if numpy is None:
+        rng = random.Random(seed)
     else:
-        _type = lazy_string(parameter_data['type'], seed=seed)
-        if isinstance(_type, str):
-            _type = _type.lower()
-    if _type in ('str', 'string', str):
-        faker = _instanciate_faker(seed=seed, locale=locale)
-        faker.add_provider(faker_lorem_provider)
-        return faker.word()
-    elif _type in ('int', 'integer', int):
-        if seed is not None:
-            random.seed(seed)
-        # Document max and min in public API
-        _max = 65536 if 'max' not in parameter_data \
-            else parameter_data['max']
-        _min = -65536 if 'min' not in parameter_data \
-            else parameter_data['min']
-        return str(random.randint(_min, _max))
-    elif _type in ('float', 'number', float):
-        if seed is not None:
-            random.seed(seed)
-        # Document step in public API
-        _max = 65536 if 'max' not in parameter_data \
-            else parameter_data['max']
-        _min = -65536 if 'min' not in parameter_data \
-            else parameter_data['min']
-        response = random.uniform(_min, _max)
-        if 'round' in parameter_data:
-            response = round(response, parameter_data['round'])
-        return str(response)
-    elif _type in ('bool', 'boolean', bool):
-        _possibles = ['true', 'false']
-        if parameter_data.get('null'):
-            _possibles.append('null')
-        if seed is not None:
-            random.seed(seed)
-        return random.choice(_possibles)
-    elif _type in ('uuid', 'uuid4', uuid.UUID):
-        return _instanciate_faker(
-            seed=seed, locale=locale,
-        ).uuid4(cast_to=None).hex
-    elif _type in ('id', 'identifier'):
-        if seed is not None:
-            random.seed(seed)
-        _max = 65536 if 'max' not in parameter_data \
-            else parameter_data['max']
-        return str(random.randint(1, _max))
-    elif _type == 'random':
-        if seed is not None:
-            random.seed(seed)
-        if 'types' in parameter_data:
-            _possible = lazy_string(parameter_data['types'], seed=seed)
+        rng = numpy.random.default_rng(
+            seed & _UINT64_MASK if seed is not None and seed < 0 else seed,
+        )
+    if _type in ('int', 'integer', 'id', 'identifier'):
+        if _type in ('id', 'identifier'):
+            _min = 1
+        else:
+            _min = parameter_data.get('min', -65536)
+        _max = parameter_data.get('max', 65536)
+        if numpy is not None and _INT64_MIN <= _min and _max <= _INT64_MAX:
+            numbers = rng.integers(_min, _max, size=n, endpoint=True).tolist()
+        else:
+            if numpy is not None:
+                # out of NumPy integers bounds
+                rng = random.Random(seed)
+            numbers = [rng.randint(_min, _max) for _ in range(n)]
+        return [str(number) for number in numbers]
+    elif _type in ('float', 'number'):
+        _min = parameter_data.get('min', -65536)
+        _max = parameter_data.get('max', 65536)
+        if numpy is not None:
+            numbers = rng.uniform(_min, _max, size=n).tolist()
         else:
-            _possible = [
-                'str', 'int', 'float', 'bool', 'uuid', 'id', 'file',
+            numbers = [rng.uniform(_min, _max) for _ in range(n)]
+        if 'round' in parameter_data:
+            _round = parameter_data['round']
+            return [str(round(number, _round)) for number in numbers]
+        return [str(number) for number in numbers]
+    elif _type in ('uuid', 'uuid4'):
+        if numpy is not None:
+            data = rng.bytes(16 * n)
+            return [
+                uuid.UUID(bytes=data[i:i + 16], version=4).hex
+                for i in range(0, 16 * n, 16)
             ]
-        parameter_data['type'] = random.choice(_possible)
-        return lazy_value_by_parameter(parameter_data['type'], seed=seed)
-    raise TypeError(
-        ('Data type \'%s\' of parameter \'%s\' not supported') % (
-            parameter_data['type'], parameter_data['name'],
-        ),
-    )
+        return [
+            uuid.UUID(int=rng.getrandbits(128), version=4).hex
+            for _ in range(n)
+        ]
+
+    if _type in ('bool', 'boolean'):
+        _possibles = ('true', 'false', 'null') if parameter_data.get('null') \
+            else ('true', 'false')
+    elif _type in ('str', 'string') and locale is None:
+        _possibles = WORDS
+    else:
+        return None
+    if numpy is not None:
+        indexes = rng.integers(0, len(_possibles), size=n).tolist()
+        return [_possibles[index] for index in indexes]
+    return rng.choices(_possibles, k=n)
+
+
+def generate_values(parameter_data, n, seed=None, locale=None):
+    '''Generates multiple values for a parameter in one call. Useful to build
+    big sets of values, like fuzzing corpus or load tests fixtures.
+
+    Numeric, boolean, UUID and identifier values, and words if no locale is
+    defined, are drawn in batches from the same random numbers generator.
+    If [NumPy](https://numpy.org) is installed, it's used to draw them,
+    otherwise the :py:mod:`random` module is used. The values of other
+    parameters are built by a compiled values generator (see
+    [``compile_value_generator``](#compile_value_generator)), which is
+    called with a seed derived from ``seed`` for each value.
+
+    The values generated for a seed are always the same, but they are not
+    the same values built by
+    [``lazy_value_by_parameter``](#lazy_value_by_parameter) and they depend
+    on whether NumPy is installed.
+
+    Args:
+        parameter_data (dict): Parameter specification data, as is defined
+            for [``lazy_value_by_parameter``](#lazy_value_by_parameter)
+            function.
+        n (int): Number of values to generate.
+        seed (int): Seed using randomizing values.
+        locale (str): Locale used for ``faker`` providers.
+
+    Raises:
+        ValueError: ``n`` is a negative number.
+
+    Examples:
+        >>> values = generate_values({'type': 'int', 'min': 1, 'max': 5}, 100)
+        >>> len(values), set(values) <= {'1', '2', '3', '4', '5'}
+        (100, True)
+        >>> generate_values({'type': 'uuid'}, 3, seed=4) == generate_values(
+        ...     {'type': 'uuid'}, 3, seed=4)
+        True
+
+    Returns:
+        list: Parameter values.
+    '''
+    if n < 0:
+        raise ValueError(
+            'The number of values to generate must be positive, got %d' % n,
+        )
+    if not any(key in parameter_data for key in ('value', 'values', 'faker')):
+        _type = parameter_data.get('type', 'str')
+        if isinstance(_type, (str, type)):
+            values = _draw_values_by_type(
+                _normalize_type(_type), parameter_data, n,
+                seed=seed, locale=locale, numpy=_numpy(),
+            )
+            if values is not None:
+                return values
+
+    value_generator = compile_value_generator(parameter_data, locale=locale)
+    if seed is None:
+        return [value_generator() for _ in range(n)]
+    return [value_generator(seed=derive_seed(seed, i)) for i in range(n)]
+
+
+def compile_parameters(parameters, locale=None):
+    '''Compiles a list of parameters specifications into a function that
+    resolves them into parameters with concrete names and values each time
+    that it's called. The compiled function accepts an optional ``seed``
+    argument used randomizing the names and values.
+
+    Literal numeric and boolean values are preserved as is, because some
+    implementations render them different than strings (for example, in
+    JSON encoded requests). Parameters without ``name`` or ``names``
+    attributes are resolved without name.
+
+    Args:
+        parameters (list): Parameters specifications, as are defined at
+            ``parameters`` argument of
+            [``generate_http_request_code``](#generate_http_request_code)
+            function documentation.
+        locale (str): Locale used for ``faker`` providers.
+
+    Examples:
+        >>> resolver = compile_parameters([{'name': 'foo', 'type': 'int'}])
+        >>> resolver(seed=4) == resolver(seed=4)
+        True
+
+    Returns:
+        function: Parameters resolver.
+    '''
+    generators = []
+    for parameter in parameters:
+        if 'name' in parameter or 'names' in parameter:
+            name_generator = compile_name_generator(parameter)
+        else:
+            name_generator = None
+
+        _value = parameter.get('value')
+        if isinstance(_value, (int, float, bool)):
+            value_generator = (lambda _value: lambda seed=None: _value)(_value)
+        else:
+            value_generator = compile_value_generator(parameter, locale=locale)
+        generators.append((name_generator, value_generator))
+
+    def _resolve_parameters(seed=None):
+        response = []
+        for name_generator, value_generator in generators:
+            if name_generator is None:
+                response.append({'value': value_generator(seed=seed)})
+            else:
+                response.append({
+                    'name': name_generator(seed=seed),
+                    'value': value_generator(seed=seed),
+                })
+        return response
+    return _resolve_parameters
+
+
+def resolve_parameters(parameters, seed=None, locale=None):
+    '''Resolves a list of parameters specifications into parameters with
+    concrete names and values, so they can be rendered multiple times
+    obtaining always the same values.
+
+    Literal numeric and boolean values are preserved as is, because some
+    implementations render them different than strings (for example, in
+    JSON encoded requests). Parameters without ``name`` or ``names``
+    attributes are resolved without name.
+
+    Args:
+        parameters (list): Parameters specifications, as are defined at
+            ``parameters`` argument of
+            [``generate_http_request_code``](#generate_http_request_code)
+            function documentation.
+        seed (int): Seed using randomizing names and values.
+        locale (str): Locale used for ``faker`` providers.
+
+    Examples:
+        >>> resolve_parameters([{'name': 'foo', 'values': ['bar']},
+        ...                     {'name': 'baz', 'value': 1}])
+        [{'name': 'foo', 'value': 'bar'}, {'name': 'baz', 'value': 1}]
+
+    Returns:
+        list: Parameters with literal names and values.
+    '''
+    return compile_parameters(parameters, locale=locale)(seed=seed)
+
+
+def resolve_files(files, seed=None, locale=None):
+    '''Resolves the random filepaths of a mapping of files to send, so they
+    can be rendered multiple times obtaining always the same filepaths.
+
+    Args:
+        files (dict): Mapping of files as is defined at ``files`` argument of
+            [``generate_http_request_code``](#generate_http_request_code)
+            function documentation.
+        seed (int): Seed using randomizing filepaths.
+        locale (str): Locale used for ``faker`` providers.
+
+    Examples:
+        >>> resolve_files({'foo': '/tmp/foo.txt',
+        ...                'bar': ('/tmp/bar.txt', 'text/plain')})
+        {'foo': '/tmp/foo.txt', 'bar': ('/tmp/bar.txt', 'text/plain')}
+
+    Returns:
+        dict: Mapping of files without random filepaths.
+    '''
+    response = files.__class__()
+    for name, value in files.items():
+        if value is None or (not isinstance(value, str) and value[0] is None):
+            filepath = lazy_value_by_parameter(
+                {
+                    'name': '',
+                    'faker': 'faker.providers.file::file_path',
+                },
+                seed=seed,
+                locale=locale,
+            )
+            value = filepath if value is None else (
+                (filepath,) + tuple(value[1:])
+            )
+        response[name] = value
+    return response
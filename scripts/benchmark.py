@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+
+"""Benchmarks for http-request-codegen."""
+
+import argparse
+import os
+import sys
+import time
+from collections import OrderedDict
+
+from http_request_codegen import (
+    RenderCache,
+    RequestSpec,
+    __version__,
+    compile_value_generator,
+    generate_http_request_code,
+    generate_http_request_codes,
+    generate_values,
+    lazy_name_by_parameter,
+    lazy_value_by_parameter,
+    render_to,
+    supported_features,
+    supported_methods,
+)
+from http_request_codegen.generators.javascript._utils import (
+    str_definition as javascript_str_definition,
+)
+from http_request_codegen.generators.python._utils import (
+    str_definition as python_str_definition,
+)
+from http_request_codegen.hrc_string import lazy_string
+
+
+DESCRIPTION = (
+    'Benchmarks runner for http-request-codegen. Executes the selected'
+    ' benchmarks and prints their timings to the standard output.'
+)
+
+BATCH_SPEC = {
+    'language': 'python',
+    'impl': 'requests',
+    'method': 'POST',
+    'url': 'http://localhost',
+    'headers': {'Content-Type': 'application/json'},
+    'parameters': [
+        {'name': 'foo', 'value': 'bar'},
+        {'name': 'baz', 'type': 'int'},
+    ],
+    'seed': 5,
+}
+
+WORDS_SAMPLE = ('foo', 'bar', 'baz', 'qux', 'quux', 'corge', 'grault')
+
+
+def _timeit(func, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_batch(n=5000):
+    '''Per-snippet cost of ``generate_http_request_codes`` against calling
+    ``generate_http_request_code`` in a loop.
+    '''
+    specs = [BATCH_SPEC] * n
+
+    def _loop():
+        for spec in specs:
+            generate_http_request_code(**spec)
+
+    def _batch():
+        for _ in generate_http_request_codes(specs):
+            pass
+
+    return OrderedDict({
+        'single-call loop': _timeit(_loop) / n,
+        'batch': _timeit(_batch) / n,
+    })
+
+
+def bench_faker_seeds(n=1000):
+    '''Per-value cost of Faker based values generation using a distinct
+    seed for each value against using always the same seed.
+    '''
+    parameter = {'name': 'foo', 'faker': 'faker.providers.file::file_path'}
+
+    def _distinct_seeds():
+        for seed in range(n):
+            lazy_value_by_parameter(parameter, seed=seed)
+
+    def _fixed_seed():
+        for _ in range(n):
+            lazy_value_by_parameter(parameter, seed=5)
+
+    return OrderedDict({
+        'distinct seeds': _timeit(_distinct_seeds) / n,
+        'fixed seed': _timeit(_fixed_seed) / n,
+    })
+
+
+def bench_paths(n=5000):
+    '''Per-value cost of parameters whose names and values are defined by
+    ``'module::object'`` paths and Faker providers paths.
+    '''
+    parameters = OrderedDict({
+        'names/values': {
+            'names': 'string::ascii_letters',
+            'values': 'calendar::day_name',
+        },
+        'faker': {'name': 'foo', 'faker': 'faker.providers.lorem::word'},
+    })
+    response = OrderedDict()
+    for label, parameter in parameters.items():
+        def _values():
+            for seed in range(n):
+                lazy_name_by_parameter(parameter, seed=seed)
+                lazy_value_by_parameter(parameter, seed=seed)
+
+        response[label] = _timeit(_values) / n
+    return response
+
+
+def bench_lazy_string(n=20000):
+    '''Per-call cost of ``lazy_string`` building strings from frozen sets of
+    choices and from nested choices and callables.
+    '''
+    inputs = OrderedDict({
+        'frozenset': frozenset(WORDS_SAMPLE),
+        'nested': [lambda: [lambda: (WORDS_SAMPLE,)]],
+    })
+    response = OrderedDict()
+    for label, string in inputs.items():
+        def _lazy_strings():
+            for seed in range(n):
+                lazy_string(string, seed=seed)
+
+        response[label] = _timeit(_lazy_strings) / n
+    return response
+
+
+def bench_parallel_batch(n=20000):
+    '''Per-snippet cost of ``generate_http_request_codes`` rendering in
+    the current process against rendering using all the processors.
+    '''
+    specs = [BATCH_SPEC] * n
+
+    def _batch(jobs):
+        for _ in generate_http_request_codes(specs, jobs=jobs, base_seed=5):
+            pass
+
+    return OrderedDict({
+        'current process': _timeit(lambda: _batch(1), repeat=3) / n,
+        '%d processes' % os.cpu_count(): _timeit(
+            lambda: _batch(None), repeat=3,
+        ) / n,
+    })
+
+
+def bench_wrap():
+    '''Cost of wrapping strings from 1 KB to 1 MB by the ``str_definition``
+    functions of Python and Javascript generators.
+    '''
+    response = OrderedDict()
+    for size_name, size in (
+        ('1 KB', 2 ** 10),
+        ('10 KB', 10 * 2 ** 10),
+        ('100 KB', 100 * 2 ** 10),
+        ('1 MB', 2 ** 20),
+    ):
+        string = 'x' * size
+        for language, str_definition in (
+            ('python', python_str_definition),
+            ('javascript', javascript_str_definition),
+        ):
+            response['%s %s' % (language, size_name)] = _timeit(
+                lambda: str_definition(string, indent='    ', wrap=80),
+            )
+    return response
+
+
+def bench_cache(n=5000):
+    '''Per-snippet cost of ``generate_http_request_code`` rendering always
+    against retrieving the snippets from a ``RenderCache``.
+    '''
+    kwargs = dict(BATCH_SPEC)
+    cache = RenderCache()
+
+    def _uncached():
+        for _ in range(n):
+            generate_http_request_code(**kwargs)
+
+    def _cached():
+        for _ in range(n):
+            generate_http_request_code(cache=cache, **kwargs)
+
+    return OrderedDict({
+        'uncached': _timeit(_uncached) / n,
+        'cached': _timeit(_cached) / n,
+    })
+
+
+def bench_render_to(n=5000):
+    '''Per-snippet cost of writing a batch of snippets into a file with
+    ``render_to`` against joining the snippets before writing them.
+    '''
+    specs = [BATCH_SPEC] * n
+
+    def _joined():
+        with open(os.devnull, 'w') as fp:
+            fp.write('\n'.join(generate_http_request_codes(specs)))
+
+    def _render_to():
+        with open(os.devnull, 'w') as fp:
+            render_to(fp, specs)
+
+    return OrderedDict({
+        'joined': _timeit(_joined) / n,
+        'render_to': _timeit(_render_to) / n,
+    })
+
+
+def bench_support(n=200):
+    '''Per-call cost of the functions that build the support matrix of the
+    implementations.
+    '''
+    response = OrderedDict()
+    for func in (supported_features, supported_methods):
+        def _calls():
+            for _ in range(n):
+                func()
+
+        response[func.__name__] = _timeit(_calls) / n
+    return response
+
+
+def bench_values(n=5000):
+    '''Per-value cost of ``lazy_value_by_parameter`` by type, seeded with
+    distinct seeds.
+    '''
+    response = OrderedDict()
+    for _type in ('str', 'uuid', 'int', 'float', 'bool', 'id'):
+        parameter = {'name': 'foo', 'type': _type}
+
+        def _values():
+            for seed in range(n):
+                lazy_value_by_parameter(parameter, seed=seed)
+
+        response[_type] = _timeit(_values) / n
+    return response
+
+
+def bench_compiled_values(n=5000):
+    '''Per-value cost of ``compile_value_generator`` generators against
+    ``lazy_value_by_parameter``, and per-snippet cost of rendering the same
+    request specification with fresh values against rendering its arguments.
+    '''
+    parameter = {'name': 'foo', 'type': 'float', 'min': 1, 'round': 2}
+    value_generator = compile_value_generator(parameter)
+
+    def _lazy_values():
+        for seed in range(n):
+            lazy_value_by_parameter(parameter, seed=seed)
+
+    def _compiled_values():
+        for seed in range(n):
+            value_generator(seed=seed)
+
+    arguments = {
+        key: value for key, value in BATCH_SPEC.items()
+        if key not in ('language', 'impl', 'seed')
+    }
+    spec = RequestSpec(**arguments)
+
+    def _arguments_loop():
+        for seed in range(n):
+            generate_http_request_code(seed=seed, **arguments)
+
+    def _spec_loop():
+        for seed in range(n):
+            generate_http_request_code(url=spec, seed=seed)
+
+    return OrderedDict({
+        'lazy_value_by_parameter': _timeit(_lazy_values) / n,
+        'compiled generator': _timeit(_compiled_values) / n,
+        'arguments render': _timeit(_arguments_loop) / n,
+        'request spec render': _timeit(_spec_loop) / n,
+    })
+
+
+def bench_bulk_values(n=100000):
+    '''Per-value cost of ``generate_values`` by type against calling
+    ``lazy_value_by_parameter`` for each value.
+    '''
+    response = OrderedDict()
+    for _type in ('str', 'uuid', 'int', 'float', 'bool'):
+        parameter = {'name': 'foo', 'type': _type}
+
+        def _loop():
+            for seed in range(n):
+                lazy_value_by_parameter(parameter, seed=seed)
+
+        def _bulk():
+            generate_values(parameter, n, seed=5)
+
+        response['%s (loop)' % _type] = _timeit(_loop, repeat=1) / n
+        response['%s (bulk)' % _type] = _timeit(_bulk) / n
+    return response
+
+
+BENCHMARKS = OrderedDict({
+    'batch': bench_batch,
+    'bulk-values': bench_bulk_values,
+    'cache': bench_cache,
+    'compiled-values': bench_compiled_values,
+    'faker-seeds': bench_faker_seeds,
+    'lazy-string': bench_lazy_string,
+    'parallel-batch': bench_parallel_batch,
+    'paths': bench_paths,
+    'render-to': bench_render_to,
+    'support': bench_support,
+    'values': bench_values,
+    'wrap': bench_wrap,
+})
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
+    parser.add_argument(
+        '-v', '--version', action='version',
+        version='%(prog)s ' + __version__,
+        help='Show program version number and exit.',
+    )
+    parser.add_argument(
+        'benchmarks', nargs='*', default=list(BENCHMARKS.keys()),
+        help='Benchmarks to execute. If not defined, all benchmarks are'
+             ' executed. Available benchmarks are: %s.' % (
+                 ', '.join(BENCHMARKS.keys())
+             ), metavar='BENCHMARK',
+    )
+    return parser
+
+
+def parse_options(args=[]):
+    parser = build_parser()
+    opts = parser.parse_args(args)
+
+    for benchmark in opts.benchmarks:
+        if benchmark not in BENCHMARKS:
+            parser.error('Unknown benchmark \'%s\'' % benchmark)
+    return opts
+
+
+def main(args=[]):
+    opts = parse_options(args=args)
+
+    for benchmark in opts.benchmarks:
+        sys.stdout.write(f'{benchmark}:\n')
+        for case, seconds in BENCHMARKS[benchmark]().items():
+            sys.stdout.write(f'    {case}: {seconds * 1e6:.2f} us\n')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(args=sys.argv[1:]))
@@ -0,0 +1,333 @@
+'''Tests for http-request-codegen public API.'''
+
+import io
+import itertools
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from http_request_codegen import (
+    RenderCache,
+    generate_http_request_code,
+    generate_http_request_codes,
+    generate_http_request_codes_by_targets,
+    generate_http_request_md_fenced_code_block,
+    render_to,
+)
+
+
+BATCH_SPECS = [
+    {
+        'language': 'python',
+        'impl': 'requests',
+        'method': 'GET',
+        'url': 'http://localhost',
+        'parameters': [{'name': 'foo', 'value': 'bar'}],
+    },
+    {
+        'language': 'bash',
+        'impl': 'curl',
+        'method': 'POST',
+        'url': 'http://localhost:8000',
+        'headers': {'Content-Type': 'application/json'},
+        'parameters': [{'name': 'baz', 'value': 1}],
+    },
+    {
+        'language': 'javascript',
+        'impl': 'fetch',
+        'method': 'GET',
+        'url': 'http://localhost',
+        'oneline': True,
+    },
+    {
+        'method': 'POST',
+        'url': 'http://127.0.0.1',
+        'files': {'file': '/tmp/foo.txt'},
+        'wrap': 30,
+    },
+]
+
+
+def test_generate_http_request_codes():
+    codes = generate_http_request_codes(BATCH_SPECS)
+    assert isinstance(codes, types.GeneratorType)
+
+    expected_codes = [
+        generate_http_request_code(**spec) for spec in BATCH_SPECS
+    ]
+    assert list(codes) == expected_codes
+
+
+@pytest.mark.parametrize(
+    ('defaults', 'spec', 'expected_kwargs'), (
+        (
+            {'setup': False},
+            {'url': 'http://localhost'},
+            {'url': 'http://localhost', 'setup': False},
+        ),
+        (
+            {'setup': False, 'language': 'bash'},
+            {'url': 'http://localhost', 'setup': 'set -e\n'},
+            {
+                'url': 'http://localhost',
+                'setup': 'set -e\n',
+                'language': 'bash',
+            },
+        ),
+    ),
+)
+def test_generate_http_request_codes__defaults(
+    defaults, spec, expected_kwargs,
+):
+    codes = list(generate_http_request_codes([spec], **defaults))
+    assert codes == [generate_http_request_code(**expected_kwargs)]
+
+
+def test_generate_http_request_codes__empty():
+    assert list(generate_http_request_codes([])) == []
+
+
+def test_generate_http_request_codes__invalid_method():
+    with pytest.raises(ValueError, match='Invalid HTTP method'):
+        list(generate_http_request_codes([{'method': 'FOO'}]))
+
+
+@pytest.mark.parametrize('jobs', (1, 2))
+def test_generate_http_request_codes__return_exceptions(jobs):
+    codes = list(generate_http_request_codes(
+        BATCH_SPECS + [{'method': 'FOO'}] + BATCH_SPECS, jobs=jobs,
+        chunksize=1, return_exceptions=True,
+    ))
+    assert isinstance(codes[len(BATCH_SPECS)], ValueError)
+    assert 'Invalid HTTP method' in str(codes[len(BATCH_SPECS)])
+    codes.pop(len(BATCH_SPECS))
+    assert codes == list(generate_http_request_codes(BATCH_SPECS * 2))
+
+
+@pytest.mark.parametrize(('jobs', 'chunksize'), ((2, 1), (3, 2), (None, 256)))
+def test_generate_http_request_codes__jobs(jobs, chunksize):
+    codes = generate_http_request_codes(
+        BATCH_SPECS * 3, jobs=jobs, chunksize=chunksize,
+    )
+    assert list(codes) == list(generate_http_request_codes(BATCH_SPECS * 3))
+
+
+def test_generate_http_request_codes__jobs_bounded_dispatch():
+    consumed = itertools.count()
+
+    def specs():
+        for i in range(1000):
+            next(consumed)
+            yield {'url': 'http://localhost/%d' % i, 'setup': False}
+
+    codes = generate_http_request_codes(specs(), jobs=2, chunksize=2)
+    assert next(codes) == "req = requests.get('http://localhost/0')"
+    # no more than two chunks by process are pending, plus the next one
+    assert next(consumed) <= 2 * 2 * 2 + 2
+    codes.close()
+
+
+def test_generate_http_request_codes__base_seed():
+    specs = [
+        {
+            'language': language,
+            'impl': impl,
+            'method': 'POST',
+            'parameters': [
+                {'name': 'foo', 'type': 'uuid'},
+                {'name': 'bar', 'type': 'int'},
+            ],
+        } for language, impl in TARGETS
+    ] * 10
+    specs[5] = dict(specs[5], seed=33)
+
+    expected_codes = list(generate_http_request_codes(specs, base_seed=5))
+    assert len(set(expected_codes)) == len(specs)
+    assert expected_codes[5] == generate_http_request_code(**specs[5])
+
+    for jobs, chunksize in ((2, 1), (3, 4), (4, 100)):
+        codes = generate_http_request_codes(
+            specs, jobs=jobs, chunksize=chunksize, base_seed=5,
+        )
+        assert list(codes) == expected_codes
+    assert list(generate_http_request_codes(specs, base_seed=6)) != \
+        expected_codes
+
+
+@pytest.mark.parametrize(
+    'kwargs', (
+        {'jobs': 0}, {'jobs': -1}, {'chunksize': 0},
+        {'jobs': 2, 'cache': RenderCache()},
+    ),
+)
+def test_generate_http_request_codes__invalid_parallel_arguments(kwargs):
+    # raised calling the function, without iterating the snippets
+    with pytest.raises(ValueError):
+        generate_http_request_codes(BATCH_SPECS, **kwargs)
+
+
+TARGETS = [('python', 'requests'), ('javascript', 'fetch'), ('bash', 'curl')]
+
+
+def test_generate_http_request_codes_by_targets__values_resolved_once():
+    counter = itertools.count(1000)
+    codes = generate_http_request_codes_by_targets(
+        TARGETS,
+        url=lambda: 'http://localhost/%d' % next(counter),
+        parameters=[{'name': 'foo', 'value': lambda: str(next(counter))}],
+    )
+    assert len(codes) == len(TARGETS)
+    for code in codes:
+        assert 'http://localhost/1000' in code
+        assert '1001' in code
+    assert next(counter) == 1002
+
+
+@pytest.mark.parametrize('method', ('GET', 'POST'))
+def test_generate_http_request_codes_by_targets__seeded(method):
+    parameters = [
+        {'name': 'foo', 'type': 'int'},
+        {'names': ['bar', 'baz'], 'type': 'float', 'round': 2},
+        {'name': 'qux', 'value': 1},
+    ]
+    codes = generate_http_request_codes_by_targets(
+        TARGETS, method=method, parameters=parameters, seed=7,
+    )
+    assert codes == [
+        generate_http_request_code(
+            language, impl, method=method, parameters=parameters, seed=7,
+        ) for language, impl in TARGETS
+    ]
+
+
+def test_generate_http_request_codes_by_targets__target_arguments():
+    codes = generate_http_request_codes_by_targets(
+        [('python', 'requests'), ('python', 'requests', {'setup': False})],
+    )
+    assert codes == [
+        generate_http_request_code('python', 'requests'),
+        generate_http_request_code('python', 'requests', setup=False),
+    ]
+
+
+def test_generate_http_request_codes_by_targets__cache():
+    targets = [('python', 'requests'), ('bash', 'curl')]
+    expected_codes = generate_http_request_codes_by_targets(
+        targets, setup=False,
+    )
+    assert expected_codes == [
+        "req = requests.get('http://localhost')",
+        'curl http://localhost',
+    ]
+
+    cache = RenderCache()
+    for hits, misses in ((0, 2), (2, 2)):
+        codes = generate_http_request_codes_by_targets(
+            targets, setup=False, cache=cache,
+        )
+        assert codes == expected_codes
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.bypasses) == (hits, misses, 0)
+
+
+def test_generate_http_request_codes_by_targets__stream_response():
+    codes = generate_http_request_codes_by_targets(
+        [
+            ('python', 'requests'), ('python', 'httpx'), ('bash', 'curl'),
+            ('javascript', 'fetch', {'setup': True}),
+        ],
+        url='http://localhost/exports/foo.csv', stream_response=True,
+    )
+    for code in codes:
+        assert "'foo.csv'" in code
+    assert "'foo.csv'" not in generate_http_request_code(
+        url='http://localhost/exports/foo.csv',
+    )
+
+
+def test_generate_http_request_codes_by_targets__random_files():
+    codes = generate_http_request_codes_by_targets(
+        [('python', 'requests'), ('bash', 'curl')],
+        method='POST',
+        files={'foo': None},
+    )
+    filepath = codes[1].split('foo=@')[1].split()[0]
+    assert filepath in codes[0]
+
+
+STRESS_PARAMETERS = [
+    {'name': 'a', 'type': 'str'},
+    {'name': 'b', 'type': 'int'},
+    {'name': 'c', 'type': 'float', 'round': 3},
+    {'name': 'd', 'type': 'bool', 'null': True},
+    {'name': 'e', 'type': 'uuid'},
+    {'name': 'f', 'type': 'id'},
+    {'names': ['g', 'h', 'i'], 'values': ['foo', 'bar', 'baz']},
+    {'name': 'j', 'faker': 'faker.providers.address::city'},
+]
+
+
+def test_generate_http_request_code__seeded_thread_safe():
+    kwargs_list = [
+        {
+            'language': language,
+            'impl': impl,
+            'method': 'POST' if seed % 2 else 'GET',
+            'url': ['http://localhost', 'http://127.0.0.1'],
+            'parameters': STRESS_PARAMETERS,
+            'files': {'foo': None} if seed % 3 == 0 else {},
+            'seed': seed,
+            'locale': 'es_ES' if seed % 5 == 0 else None,
+        }
+        for seed in range(150) for language, impl in TARGETS
+    ]
+    expected_codes = [
+        generate_http_request_code(**kwargs) for kwargs in kwargs_list
+    ]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        codes = list(executor.map(
+            lambda kwargs: generate_http_request_code(**kwargs),
+            kwargs_list * 3,
+        ))
+    assert codes == expected_codes * 3
+
+
+@pytest.mark.parametrize(
+    ('fp', 'getvalue'), (
+        (io.StringIO(), lambda fp: fp.getvalue()),
+        (io.BytesIO(), lambda fp: fp.getvalue().decode('utf-8')),
+    ),
+)
+def test_render_to(fp, getvalue):
+    assert render_to(fp, BATCH_SPECS, jobs=2) == len(BATCH_SPECS)
+    assert getvalue(fp) == ''.join(
+        '%s\n' % code for code in generate_http_request_codes(BATCH_SPECS)
+    )
+
+
+def test_render_to__binary_file(tmp_path):
+    filepath = tmp_path / 'snippets.txt'
+    with open(filepath, 'wb') as fp:
+        render_to(fp, url='http://localhost/ñ', encoding='latin-1')
+    assert filepath.read_bytes().decode('latin-1') == '%s\n' % (
+        generate_http_request_code(url='http://localhost/ñ')
+    )
+
+
+def test_render_to__fenced():
+    fp = io.StringIO()
+    render_to(
+        fp, ({'language': language} for language in ('bash', None)),
+        end='\n\n', fence_string='~~~', setup=False,
+    )
+    assert fp.getvalue() == '\n\n'.join((
+        generate_http_request_md_fenced_code_block(
+            language='bash', fence_string='~~~', setup=False,
+        ),
+        generate_http_request_md_fenced_code_block(
+            fence_string='~~~', setup=False,
+        ),
+        '',
+    ))
@@ -0,0 +1,320 @@
+'''Tests for rendered code snippets caching.'''
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from http_request_codegen import (
+    DiskRenderCache,
+    RenderCache,
+    RequestSpec,
+    generate_http_request_code,
+    generate_http_request_codes,
+)
+from http_request_codegen.hrc_cache import (
+    Uncacheable,
+    has_unseeded_random,
+    request_fingerprint,
+)
+
+
+def _values():
+    return ['foo', 'bar']
+
+
+def _other_values():
+    return ['foo', 'bar']
+
+
+@pytest.mark.parametrize(
+    ('arguments', 'other_arguments'), (
+        ({'seed': 1}, {'seed': 2}),
+        ({'locale': 'es_ES'}, {'locale': 'en_US'}),
+        ({'wrap': 80}, {'wrap': 79}),
+        ({'quote_char': '\''}, {'quote_char': '"'}),
+        ({'language': 'python'}, {'language': 'bash'}),
+        ({'method': 'GET'}, {'method': 'POST'}),
+        (
+            {'headers': OrderedDict([('A', '1'), ('B', '2')])},
+            {'headers': OrderedDict([('B', '2'), ('A', '1')])},
+        ),
+        (
+            {'parameters': [{'name': 'foo', 'value': 1}]},
+            {'parameters': [{'name': 'foo', 'value': '1'}]},
+        ),
+        (
+            {'parameters': [{'name': 'foo', 'value': 1}]},
+            {'parameters': [{'name': 'foo', 'value': True}]},
+        ),
+        (
+            {'parameters': [{'name': 'foo', 'values': _values}]},
+            {'parameters': [{'name': 'foo', 'values': _other_values}]},
+        ),
+        (
+            {'parameters': [{'name': 'foo', 'values': lambda: 'bar'}]},
+            {'parameters': [{'name': 'foo', 'values': lambda: 'bar'}]},
+        ),
+        ({'url': RequestSpec()}, {'url': RequestSpec().resolve()}),
+    ),
+)
+def test_request_fingerprint(arguments, other_arguments):
+    assert request_fingerprint(arguments) == request_fingerprint(
+        arguments.copy(),
+    )
+    assert request_fingerprint(arguments) != request_fingerprint(
+        other_arguments,
+    )
+
+
+def test_render_cache__equal_values_of_different_types():
+    cache = RenderCache()
+    for value in (1, True, 1.0):
+        code = generate_http_request_code(
+            parameters=[{'name': 'foo', 'value': value}], cache=cache,
+        )
+        assert code == generate_http_request_code(
+            parameters=[{'name': 'foo', 'value': value}],
+        )
+    assert len(cache) == 3
+
+
+def test_request_fingerprint__uncacheable():
+    with pytest.raises(Uncacheable):
+        request_fingerprint({'url': (url for url in ['http://localhost'])})
+    with pytest.raises(Uncacheable):
+        request_fingerprint({'foo': object()})
+
+
+def _values_factory(value):
+    return lambda: value
+
+
+class _Values:
+    def __init__(self, value):
+        self.value = value
+
+    def values(self):
+        return [self.value]
+
+
+@pytest.mark.parametrize(
+    'values', (
+        _values_factory('foo'),
+        lambda value='foo': value,
+        _Values('foo').values,
+    ),
+)
+def test_request_fingerprint__uncacheable_callables(values):
+    with pytest.raises(Uncacheable):
+        request_fingerprint({'parameters': [{'name': 'a', 'values': values}]})
+
+
+def test_render_cache__bypass_closures():
+    cache = RenderCache()
+    for value in ('foo', 'bar'):
+        parameters = [{'name': 'a', 'values': _values_factory(value)}]
+        assert generate_http_request_code(
+            parameters=parameters, seed=1, cache=cache,
+        ) == generate_http_request_code(parameters=parameters, seed=1)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.bypasses) == (0, 0, 2)
+
+
+@pytest.mark.parametrize(
+    ('arguments', 'expected_result'), (
+        ({}, False),
+        ({'url': ['http://localhost']}, True),
+        ({'parameters': [{'name': 'foo', 'value': 'bar'}]}, False),
+        ({'parameters': [{'name': 'foo', 'value': 1}]}, False),
+        ({'parameters': [{'name': 'foo'}]}, True),
+        ({'parameters': [{'names': ['foo'], 'value': 'bar'}]}, True),
+        ({'parameters': [{'name': 'foo', 'value': ['bar']}]}, True),
+        ({'parameters': [{'name': 'foo', 'type': 'int'}]}, True),
+        ({'files': {'foo': '/tmp/foo.txt'}}, False),
+        ({'files': {'foo': None}}, True),
+        ({'files': {'foo': (None, 'text/plain')}}, True),
+        ({'files': {'foo': None}, 'seed': 5}, False),
+        ({'url': _values, 'seed': 5}, True),
+        ({'url': ['http://localhost', _values], 'seed': 5}, True),
+        (
+            {'parameters': [{'name': 'foo', 'value': _values}], 'seed': 5},
+            True,
+        ),
+        (
+            {'parameters': [{'name': 'foo', 'values': 'os::sep'}], 'seed': 5},
+            True,
+        ),
+        (
+            {'parameters': [{'name': 'foo', 'value': 'os::sep'}], 'seed': 5},
+            False,
+        ),
+        ({'url': RequestSpec(parameters=[{'name': 'foo'}])}, True),
+        (
+            {'url': RequestSpec(parameters=[{'name': 'foo'}]).resolve()},
+            False,
+        ),
+    ),
+)
+def test_has_unseeded_random(arguments, expected_result):
+    assert has_unseeded_random(arguments) is expected_result
+
+
+def test_render_cache():
+    cache = RenderCache(maxsize=2)
+    parameters = [{'name': 'foo', 'type': 'int'}]
+
+    code = generate_http_request_code(parameters=parameters, seed=1)
+    for _ in range(3):
+        assert generate_http_request_code(
+            parameters=parameters, seed=1, cache=cache,
+        ) == code
+    generate_http_request_code(parameters=parameters, seed=2, cache=cache)
+    generate_http_request_code(parameters=parameters, seed=3, cache=cache)
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.bypasses) == (2, 3, 0)
+    assert info.currsize == len(cache) == 2
+    assert info.currbytes == sum(
+        len(generate_http_request_code(
+            parameters=parameters, seed=seed,
+        ).encode('utf-8')) for seed in (2, 3)
+    )
+
+    # the least recently used entry (seed 1) has been evicted
+    generate_http_request_code(parameters=parameters, seed=1, cache=cache)
+    assert cache.cache_info().misses == 4
+
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 0, 2, None, 0, 0)
+
+
+def test_render_cache__maxbytes():
+    urls = ['http://localhost/%d' % i for i in range(3)]
+    size = len(generate_http_request_code(url=urls[0]).encode('utf-8'))
+    cache = RenderCache(maxsize=None, maxbytes=size * 2)
+    for url in urls + urls[:1]:
+        generate_http_request_code(url=url, cache=cache)
+    info = cache.cache_info()
+    assert (info.hits, info.misses) == (0, 4)
+    assert (info.currsize, info.currbytes) == (2, size * 2)
+
+    # snippets bigger than the maximum size are not stored
+    cache = RenderCache(maxbytes=size - 1)
+    generate_http_request_code(url=urls[0], cache=cache)
+    assert len(cache) == 0
+
+
+def test_render_cache__bypass_unseeded_random():
+    cache = RenderCache()
+    parameters = [{'name': 'foo', 'type': 'int'}]
+    generate_http_request_code(parameters=parameters, cache=cache)
+    generate_http_request_code(parameters=parameters, cache=cache)
+    generate_http_request_code(
+        url=(url for url in ['http://localhost']), seed=1, cache=cache,
+    )
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.bypasses) == (0, 0, 3)
+    assert len(cache) == 0
+
+
+def test_render_cache__batch():
+    cache = RenderCache()
+    specs = [
+        {'language': 'python', 'seed': 1},
+        {'language': 'bash', 'seed': 1},
+    ]
+    codes = list(generate_http_request_codes(specs * 2, cache=cache))
+    assert codes == list(generate_http_request_codes(specs * 2))
+
+    # batch and single generations share the entries
+    generate_http_request_code(language='python', seed=1, cache=cache)
+    info = cache.cache_info()
+    assert (info.hits, info.misses) == (3, 2)
+
+    with pytest.raises(ValueError, match='multiple processes'):
+        list(generate_http_request_codes(specs, jobs=2, cache=cache))
+
+
+def test_render_cache__thread_safe():
+    cache = RenderCache(maxsize=50)
+    kwargs_list = [
+        {
+            'parameters': [{'name': 'foo', 'type': 'uuid'}],
+            'seed': seed % 100,
+        } for seed in range(1000)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        codes = list(executor.map(
+            lambda kwargs: generate_http_request_code(cache=cache, **kwargs),
+            kwargs_list,
+        ))
+    assert codes == [
+        generate_http_request_code(**kwargs) for kwargs in kwargs_list
+    ]
+    info = cache.cache_info()
+    assert info.hits + info.misses == 1000
+    assert info.currsize == 50
+
+
+def test_disk_render_cache(tmp_path):
+    path = str(tmp_path / 'cache' / 'snippets.sqlite')
+    kwargs_list = [
+        {'parameters': [{'name': 'foo', 'type': 'int'}], 'seed': seed}
+        for seed in range(3)
+    ]
+
+    with DiskRenderCache(path) as cache:
+        codes = [
+            generate_http_request_code(cache=cache, **kwargs)
+            for kwargs in kwargs_list
+        ]
+        generate_http_request_code(
+            parameters=[{'name': 'foo', 'type': 'int'}], cache=cache,
+        )
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.bypasses) == (0, 3, 1)
+        assert info.currsize == len(cache) == 3
+        assert info.currbytes == sum(
+            len(code.encode('utf-8')) for code in codes
+        )
+
+    with DiskRenderCache(path) as cache:
+        assert [
+            generate_http_request_code(cache=cache, **kwargs)
+            for kwargs in kwargs_list
+        ] == codes
+        info = cache.cache_info()
+        assert (info.hits, info.misses) == (3, 0)
+
+    # snippets of other versions are discarded
+    with DiskRenderCache(path, version='0.0.0') as cache:
+        assert len(cache) == 0
+        generate_http_request_code(cache=cache, **kwargs_list[0])
+        assert cache.cache_info().misses == 1
+
+        cache.clear()
+        assert cache.cache_info() == (0, 0, 0, None, None, 0, 0)
+
+
+def test_disk_render_cache__prune(tmp_path):
+    path = str(tmp_path / 'snippets.sqlite')
+    urls = ['http://localhost/%d' % i for i in range(3)]
+
+    with DiskRenderCache(path) as cache:
+        for url in urls:
+            generate_http_request_code(url=url, cache=cache)
+        assert cache.prune() == 0
+
+    # only the snippets retrieved or stored since the cache was opened are
+    # kept pruning it
+    with DiskRenderCache(path) as cache:
+        generate_http_request_code(url=urls[0], cache=cache)
+        generate_http_request_code(url='http://127.0.0.1', cache=cache)
+        assert cache.prune() == 2
+        assert len(cache) == 2
+
+    with DiskRenderCache(path) as cache:
+        for url in (urls[0], 'http://127.0.0.1'):
+            generate_http_request_code(url=url, cache=cache)
+        assert cache.cache_info().hits == 2
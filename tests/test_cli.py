@@ -0,0 +1,99 @@
+'''Tests for http-request-codegen command line interface.'''
+
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from http_request_codegen import (
+    generate_http_request_code,
+    generate_http_request_codes,
+)
+from http_request_codegen.hrc_cli import main, render_jsonl
+
+
+JSONL_SPECS = [
+    {'url': 'http://localhost', 'setup': False},
+    {'language': 'bash', 'parameters': [{'name': 'foo'}], 'seed': 5},
+    {'method': 'FOO'},
+    {'language': 'javascript', 'url': 'http://127.0.0.1'},
+]
+
+
+def _jsonl(specs):
+    return ''.join('%s\n' % json.dumps(spec) for spec in specs)
+
+
+@pytest.mark.parametrize(('jobs', 'chunksize'), ((1, 64), (2, 1), (None, 3)))
+def test_render_jsonl(jobs, chunksize):
+    input_fp = io.StringIO(_jsonl(JSONL_SPECS * 5) + '\n[1]\n{"url": \n')
+    output_fp = io.StringIO()
+
+    n_errors = render_jsonl(
+        input_fp, output_fp, jobs=jobs, chunksize=chunksize, setup=False,
+    )
+    assert n_errors == 7
+
+    records = [json.loads(line) for line in output_fp.getvalue().splitlines()]
+    assert [record['line'] for record in records] == (
+        list(range(1, 21)) + [22, 23]
+    )
+    for record, spec in zip(records, JSONL_SPECS * 5):
+        if spec.get('method') == 'FOO':
+            assert record['error'] == 'ValueError: Invalid HTTP method \'FOO\''
+        else:
+            assert record['code'] == generate_http_request_code(
+                **dict({'setup': False}, **spec),
+            )
+    assert records[-2]['error'].startswith('TypeError: ')
+    assert records[-1]['error'].startswith('JSONDecodeError: ')
+
+
+def test_render_jsonl__base_seed():
+    specs = [{'parameters': [{'name': 'foo', 'type': 'int'}]}] * 10
+    outputs = []
+    for jobs in (1, 2):
+        output_fp = io.StringIO()
+        render_jsonl(
+            io.StringIO(_jsonl(specs)), output_fp, jobs=jobs, chunksize=2,
+            base_seed=5,
+        )
+        outputs.append(output_fp.getvalue())
+    assert outputs[0] == outputs[1]
+    assert len(set(outputs[0].splitlines())) == 10
+
+    # same seeds as the API for the same batch, blank lines are not counted
+    output_fp = io.StringIO()
+    render_jsonl(io.StringIO('\n' + _jsonl(specs)), output_fp, base_seed=5)
+    assert [
+        json.loads(line)['code'] for line in output_fp.getvalue().splitlines()
+    ] == list(generate_http_request_codes(specs, base_seed=5))
+
+
+def test_main(tmp_path):
+    input_path, output_path = tmp_path / 'in.jsonl', tmp_path / 'out.jsonl'
+    input_path.write_text(_jsonl(JSONL_SPECS[:2]))
+
+    assert main([str(input_path), '-o', str(output_path), '-l', 'bash']) == 0
+    records = [
+        json.loads(line) for line in output_path.read_text().splitlines()
+    ]
+    assert records[0]['code'] == generate_http_request_code(
+        language='bash', url='http://localhost', setup=False,
+    )
+
+    input_path.write_text(_jsonl(JSONL_SPECS))
+    assert main([str(input_path), '-o', str(output_path)]) == 1
+
+
+def test_main__stdin():
+    process = subprocess.run(
+        [sys.executable, '-m', 'http_request_codegen', '--jobs', '2'],
+        input=_jsonl(JSONL_SPECS[:1]), capture_output=True, text=True,
+        check=True,
+    )
+    assert json.loads(process.stdout) == {
+        'line': 1, 'code': "req = requests.get('http://localhost')",
+    }
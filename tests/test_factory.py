@@ -1,20 +1,42 @@
 '''Test language-implementation-method factory.'''
 
+import copy
 import importlib
+import os
+from collections import namedtuple
 from types import ModuleType
 
 import pytest
 
+from http_request_codegen import hrc_factory
+from http_request_codegen.generators import GENERATORS_MANIFEST
+from http_request_codegen.generators.bash.curl import get as curl_get
 from http_request_codegen.generators.python.requests import (
     get as requests_get,
     post as requests_post,
 )
 from http_request_codegen.hrc_factory import (
+    GENERATORS_DIR,
     get_func_by_lang_impl_method,
     get_generators_modules_by_lang_impl,
+    register_generator,
 )
 
 
+EntryPoint = namedtuple('EntryPoint', ('name', 'value'))
+
+
+@pytest.fixture
+def generators_registry(monkeypatch):
+    monkeypatch.setattr(
+        hrc_factory, '_GENERATORS_BY_LANG_IMPL',
+        copy.deepcopy(hrc_factory._GENERATORS_BY_LANG_IMPL),
+    )
+    get_func_by_lang_impl_method.cache_clear()
+    yield hrc_factory._GENERATORS_BY_LANG_IMPL
+    get_func_by_lang_impl_method.cache_clear()
+
+
 @pytest.mark.parametrize(
     ('language', 'impl', 'method', 'result'), (
         # Default cases
@@ -85,3 +107,82 @@ def test_get_generators_modules_by_lang_impl():
             mod = importlib.import_module(modpath)
             assert mod
             assert isinstance(mod, ModuleType)
+
+
+def test_generators_manifest():
+    # the manifest must list all the generators included in the package
+    generators_modules = {}
+    for language in os.listdir(GENERATORS_DIR):
+        language_dir = os.path.join(GENERATORS_DIR, language)
+        if language.startswith('_') or not os.path.isdir(language_dir):
+            continue
+        for fname in os.listdir(language_dir):
+            impl, ext = os.path.splitext(fname)
+            if fname.startswith('_') or ext != '.py':
+                continue
+            generators_modules[(language, impl)] = (
+                'http_request_codegen.generators.%s.%s'
+            ) % (language, impl)
+
+    assert generators_modules == {
+        (language, impl): modpath
+        for language, impls in GENERATORS_MANIFEST.items()
+        for impl, modpath in impls.items()
+    }
+
+
+def test_register_generator(generators_registry):
+    register_generator(
+        'python', 'foo', 'http_request_codegen.generators.bash.curl',
+    )
+    assert get_func_by_lang_impl_method('python', 'foo', 'GET') is curl_get
+    assert get_func_by_lang_impl_method(None, 'foo', 'GET') is curl_get
+
+    # the default implementation of the language is not changed
+    assert get_func_by_lang_impl_method('python') is requests_get
+
+
+def test_get_func_by_lang_impl_method__entry_points(
+    generators_registry, monkeypatch,
+):
+    entry_points_loads = []
+
+    def _generators_entry_points():
+        entry_points_loads.append(True)
+        return [
+            EntryPoint('foo.bar', 'http_request_codegen.generators.bash.curl'),
+            EntryPoint(
+                'python.requests',
+                'http_request_codegen.generators.bash.curl',
+            ),
+        ]
+
+    monkeypatch.setattr(hrc_factory, '_ENTRY_POINTS_LOADED', False)
+    monkeypatch.setattr(
+        hrc_factory, '_generators_entry_points', _generators_entry_points,
+    )
+
+    # included generators are found without loading the entry points
+    assert get_func_by_lang_impl_method('python', 'requests') is requests_get
+    assert get_func_by_lang_impl_method(None, 'curl') is curl_get
+    assert not entry_points_loads
+
+    assert get_func_by_lang_impl_method('foo', 'bar') is curl_get
+    assert get_func_by_lang_impl_method(None, 'bar') is curl_get
+    assert entry_points_loads == [True]
+
+    # entry points can't override included generators
+    assert get_func_by_lang_impl_method('python', 'requests') is requests_get
+    assert 'foo' in get_generators_modules_by_lang_impl()
+
+
+def test_get_generators_modules_by_lang_impl__invalid_entry_point(
+    generators_registry, monkeypatch,
+):
+    monkeypatch.setattr(hrc_factory, '_ENTRY_POINTS_LOADED', False)
+    monkeypatch.setattr(
+        hrc_factory, '_generators_entry_points',
+        lambda: [EntryPoint('foo', 'http_request_codegen.generators.bash')],
+    )
+    with pytest.raises(ValueError, match='<language>.<implementation>'):
+        get_generators_modules_by_lang_impl()
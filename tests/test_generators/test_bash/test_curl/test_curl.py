@@ -1,15 +1,20 @@
 """Tests for Bash curl implementation generators."""
 
+import json
 import os
+import shutil
+import subprocess
 
 import pytest
 
 from http_request_codegen import generate_http_request_code
+from http_request_codegen.generators.bash.curl import batch
 
 from tests.combinations import (
     combination_arguments_to_kwargs,
     get_argument_combinations,
 )
+from tests.consts import TEST_BASE_URL
 
 
 CASES_DIRS = {
@@ -50,3 +55,169 @@ def test_bash_curl_post(args_group):
     )
 
     assert result == expected_result
+
+
+BATCH_SPECS = [
+    {
+        'url': 'http://localhost/foo',
+        'parameters': [{'name': 'foo', 'value': 'bar'}],
+        'headers': {'Accept': '*/*'},
+    },
+    {
+        'method': 'POST', 'url': 'http://localhost/bar',
+        'parameters': [{'name': 'baz', 'value': 'qux'}],
+    },
+]
+BATCH_PARALLEL_ONELINE = (
+    'curl --parallel -d "foo=bar" -H "Accept: */*" http://localhost/foo'
+    ' --next -X "POST" -d "baz=qux" http://localhost/bar'
+)
+BATCH_SEQUENTIAL_ONELINE = (
+    'curl -d \'foo=bar\' -H \'Accept: */*\' http://localhost/foo'
+    ' --next -X \'POST\' -d \'baz=qux\' http://localhost/bar'
+)
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'expected_lines'), (
+        (
+            {'wrap': 200},
+            [BATCH_PARALLEL_ONELINE],
+        ),
+        (
+            {'parallel': False, 'quote_char': "'", 'oneline': True},
+            [BATCH_SEQUENTIAL_ONELINE],
+        ),
+        (
+            {'parallel_max': 3, 'indent': '  ', 'teardown': '\n'},
+            [
+                'curl --parallel --parallel-max 3 \\',
+                '  -d "foo=bar" \\',
+                '  -H "Accept: */*" \\',
+                '  http://localhost/foo \\',
+                '  --next \\',
+                '  -X "POST" \\',
+                '  -d "baz=qux" \\',
+                '  http://localhost/bar',
+                '',
+            ],
+        ),
+        (
+            {'config': True, 'quote_char': "'", 'setup': '#!/bin/sh\n\n'},
+            [
+                '#!/bin/sh',
+                '',
+                'curl --parallel -K - <<\'EOF\'',
+                '-d "foo=bar"',
+                '-H "Accept: */*"',
+                'url = "http://localhost/foo"',
+                'next',
+                '-X "POST"',
+                '-d "baz=qux"',
+                'url = "http://localhost/bar"',
+                'EOF',
+            ],
+        ),
+    ),
+)
+def test_bash_curl_batch(kwargs, expected_lines):
+    assert batch(BATCH_SPECS, **kwargs) == '\n'.join(expected_lines)
+
+
+@pytest.mark.parametrize(
+    ('specs', 'kwargs', 'error'), (
+        ([], {}, 'At least one request specification must be passed'),
+        (
+            [{'method': 'PUT'}], {},
+            'HTTP PUT method is not supported by curl batches',
+        ),
+        ([{}], {'parallel_max': 0}, 'must be greater than 0'),
+        (
+            [{}], {'parallel': False, 'parallel_max': 2},
+            'can only be defined performing them in parallel',
+        ),
+    ),
+)
+def test_bash_curl_batch__invalid(specs, kwargs, error):
+    with pytest.raises(ValueError, match=error):
+        batch(specs, **kwargs)
+
+
+def test_bash_curl_batch__config_escaping():
+    specs = [
+        {
+            'url': 'http://localhost/foo',
+            'parameters': [{'name': 'q', 'value': 'a "b" c\\'}],
+            'headers': {'X-A': 'say "hi" it\'s C:\\dir'},
+        },
+        {
+            'method': 'POST', 'url': 'http://localhost/bar',
+            '-d': json.dumps({'foo': 'bar "baz" \\'}),
+        },
+    ]
+    assert batch(specs, config=True).splitlines() == [
+        'curl --parallel -K - <<\'EOF\'',
+        '-d "q=a+%22b%22+c%5C"',
+        '-H "X-A: say \\"hi\\" it\'s C:\\\\dir"',
+        'url = "http://localhost/foo"',
+        'next',
+        '-d "{\\"foo\\": \\"bar \\\\\\"baz\\\\\\" \\\\\\\\\\"}"',
+        '-X "POST"',
+        'url = "http://localhost/bar"',
+        'EOF',
+    ]
+
+
+@pytest.mark.skipif(shutil.which('curl') is None, reason='curl not found')
+@pytest.mark.parametrize('config', (False, True))
+def test_bash_curl_batch__response(config):
+    specs = [
+        {
+            'url': TEST_BASE_URL, 'headers': {'X-Foo': str(i)},
+            'parameters': [{'name': 'foo', 'value': 'bar "%d"' % i}],
+        } for i in range(4)
+    ]
+    process = subprocess.run(
+        ['bash', '-c', batch(specs, parallel_max=2, config=config)],
+        capture_output=True, text=True, check=True,
+    )
+
+    # parallel transfers write the responses in any order
+    decoder, responses, output = json.JSONDecoder(), [], process.stdout
+    while output.strip():
+        response, index = decoder.raw_decode(output.strip())
+        responses.append(response)
+        output = output.strip()[index:]
+    assert sorted(
+        (response['headers']['X-Foo'], response['parameters'])
+        for response in responses
+    ) == [
+        (str(i), [{'name': 'foo', 'value': 'bar "%d"' % i}])
+        for i in range(4)
+    ]
+
+
+def test_bash_curl_get__stream_response():
+    result = generate_http_request_code(
+        'bash', 'curl', url='http://localhost/exports/foo.csv',
+        stream_response=True,
+    )
+    assert result == "curl -N -o 'foo.csv' http://localhost/exports/foo.csv"
+
+
+@pytest.mark.skipif(shutil.which('curl') is None, reason='curl not found')
+@pytest.mark.parametrize('method', ('GET', 'POST'))
+def test_bash_curl__stream_response__response(method, tmp_path):
+    filepath = tmp_path / 'response.json'
+    code = generate_http_request_code(
+        'bash', 'curl', method, url=TEST_BASE_URL,
+        parameters=[{'name': 'foo', 'value': 'bar'}],
+        stream_response=str(filepath),
+    )
+    process = subprocess.run(
+        ['bash', '-c', code], capture_output=True, text=True, check=True,
+    )
+
+    assert not process.stdout
+    response = json.loads(filepath.read_text())
+    assert response['parameters'] == [{'name': 'foo', 'value': 'bar'}]
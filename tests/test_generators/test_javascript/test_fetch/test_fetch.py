@@ -1,15 +1,22 @@
 """Tests for Javascript fetch implementation generators."""
 
+import http.server
+import json
 import os
+import shutil
+import subprocess
+import threading
 
 import pytest
 
 from http_request_codegen import generate_http_request_code
+from http_request_codegen.generators.javascript.fetch import pool
 
 from tests.combinations import (
     combination_arguments_to_kwargs,
     get_argument_combinations,
 )
+from tests.consts import TEST_BASE_URL
 
 
 CASES_DIRS = {
@@ -50,3 +57,294 @@ def test_javascript_fetch_post(args_group):
     )
 
     assert result == expected_result
+
+
+POOL_SPECS = [
+    {'url': 'http://localhost/foo', 'headers': {'Accept': '*/*'}},
+    {
+        'method': 'POST', 'url': 'http://localhost/bar',
+        'parameters': [{'name': 'baz', 'value': 'qux'}],
+        'headers': {'Accept': '*/*', 'X-Foo': 'bar'},
+    },
+]
+POOL_FETCH_OPTIONS = (
+    "    const options = Object.assign({}, request.options, {"
+)
+POOL_SHARED_HEADERS = (
+    "      headers: Object.assign({}, headers, request.options.headers),"
+)
+POOL_MIN_WORKERS = (
+    '  Array.from({length: Math.min(concurrency, requests.length)}, worker)'
+)
+
+
+def test_javascript_fetch_pool():
+    assert pool(POOL_SPECS, concurrency=2, keep_alive=True) == '\n'.join([
+        "const fetch = require('node-fetch');",
+        "const http = require('http');",
+        "const https = require('https');",
+        '',
+        'const httpAgent = new http.Agent({keepAlive: true});',
+        'const httpsAgent = new https.Agent({keepAlive: true});',
+        'const agent = function(url) {',
+        "  return url.protocol === 'http:' ? httpAgent : httpsAgent;",
+        '};',
+        '',
+        'const headers = {',
+        "  'Accept': '*/*'",
+        '};',
+        '',
+        'const requests = [',
+        '  {',
+        "    url: 'http://localhost/foo',",
+        '    options: {',
+        "      method: 'GET'",
+        '    }',
+        '  },',
+        '  {',
+        "    url: 'http://localhost/bar',",
+        '    options: {',
+        "      method: 'POST',",
+        '      body: new URLSearchParams({',
+        "        'baz': 'qux'",
+        '      }),',
+        '      headers: {',
+        "        'X-Foo': 'bar'",
+        '      }',
+        '    }',
+        '  }',
+        '];',
+        '',
+        'const concurrency = 2;',
+        'const responses = [];',
+        'let nextRequest = 0;',
+        '',
+        'async function worker() {',
+        '  while (nextRequest < requests.length) {',
+        '    const i = nextRequest++;',
+        '    const request = requests[i];',
+        POOL_FETCH_OPTIONS,
+        POOL_SHARED_HEADERS,
+        '      agent: agent',
+        '    });',
+        '    try {',
+        '      responses[i] = await fetch(request.url, options);',
+        '    } catch (err) {',
+        "      console.error('Error:', err);",
+        '    }',
+        '  }',
+        '}',
+        '',
+        'Promise.all(',
+        POOL_MIN_WORKERS,
+        ').then(function() {',
+        '  console.log(responses);',
+        '});',
+    ])
+
+
+@pytest.mark.parametrize(
+    ('specs', 'kwargs', 'error'), (
+        ([], {}, 'At least one request specification must be passed'),
+        (
+            [{'method': 'PUT'}], {},
+            'HTTP PUT method is not supported by fetch pools',
+        ),
+        (
+            [{'method': 'POST', 'files': {'foo': 'bar.txt'}}], {},
+            'Multipart requests are not supported by fetch pools',
+        ),
+        ([{}], {'concurrency': 0}, 'must be greater than 0'),
+        ([{}], {'keep_alive': True, 'setup': False}, 'only available'),
+    ),
+)
+def test_javascript_fetch_pool__invalid(specs, kwargs, error):
+    with pytest.raises(ValueError, match=error):
+        pool(specs, **kwargs)
+
+
+def test_javascript_fetch_pool__seed():
+    specs = [{'parameters': [{'name': 'foo', 'type': 'int'}]}] * 4
+    result = pool(specs, seed=5)
+    assert result == pool(specs, seed=5)
+    assert len(set(line for line in result.splitlines() if '?' in line)) == 4
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node not found')
+def test_javascript_fetch_pool__response():
+    specs = [
+        {
+            'url': TEST_BASE_URL, 'method': 'POST' if i % 2 else 'GET',
+            'headers': {
+                'X-Foo': str(i), 'X-Bar': 'baz',
+                'Content-Type': 'application/json',
+            },
+            'parameters': [{'name': 'foo', 'value': 'bar %d' % i}],
+        } for i in range(5)
+    ]
+    # the fetch API included in NodeJS is used instead of 'node-fetch',
+    # parsing the responses to print them as JSON
+    setup = '\n'.join([
+        "const http = require('http');",
+        "const https = require('https');",
+        'const fetch = (url, options) => globalThis.fetch(url, options)',
+        '  .then((response) => response.json());',
+        'console.log = (value) => {',
+        '  process.stdout.write(JSON.stringify(value));',
+        '};',
+        '',
+    ])
+    code = pool(specs, concurrency=2, keep_alive=True, setup=setup)
+    process = subprocess.run(
+        ['node', '-e', code],
+        capture_output=True, text=True, check=True,
+    )
+    responses = json.loads(process.stdout)
+    assert [response['headers']['X-Foo'] for response in responses] == [
+        str(i) for i in range(5)
+    ]
+    assert {response['headers']['X-Bar'] for response in responses} == {
+        'baz',
+    }
+    assert [response['parameters'] for response in responses] == [
+        [{'name': 'foo', 'value': 'bar %d' % i}] for i in range(5)
+    ]
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    # HTTP/1.1 server which records the client ports of the connections
+    protocol_version = 'HTTP/1.1'
+    ports = set()
+
+    def _respond(self):
+        self.ports.add(self.client_address[1])
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        body = json.dumps({'X-Foo': self.headers['X-Foo']}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node not found')
+def test_javascript_fetch_pool__keep_alive():
+    server = http.server.ThreadingHTTPServer(
+        ('127.0.0.1', 0), _KeepAliveHandler,
+    )
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    specs = [
+        {
+            'url': 'http://127.0.0.1:%d' % server.server_port,
+            'method': 'POST' if i % 2 else 'GET',
+            'headers': {'X-Foo': str(i)},
+            'parameters': [{'name': 'foo', 'value': 'bar'}],
+        } for i in range(8)
+    ]
+    # the fetch API included in NodeJS ignores the 'agent' option, so a
+    # 'fetch' that passes it to 'http.request' like 'node-fetch' is used
+    setup = '\n'.join([
+        "const http = require('http');",
+        "const https = require('https');",
+        'const fetch = (url, options) => new Promise((resolve, reject) => {',
+        '  const parsedUrl = new URL(url);',
+        '  const request = http.request(parsedUrl, {',
+        '    method: options.method,',
+        '    headers: options.headers,',
+        '    agent: options.agent(parsedUrl),',
+        '  }, (response) => {',
+        "    let body = '';",
+        "    response.on('data', (chunk) => body += chunk);",
+        "    response.on('end', () => resolve(JSON.parse(body)));",
+        '  });',
+        "  request.on('error', reject);",
+        '  request.end(options.body && String(options.body));',
+        '});',
+        'console.log = (value) => {',
+        '  process.stdout.write(JSON.stringify(value));',
+        '  process.exit(0);',
+        '};',
+        '',
+    ])
+    code = pool(specs, concurrency=2, keep_alive=True, setup=setup)
+    try:
+        process = subprocess.run(
+            ['node', '-e', code],
+            capture_output=True, text=True, check=True, timeout=30,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert json.loads(process.stdout) == [
+        {'X-Foo': str(i)} for i in range(8)
+    ]
+    # the connections are reused by the requests of each worker
+    assert 1 <= len(_KeepAliveHandler.ports) <= 2
+
+
+def test_javascript_fetch_get__stream_response():
+    result = generate_http_request_code(
+        'javascript', 'fetch', url='http://localhost/exports/foo.csv',
+        stream_response=True, setup=True,
+    )
+    assert result == '\n'.join([
+        "const fs = require('fs');",
+        '',
+        'fetch(',
+        "  'http://localhost/exports/foo.csv'",
+        ').then(async function(response) {',
+        "  const file = fs.createWriteStream('foo.csv');",
+        '  const reader = response.body.getReader();',
+        '  while (true) {',
+        '    const {done, value} = await reader.read();',
+        '    if (done) {',
+        '      break;',
+        '    }',
+        '    file.write(value);',
+        '  }',
+        '  file.end();',
+        '}).catch(function(err) {',
+        "  console.error('Error:', err);",
+        '});',
+    ])
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node not found')
+def test_javascript_fetch_post__stream_response__multipart(tmp_path):
+    filepath, upload_path = tmp_path / 'response.json', tmp_path / 'bar.csv'
+    upload_path.write_text('baz')
+    code = generate_http_request_code(
+        'javascript', 'fetch', 'POST', url=TEST_BASE_URL,
+        parameters=[{'name': 'foo', 'value': 'bar'}],
+        files={'bar': [str(upload_path), 'text/csv']},
+        stream_response=str(filepath), setup=True,
+    )
+    assert 'require(\'form-data\')' not in code
+    subprocess.run(['node', '-e', code], check=True)
+
+    response = json.loads(filepath.read_text())
+    assert response['parameters'] == [{'name': 'foo', 'value': 'bar'}]
+    assert response['files'] == {'bar': ['bar.csv', 'text/csv']}
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node not found')
+@pytest.mark.parametrize('method', ('GET', 'POST'))
+def test_javascript_fetch__stream_response__response(method, tmp_path):
+    filepath = tmp_path / 'response.json'
+    code = generate_http_request_code(
+        'javascript', 'fetch', method, url=TEST_BASE_URL,
+        headers={'Content-Type': 'application/json'},
+        parameters=[{'name': 'foo', 'value': 'bar'}],
+        stream_response=str(filepath), setup=True,
+    )
+    subprocess.run(['node', '-e', code], check=True)
+
+    response = json.loads(filepath.read_text())
+    assert response['parameters'] == [{'name': 'foo', 'value': 'bar'}]
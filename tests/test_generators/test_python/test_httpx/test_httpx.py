@@ -0,0 +1,233 @@
+"""Tests for Python httpx implementation generators."""
+
+import json
+import os
+
+import pytest
+
+from http_request_codegen import generate_http_request_code
+from http_request_codegen.generators.python.httpx import gather
+
+from tests.combinations import (
+    combination_arguments_to_kwargs,
+    get_argument_combinations,
+)
+from tests.consts import TEST_BASE_URL
+
+
+CASES_DIRS = {
+    method: os.path.abspath(os.path.join(os.path.dirname(__file__), method))
+    for method in ['GET', 'POST']
+}
+
+
+STREAM_ITERATION = (
+    '                async for chunk in response.aiter_bytes(chunk_size=8192):'
+)
+
+
+def _response_argument_combinations(method):
+    # the keyword arguments of the combinations are requests specific,
+    # httpx rejects header values with trailing whitespaces and guesses the
+    # content type of files, so these are not sent to the testing server
+    return [
+        args_group for args_group in get_argument_combinations(
+            method=method, dirpath=CASES_DIRS[method],
+        )
+        if 'kwargs' not in args_group['arguments']
+        and 'files' not in args_group['arguments']
+        and not any(
+            value != value.strip() for value in args_group['arguments'].get(
+                'headers', {},
+            ).values()
+        )
+    ]
+
+
+def _exec_snippet(result):
+    pytest.importorskip('httpx')
+    if 'import httpx' not in result:
+        result = 'import asyncio\n\nimport httpx\n\n%s' % result
+    namespace = {}
+    exec(result, namespace)
+    return namespace
+
+
+@pytest.mark.parametrize(
+    'args_group',
+    get_argument_combinations(method='GET', dirpath=CASES_DIRS['GET']),
+    ids=lambda args_group: os.path.basename(args_group['filename']),
+)
+def test_python_httpx_get(args_group):
+    with open(args_group['filename']) as f:
+        expected_result = f.read()
+
+    result = generate_http_request_code(
+        'python', 'httpx', 'GET',
+        **combination_arguments_to_kwargs(args_group['arguments']),
+    )
+
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    'args_group',
+    _response_argument_combinations('GET'),
+    ids=lambda args_group: os.path.basename(args_group['filename']),
+)
+def test_python_httpx_get__response(args_group, assert_request_args):
+    result = generate_http_request_code(
+        'python', 'httpx', 'GET',
+        **combination_arguments_to_kwargs(args_group['arguments']),
+    )
+
+    namespace = _exec_snippet(result)
+    assert_request_args(args_group['arguments'], namespace['req'].json())
+
+
+@pytest.mark.parametrize(
+    'args_group',
+    get_argument_combinations(method='POST', dirpath=CASES_DIRS['POST']),
+    ids=lambda args_group: os.path.basename(args_group['filename']),
+)
+def test_python_httpx_post(args_group):
+    with open(args_group['filename']) as f:
+        expected_result = f.read()
+
+    result = generate_http_request_code(
+        'python', 'httpx', 'POST',
+        **combination_arguments_to_kwargs(args_group['arguments']),
+    )
+
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    'args_group',
+    _response_argument_combinations('POST'),
+    ids=lambda args_group: os.path.basename(args_group['filename']),
+)
+def test_python_httpx_post__response(args_group, assert_request_args):
+    result = generate_http_request_code(
+        'python', 'httpx', 'POST',
+        **combination_arguments_to_kwargs(args_group['arguments']),
+    )
+
+    namespace = _exec_snippet(result)
+    assert_request_args(args_group['arguments'], namespace['req'].json())
+
+
+def test_python_httpx_post__multipart_response(tmp_path):
+    filepath = tmp_path / 'bar.csv'
+    filepath.write_text('baz')
+    namespace = _exec_snippet(generate_http_request_code(
+        'python', 'httpx', 'POST', url=TEST_BASE_URL,
+        parameters=[{'name': 'foo', 'value': 'bar'}],
+        files={'bar': [str(filepath), 'text/csv']},
+    ))
+
+    response = namespace['req'].json()
+    assert response['parameters'] == [{'name': 'foo', 'value': 'bar'}]
+    assert response['files'] == {'bar': [str(filepath), 'text/csv']}
+
+
+def test_python_httpx_gather():
+    specs = [
+        {'url': 'http://localhost/foo', 'headers': {'Accept': '*/*'}},
+        {
+            'method': 'POST', 'url': 'http://localhost/bar',
+            'headers': {'Accept': '*/*', 'Content-Type': 'application/json'},
+            'parameters': [{'name': 'baz', 'value': 1}],
+        },
+    ]
+
+    assert gather(specs, concurrency=5, setup=False, oneline=True) == (
+        'async def send(semaphore, request):\n'
+        '    async with semaphore:\n'
+        '        return await request\n\n\n'
+        'async def main():\n'
+        '    semaphore = asyncio.Semaphore(5)\n'
+        '    async with httpx.AsyncClient(headers={\'Accept\': \'*/*\'})'
+        ' as client:\n'
+        '        requests = [\n'
+        '            client.get(\'http://localhost/foo\'),\n'
+        '            client.post(\'http://localhost/bar\', json={\'baz\': 1},'
+        ' headers={\'Content-Type\': \'application/json\'}),\n'
+        '        ]\n'
+        '        return await asyncio.gather(*(\n'
+        '            send(semaphore, request) for request in requests\n'
+        '        ))\n\n\n'
+        'responses = asyncio.run(main())'
+    )
+
+
+@pytest.mark.parametrize(
+    ('specs', 'kwargs', 'error'),
+    (
+        ([], {}, 'At least one request specification must be passed'),
+        (
+            [{'method': 'PUT'}], {},
+            'HTTP PUT method is not supported by httpx gathering',
+        ),
+        ([{}], {'concurrency': 0}, 'The concurrency must be greater than 0'),
+    ),
+)
+def test_python_httpx_gather__invalid(specs, kwargs, error):
+    with pytest.raises(ValueError, match=error):
+        gather(specs, **kwargs)
+
+
+def test_python_httpx_gather__response():
+    specs = [
+        {
+            'url': TEST_BASE_URL,
+            'headers': {'X-Foo': 'bar', 'X-Baz': str(i)},
+            'parameters': [{'name': 'foo', 'value': str(i)}],
+        } for i in range(5)
+    ]
+    namespace = _exec_snippet(gather(specs, concurrency=2, wrap=20))
+
+    for i, response in enumerate(namespace['responses']):
+        response_args = response.json()
+        assert response_args['headers']['X-Foo'] == 'bar'
+        assert response_args['headers']['X-Baz'] == str(i)
+        assert response_args['parameters'] == [
+            {'name': 'foo', 'value': str(i)},
+        ]
+
+
+def test_python_httpx_get__stream_response():
+    result = generate_http_request_code(
+        'python', 'httpx', url='http://localhost/exports/foo.csv',
+        stream_response=True, setup=False,
+    )
+    assert result == '\n'.join([
+        'async def main():',
+        '    async with httpx.AsyncClient() as client:',
+        '        async with client.stream(',
+        "            'GET',",
+        "            'http://localhost/exports/foo.csv'",
+        '        ) as response:',
+        "            with open('foo.csv', 'wb') as f:",
+        STREAM_ITERATION,
+        '                    f.write(chunk)',
+        '            return response',
+        '',
+        '',
+        'req = asyncio.run(main())',
+    ])
+
+
+@pytest.mark.parametrize('oneline', (False, True))
+@pytest.mark.parametrize('method', ('GET', 'POST'))
+def test_python_httpx__stream_response__response(method, oneline, tmp_path):
+    filepath = tmp_path / 'response.json'
+    namespace = _exec_snippet(generate_http_request_code(
+        'python', 'httpx', method, url=TEST_BASE_URL,
+        parameters=[{'name': 'foo', 'value': 'bar'}],
+        stream_response=str(filepath), oneline=oneline,
+    ))
+
+    assert namespace['req'].status_code == 200
+    response = json.loads(filepath.read_text())
+    assert response['parameters'] == [{'name': 'foo', 'value': 'bar'}]
@@ -1,15 +1,18 @@
 """Tests for Python requests implementation generators."""
 
+import json
 import os
 
 import pytest
 
 from http_request_codegen import generate_http_request_code
+from http_request_codegen.generators.python.requests import session
 
 from tests.combinations import (
     combination_arguments_to_kwargs,
     get_argument_combinations,
 )
+from tests.consts import TEST_BASE_URL
 
 
 CASES_DIRS = {
@@ -97,3 +100,116 @@ def test_python_requests_post__response(
     for f in files:
         f.close()
         os.remove(f.name)
+
+
+def test_python_requests_session():
+    specs = [
+        {
+            'method': 'POST', 'url': 'http://localhost/login',
+            'headers': {'User-Agent': 'foo'},
+            'parameters': [{'name': 'user', 'value': 'bar'}],
+        },
+        {
+            'url': 'http://localhost/home',
+            'headers': {'User-Agent': 'foo', 'Accept': '*/*'},
+        },
+    ]
+
+    assert session(specs, pool_connections=2, pool_maxsize=4) == (
+        'import requests\n'
+        'from requests.adapters import HTTPAdapter\n\n'
+        'session = requests.Session()\n'
+        'adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)\n'
+        'session.mount(\'http://\', adapter)\n'
+        'session.mount(\'https://\', adapter)\n'
+        'session.headers.update({\'User-Agent\': \'foo\'})\n\n'
+        'req = session.post(\'http://localhost/login\','
+        ' data={\'user\': \'bar\'})\n'
+        'req = session.get(\'http://localhost/home\','
+        ' headers={\'Accept\': \'*/*\'})'
+    )
+
+    assert session(specs[1:], setup=False, oneline=True) == (
+        'session = requests.Session();'
+        'session.headers.update('
+        '{\'User-Agent\': \'foo\',\'Accept\': \'*/*\'});'
+        'req = session.get(\'http://localhost/home\');'
+    )
+
+
+def test_python_requests_session__seed():
+    specs = [{'parameters': [{'name': 'foo', 'type': 'int'}]}] * 2
+    result = session(specs, seed=5)
+    assert result == session(specs, seed=5)
+    assert len(set(result.splitlines()[-2:])) == 2
+
+
+@pytest.mark.parametrize(
+    ('specs', 'error'),
+    (
+        ([], 'At least one request specification must be passed'),
+        (
+            [{'method': 'PUT'}],
+            'HTTP PUT method is not supported by requests sessions',
+        ),
+    ),
+)
+def test_python_requests_session__invalid(specs, error):
+    with pytest.raises(ValueError, match=error):
+        session(specs)
+
+
+def test_python_requests_session__response():
+    specs = [
+        {
+            'url': TEST_BASE_URL, 'headers': {'X-Foo': 'bar', 'X-Baz': '1'},
+            'parameters': [{'name': 'foo', 'value': 'bar'}],
+        },
+        {
+            'method': 'POST', 'url': TEST_BASE_URL,
+            'headers': {'X-Foo': 'bar', 'X-Baz': '2'},
+            'parameters': [{'name': 'baz', 'value': 'qux'}],
+        },
+    ]
+    namespace = {}
+    exec(session(specs, pool_maxsize=2), namespace)
+
+    assert namespace['session'].headers['X-Foo'] == 'bar'
+    response = namespace['req'].json()
+    assert response['headers']['X-Foo'] == 'bar'
+    assert response['headers']['X-Baz'] == '2'
+    assert response['parameters'] == [{'name': 'baz', 'value': 'qux'}]
+
+
+def test_python_requests_get__stream_response():
+    result = generate_http_request_code(
+        'python', 'requests', url='http://localhost/exports/foo.csv',
+        stream_response=True, setup=False,
+    )
+    assert result == '\n'.join([
+        "req = requests.get('http://localhost/exports/foo.csv', stream=True)",
+        '',
+        "with open('foo.csv', 'wb') as f:",
+        '    for chunk in req.iter_content(chunk_size=8192):',
+        '        f.write(chunk)',
+    ])
+
+
+@pytest.mark.parametrize('oneline', (False, True))
+@pytest.mark.parametrize('method', ('GET', 'POST'))
+def test_python_requests__stream_response__response(
+    method, oneline, tmp_path,
+):
+    filepath = tmp_path / 'response.json'
+    code = generate_http_request_code(
+        'python', 'requests', method, url=TEST_BASE_URL,
+        parameters=[{'name': 'foo', 'value': 'bar'}],
+        stream_response=str(filepath), oneline=oneline,
+    )
+    assert ('\n' not in code) is oneline
+    namespace = {}
+    exec(code, namespace)
+
+    assert namespace['req'].status_code == 200
+    response = json.loads(filepath.read_text())
+    assert response['parameters'] == [{'name': 'foo', 'value': 'bar'}]
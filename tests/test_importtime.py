@@ -0,0 +1,58 @@
+'''Import time tests for http-request-codegen.'''
+
+import subprocess
+import sys
+
+import pytest
+
+
+# maximum cumulative time importing the package, in microseconds
+IMPORT_TIME_BUDGET = 50000
+
+
+def _importtime(code):
+    # returns the cumulative import time by module reported by
+    # ``python -X importtime``
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, check=True, text=True,
+    )
+    response = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, module = line.split('|')
+        try:
+            response[module.strip()] = int(cumulative)
+        except ValueError:  # header
+            continue
+    return response
+
+
+def test_importtime_budget():
+    importtimes = _importtime('import http_request_codegen')
+    assert importtimes['http_request_codegen'] < IMPORT_TIME_BUDGET
+    assert 'faker' not in importtimes
+
+
+BUILTIN_VALUES_CODE = (
+    'from http_request_codegen import generate_http_request_code;'
+    ' generate_http_request_code(parameters=[{"name": "foo",'
+    ' "value": "bar"}, {"name": "baz", "type": "int"},'
+    ' {"name": "qux", "type": "str"}, {"name": "quux", "type": "uuid"}])'
+)
+FAKER_VALUES_CODE = (
+    'from http_request_codegen import generate_http_request_code;'
+    ' generate_http_request_code(parameters=[{"name": "foo",'
+    ' "type": "str"}], locale="es_ES")'
+)
+
+
+@pytest.mark.parametrize(
+    ('code', 'faker_imported'), (
+        (BUILTIN_VALUES_CODE, False),
+        (FAKER_VALUES_CODE, True),
+    ),
+)
+def test_importtime_faker_deferred(code, faker_imported):
+    assert ('faker' in _importtime(code)) is faker_imported
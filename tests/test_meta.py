@@ -2,7 +2,11 @@
 
 import pytest
 
-from http_request_codegen.hrc_meta import function_has_kwarg
+from http_request_codegen.hrc_meta import (
+    declare_features,
+    function_features,
+    function_has_kwarg,
+)
 
 
 def _func_without_parameters():
@@ -31,3 +35,28 @@ def _func_with_parameters_arg(parameters):
 )
 def test_function_has_kwarg(func, kwarg_name, result):
     assert function_has_kwarg(func, kwarg_name) is result
+
+
+@pytest.mark.parametrize(
+    ('func', 'result'), (
+        (_func_without_parameters, set()),
+        (_func_with_parameters_kwarg, {'parameters'}),
+        (_func_with_parameters_arg, set()),
+        (declare_features('headers')(lambda url, **kwargs: url), {'headers'}),
+    ),
+)
+def test_function_features(func, result):
+    assert function_features(func) == result
+
+
+def test_function_features__without_source():
+    # declared features don't need the source code of the function
+    namespace = {}
+    exec(compile('def get(url, oneline=False): pass', '<none>', 'exec'),
+         namespace)
+    with pytest.raises(OSError):
+        function_has_kwarg(namespace['get'], 'oneline')
+    assert function_features(namespace['get']) == {'oneline'}
+    assert function_features(
+        declare_features('wrap')(namespace['get']),
+    ) == {'wrap'}
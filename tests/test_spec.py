@@ -0,0 +1,264 @@
+'''Tests for compiled HTTP requests specifications.'''
+
+from collections import OrderedDict
+
+import pytest
+
+from http_request_codegen import RequestSpec, generate_http_request_code
+from http_request_codegen.hrc_factory import get_func_by_lang_impl_method
+from http_request_codegen.hrc_spec import common_headers
+
+
+@pytest.mark.parametrize(
+    ('headers', 'files', 'content_type'), (
+        ({}, {}, 'application/x-www-form-urlencoded'),
+        ({'Content-Type': 'application/json'}, {}, 'application/json'),
+        ({'content-type': 'text/plain; charset=utf-8'}, {}, 'text/plain'),
+        ({'Content-Type': 'text/plain'}, {'foo': None}, 'multipart/form-data'),
+        (
+            {'Accept': 'application/json'}, {},
+            'application/x-www-form-urlencoded',
+        ),
+    ),
+)
+def test_request_spec__content_type(headers, files, content_type):
+    spec = RequestSpec(
+        'POST', parameters=[{'name': 'foo', 'value': 'bar'}],
+        headers=headers, files=files,
+    )
+    assert spec.content_type == content_type
+
+
+def test_request_spec__headers_index():
+    spec = RequestSpec(headers=OrderedDict([
+        ('Accept-Language', 'es'), ('accept-language', 'en'), ('Foo', 'bar'),
+    ]))
+    assert spec.header('ACCEPT-LANGUAGE') == 'es'
+    assert spec.header('foo') == 'bar'
+    assert spec.header('baz') is None
+    assert spec.header('baz', 'qux') == 'qux'
+    assert list(spec.headers.keys()) == [
+        'Accept-Language', 'accept-language', 'Foo',
+    ]
+
+
+def test_request_spec__immutable():
+    headers = {'Foo': 'bar'}
+    spec = RequestSpec(headers=headers)
+
+    with pytest.raises(AttributeError):
+        spec.url = 'http://127.0.0.1'
+    with pytest.raises(AttributeError):
+        del spec.url
+    with pytest.raises(AttributeError):
+        spec.foo = 'bar'
+    with pytest.raises(TypeError):
+        spec.headers['Foo'] = 'baz'
+
+    # changes in the original arguments are not reflected
+    headers['Foo'] = 'baz'
+    assert spec.header('foo') == 'bar'
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'exception'), (
+        ({'method': 'FOO'}, ValueError),
+        ({'parameters': [{'value': 'foo'}]}, ValueError),
+        ({'parameters': ['foo']}, TypeError),
+        ({'parameters': [{'name': 'foo', 'faker': 1}]}, TypeError),
+        (
+            {
+                'method': 'POST',
+                'headers': {'Content-Type': 'text/plain'},
+                'parameters': [{'value': 'foo'}, {'value': 'bar'}],
+            },
+            ValueError,
+        ),
+    ),
+)
+def test_request_spec__validation(kwargs, exception):
+    with pytest.raises(exception):
+        RequestSpec(**kwargs)
+
+
+def test_request_spec__text_plain_parameter_without_name():
+    spec = RequestSpec(
+        'POST',
+        headers={'Content-Type': 'text/plain'},
+        parameters=[{'value': 'foo'}],
+    )
+    assert spec.parameters == ({'value': 'foo'},)
+
+
+@pytest.mark.parametrize(
+    ('language', 'impl', 'body'), (
+        ('python', 'requests', "data='foo bar'"),
+        ('python', 'httpx', "content='foo bar'"),
+        ('javascript', 'fetch', "body: 'foo bar'"),
+        ('bash', 'curl', "-d 'foo bar'"),
+    ),
+)
+def test_request_spec__text_plain_parameter_without_name__render(
+    language, impl, body,
+):
+    code = generate_http_request_code(
+        language, impl, 'POST', headers={'Content-Type': 'text/plain'},
+        parameters=[{'value': 'foo bar'}], oneline=True,
+    )
+    assert body in code
+    assert '=foo' not in code
+
+
+@pytest.mark.parametrize(
+    ('language', 'impl'), (
+        ('python', 'requests'),
+        ('javascript', 'fetch'),
+        ('bash', 'curl'),
+    ),
+)
+@pytest.mark.parametrize(
+    'arguments', (
+        {
+            'method': 'GET',
+            'url': 'http://localhost',
+            'parameters': [{'name': 'foo', 'value': 'bar'}],
+            'headers': {'Accept-Language': 'es'},
+        },
+        {
+            'method': 'POST',
+            'url': 'http://localhost',
+            'parameters': [{'name': 'foo', 'value': 1}],
+            'headers': {'Content-Type': 'application/json'},
+        },
+        {
+            'method': 'POST',
+            'url': 'http://localhost',
+            'parameters': [{'name': 'foo', 'value': 'bar'}],
+            'files': {'baz': '/tmp/baz.txt'},
+        },
+    ),
+)
+def test_request_spec__render(language, impl, arguments):
+    spec = RequestSpec(**arguments)
+    expected_result = generate_http_request_code(language, impl, **arguments)
+
+    assert generate_http_request_code(language, impl, url=spec) == \
+        expected_result
+    assert generate_http_request_code(language, impl, url=spec) == \
+        expected_result
+
+
+def test_request_spec__generator_method_mismatch():
+    func = get_func_by_lang_impl_method('python', 'requests', 'GET')
+    with pytest.raises(ValueError, match='HTTP POST method'):
+        func(RequestSpec('POST'))
+
+
+def test_request_spec__resolve():
+    spec = RequestSpec(
+        'POST',
+        url=['http://localhost', 'http://127.0.0.1'],
+        parameters=[
+            {'name': 'foo', 'type': 'uuid'},
+            {'names': ['bar', 'baz'], 'value': 1},
+        ],
+        headers={'Content-Type': 'application/json'},
+        files={'qux': None, 'quux': (None, 'text/plain')},
+        timeout=5,
+    )
+    assert not spec.resolved
+
+    resolved_spec = spec.resolve(seed=5)
+    assert resolved_spec.resolved
+    assert resolved_spec.resolve() is resolved_spec
+    assert resolved_spec.url in ('http://localhost', 'http://127.0.0.1')
+    assert resolved_spec.parameters[0]['name'] == 'foo'
+    assert resolved_spec.parameters[1] == {'name': 'bar', 'value': 1} or \
+        resolved_spec.parameters[1] == {'name': 'baz', 'value': 1}
+    assert isinstance(resolved_spec.files['qux'], str)
+    assert resolved_spec.files['quux'][1] == 'text/plain'
+    assert resolved_spec.content_type == spec.content_type
+    assert resolved_spec.options == spec.options
+
+    assert repr(spec.resolve(seed=5)) == repr(resolved_spec)
+
+
+def test_request_spec__resolve_reuses_compiled_parameters():
+    spec = RequestSpec(parameters=[{'name': 'foo', 'type': 'int'}])
+    resolved_parameters = {
+        spec.resolve(seed=seed).parameters[0]['value'] for seed in range(20)
+    }
+    assert len(resolved_parameters) > 1
+    assert list(spec._parameters_resolvers) == [None]
+
+    resolver = spec._parameters_resolvers[None]
+    spec.resolve(seed=4, locale='es_ES')
+    assert spec._parameters_resolvers[None] is resolver
+    assert set(spec._parameters_resolvers) == {None, 'es_ES'}
+
+
+@pytest.mark.parametrize(
+    'render_kwargs', (
+        {'wrap': 20},
+        {'quote_char': '"'},
+        {'indent': ' '},
+        {'oneline': True},
+    ),
+)
+def test_request_spec__resolve_render(render_kwargs):
+    spec = RequestSpec(
+        'POST', parameters=[{'name': 'foo'}], files={'bar': None},
+    ).resolve()
+    code = generate_http_request_code('python', 'requests', url=spec)
+    assert generate_http_request_code(
+        'python', 'requests', url=spec, **render_kwargs,
+    ) != code
+    assert generate_http_request_code(
+        'python', 'requests', url=spec,
+    ) == code
+    assert repr(spec.parameters[0]['value']) in code
+
+
+def test_request_spec__without_headers():
+    spec = RequestSpec(
+        'POST', parameters=[{'name': 'foo'}],
+        headers=OrderedDict([
+            ('Accept', '*/*'), ('Content-Type', 'application/json'),
+        ]),
+    )
+    spec_without_headers = spec.without_headers(['ACCEPT'])
+    assert list(spec_without_headers.headers) == ['Content-Type']
+    assert spec_without_headers.content_type == 'application/json'
+    assert not spec_without_headers.resolved
+    assert list(spec.headers) == ['Accept', 'Content-Type']
+
+    resolved_spec = spec.resolve(seed=5)
+    resolved_spec_without_headers = resolved_spec.without_headers(['Accept'])
+    assert resolved_spec_without_headers.resolved
+    assert resolved_spec_without_headers.parameters == \
+        resolved_spec.parameters
+
+
+@pytest.mark.parametrize(
+    ('headers', 'exclude', 'result'), (
+        ([], ['Content-Type'], {}),
+        (
+            [{'Accept': '*/*', 'Content-Type': 'text/plain'}],
+            ['Content-Type'],
+            {'Accept': '*/*'},
+        ),
+        (
+            [
+                {'Accept': '*/*', 'Foo': 'bar', 'Content-Type': 'text/plain'},
+                {'accept': '*/*', 'Foo': 'baz', 'Content-Type': 'text/plain'},
+            ],
+            ['Content-Type'],
+            {'Accept': '*/*'},
+        ),
+        ([{'Accept': '*/*'}, {}], ['Content-Type'], {}),
+        ([{'Accept': '*/*'}, {'Accept': '*/*'}], ['accept'], {}),
+    ),
+)
+def test_common_headers(headers, exclude, result):
+    specs = [RequestSpec(headers=_headers) for _headers in headers]
+    assert common_headers(specs, exclude=exclude) == result
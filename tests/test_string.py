@@ -0,0 +1,182 @@
+'''Tests for http-request-codegen string utilities.'''
+
+import itertools
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from http_request_codegen.generators.javascript._utils import (
+    str_definition as javascript_str_definition,
+)
+from http_request_codegen.generators.python._utils import (
+    str_definition as python_str_definition,
+)
+from http_request_codegen.hrc_string import (
+    LAZY_STRING_MAX_DEPTH,
+    lazy_string,
+    materialize_choices,
+    resolve_object_path,
+)
+
+
+def _reference_str_definition(string, indent, quote_char, wrap, language):
+    # character by character wrapping used before the slicing engine, only
+    # for the wrapped strings
+    if language == 'python':
+        response = '(' + quote_char
+        continuation = quote_char + '\n' + indent + ' ' + quote_char
+        reset, end = 2 + len(indent), ')'
+    else:
+        response = quote_char
+        continuation = quote_char + '\n' + indent + '+ ' + quote_char
+        reset, end = 3 + len(indent), ''
+    _chars_in_current_line = len(response) + len(indent)
+    for i, ch in enumerate(string):
+        response += ch
+        _chars_in_current_line += 1
+        if _chars_in_current_line >= wrap - 2:
+            if i >= len(string) - 1:
+                break
+            response += continuation
+            _chars_in_current_line = reset
+    if _chars_in_current_line >= wrap - 1:
+        return response + quote_char + '\n' + indent + end
+    return response + quote_char + end
+
+
+@pytest.mark.parametrize(
+    ('language', 'str_definition'), (
+        ('python', python_str_definition),
+        ('javascript', javascript_str_definition),
+    ),
+)
+def test_str_definition__wrapping(language, str_definition):
+    for length, indent, quote_char, wrap in itertools.product(
+        (0, 1, 2, 3, 9, 10, 11, 75, 76, 77, 78, 79, 80, 81, 160, 1000),
+        ('', ' ', '    ', ' ' * 30),
+        ('\'', '"'),
+        (1, 2, 3, 4, 5, 6, 10, 20, 40, 79, 80, 81),
+    ):
+        string = ('abcdefghij' * 101)[:length]
+        expected_result = str_definition(
+            string, indent=indent, quote_char=quote_char,
+            wrap=float('inf'),
+        )
+        if length + len(indent) + 2 >= wrap:
+            expected_result = _reference_str_definition(
+                string, indent, quote_char, wrap, language,
+            )
+        assert str_definition(
+            string, indent=indent, quote_char=quote_char, wrap=wrap,
+        ) == expected_result
+
+
+def test_resolve_object_path__cache(monkeypatch):
+    import tests.conftest
+
+    resolve_object_path.cache_clear()
+    assert lazy_string('tests.conftest::value', string_func_path=True) == \
+        'foo'
+
+    # the object is resolved only once by path
+    monkeypatch.setattr(tests.conftest, 'value', lambda: 'bar')
+    assert lazy_string('tests.conftest::value', string_func_path=True) == \
+        'foo'
+    assert resolve_object_path.cache_info().hits == 1
+
+    resolve_object_path.cache_clear()
+    assert lazy_string('tests.conftest::value', string_func_path=True) == \
+        'bar'
+
+    monkeypatch.undo()
+    resolve_object_path.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ('path', 'exception'), (
+        ('tests.conftest::non-existent', ImportError),
+        ('tests.non-existent::value', ModuleNotFoundError),
+        ('tests.conftest::value::value', ValueError),
+    ),
+)
+def test_resolve_object_path__invalid(path, exception):
+    # errors are not cached
+    for _ in range(2):
+        with pytest.raises(exception):
+            resolve_object_path(path)
+
+
+def _nested_choices(depth):
+    choices = 'foo'
+    for _ in range(depth):
+        choices = [choices]
+    return choices
+
+
+def test_lazy_string__depth():
+    assert lazy_string(_nested_choices(LAZY_STRING_MAX_DEPTH - 1)) == 'foo'
+    with pytest.raises(RecursionError, match='Maximum depth'):
+        lazy_string(_nested_choices(LAZY_STRING_MAX_DEPTH))
+
+    # the resolution doesn't depend on the stack size of the thread
+    results = []
+    threading.stack_size(64 * 1024)
+    try:
+        thread = threading.Thread(
+            target=lambda: results.append(lazy_string(
+                _nested_choices(LAZY_STRING_MAX_DEPTH - 1),
+            )),
+        )
+        thread.start()
+        thread.join()
+    finally:
+        threading.stack_size(0)
+    assert results == ['foo']
+
+
+def test_lazy_string__cycles():
+    def foo():
+        return bar
+
+    def bar():
+        return foo
+
+    with pytest.raises(RecursionError, match='Cycle detected'):
+        lazy_string(foo)
+
+    # random choices between the same callables are not cycles
+    choices = ['foo', 'bar', lambda: choices]
+    for _ in range(10):
+        assert lazy_string(choices) in ('foo', 'bar')
+
+
+def test_materialize_choices():
+    choices = frozenset({'foo', 'bar', 'baz'})
+    assert materialize_choices(choices) is materialize_choices(choices)
+    assert sorted(materialize_choices(choices)) == ['bar', 'baz', 'foo']
+    assert lazy_string(choices) in choices
+    assert lazy_string({'foo', 'bar'}, seed=4) == lazy_string(
+        {'foo', 'bar'}, seed=4,
+    )
+    assert lazy_string((choice for choice in ('foo',))) == 'foo'
+
+
+def test_materialize_choices__hash_seed_independent():
+    # seeded choices of sets are the same in all the interpreters
+    code = (
+        'from http_request_codegen.hrc_string import lazy_string;'
+        'choices = [\'alpha\', \'beta\', \'gamma\', \'delta\', \'eta\'];'
+        'print(lazy_string(set(choices), seed=5),'
+        ' lazy_string(frozenset(choices), seed=7))'
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True,
+            check=True, env=dict(os.environ, PYTHONHASHSEED=str(hash_seed)),
+        ).stdout
+        for hash_seed in range(6)
+    }
+    assert len(outputs) == 1
@@ -1,9 +1,20 @@
 '''Supports meta functionalities of http-request-codegen.'''
 
-from http_request_codegen import supported_features, supported_methods
+import copy
+
+import pytest
+
+from http_request_codegen import (
+    hrc_factory,
+    hrc_support,
+    supported_features,
+    supported_implementations,
+    supported_methods,
+)
 from http_request_codegen.hrc_factory import (
     DEFAULT_IMPLEMENTATION,
     DEFAULT_LANGUAGE,
+    register_generator,
 )
 from http_request_codegen.hrc_http import HTTP_METHODS
 
@@ -85,3 +96,47 @@ def test_supported_methods():
 
             assert methods  # can't be empty
             assert isinstance(methods, list)
+
+
+@pytest.mark.parametrize(
+    ('method', 'features', 'result'), (
+        ('GET', [], [
+            ('python', 'requests'), ('python', 'httpx'), ('bash', 'curl'),
+            ('javascript', 'fetch'),
+        ]),
+        ('post', ['oneline', 'Line wrapping'], [
+            ('python', 'requests'), ('bash', 'curl'), ('javascript', 'fetch'),
+        ]),
+        ('POST', ['stream_response'], [
+            ('python', 'requests'), ('python', 'httpx'), ('bash', 'curl'),
+            ('javascript', 'fetch'),
+        ]),
+        ('PUT', ['oneline'], []),
+    ),
+)
+def test_supported_implementations(method, features, result):
+    assert supported_implementations(method, features) == result
+
+
+def test_supported_implementations__invalid_feature():
+    with pytest.raises(ValueError, match='Unknown feature'):
+        supported_implementations('GET', ['foo'])
+
+
+def test_supported_implementations__registered_generators(monkeypatch):
+    monkeypatch.setattr(
+        hrc_factory, '_GENERATORS_BY_LANG_IMPL',
+        copy.deepcopy(hrc_factory._GENERATORS_BY_LANG_IMPL),
+    )
+    monkeypatch.setattr(hrc_factory, 'GENERATORS_VERSION', -100)
+    assert ('foo', 'bar') not in supported_implementations('GET')
+
+    register_generator(
+        'foo', 'bar', 'http_request_codegen.generators.bash.curl',
+    )
+    assert ('foo', 'bar') in supported_implementations('GET', ['oneline'])
+    assert 'foo' in supported_methods()
+
+    hrc_factory.get_func_by_lang_impl_method.cache_clear()
+    hrc_support._support_matrix.cache_clear()
+    hrc_support._supported_implementations.cache_clear()
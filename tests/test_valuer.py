@@ -1,15 +1,29 @@
 '''Test valuer factories.'''
 
 import builtins
+import threading
+import timeit
 import uuid
 from collections.abc import Iterable
 from types import LambdaType
 
+import faker
 import pytest
 from faker.providers.lorem import Provider as LoremProvider
 from faker.providers.lorem.en_US import Provider as EnUsLoremProvider
 
-from http_request_codegen.hrc_valuer import lazy_value_by_parameter
+from http_request_codegen import hrc_string, hrc_valuer
+from http_request_codegen.hrc_valuer import (
+    RANDOM_TYPES,
+    WORDS,
+    _faker_by_locale,
+    compile_name_generator,
+    compile_parameters,
+    compile_value_generator,
+    generate_values,
+    lazy_name_by_parameter,
+    lazy_value_by_parameter,
+)
 
 from tests.conftest import (
     value as _value_func,
@@ -133,7 +147,10 @@ def VALID_UUID4_FROM_TYPE(r):
         (str, None, EnUsLoremProvider.word_list, {}),
         (builtins.str, None, EnUsLoremProvider.word_list, {}),
 
-        # TODO: test str seeded
+        # str seeded
+        ('str', 4, 'item', {}),
+        (str, 4, 'item', {}),
+        ('STRING', 5, 'let', {}),
 
         # int
         ('int', None, VALID_INT_FROM_TYPE, {}),
@@ -197,7 +214,10 @@ def VALID_UUID4_FROM_TYPE(r):
         ('UUID4', None, VALID_UUID4_FROM_TYPE, {}),
         (uuid.UUID, None, VALID_UUID4_FROM_TYPE, {}),
 
-        # TODO: test uuid seeded
+        # uuid seeded
+        ('uuid', 4, 'b8a1abcd1a6946c78da4f9fc3c6da5d7', {}),
+        (uuid.UUID, 4, 'b8a1abcd1a6946c78da4f9fc3c6da5d7', {}),
+        ('UUID4', 5, '5bc8fbbcbde540998164d8399f767c45', {}),
 
         # id
         ('id', None, VALID_ID_FROM_TYPE, {}),
@@ -227,3 +247,227 @@ def test_lazy_value_by_parameter__type(_type, seed, result, kwargs):
         assert result(lazy_value_by_parameter(parameter, seed=seed))
     else:
         assert lazy_value_by_parameter(parameter, seed=seed) == result
+
+
+@pytest.mark.parametrize('locale', (None, 'es_ES'))
+def test_lazy_value_by_parameter__faker_by_locale(locale):
+    parameter = {'name': 'foo', 'faker': 'faker.providers.file::file_path'}
+    values = [
+        lazy_value_by_parameter(parameter, seed=seed, locale=locale)
+        for seed in range(100)
+    ]
+    assert len(set(values)) == 100
+
+    # seeded values are reproducible and only one Faker instance is used
+    assert lazy_value_by_parameter(parameter, seed=5, locale=locale) == \
+        values[5]
+    assert lazy_value_by_parameter(parameter, seed=5, locale=locale) == \
+        values[5]
+    faker = _faker_by_locale(locale)
+    lazy_value_by_parameter(parameter, seed=101, locale=locale)
+    assert _faker_by_locale(locale) is faker
+
+
+def test_lazy_value_by_parameter__faker_reused_between_seeds(monkeypatch):
+    parameter = {'name': 'foo', 'faker': 'faker.providers.file::file_path'}
+    instances = []
+
+    class _Faker(faker.Faker):
+        def __init__(self, *args, **kwargs):
+            instances.append(args)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(faker, 'Faker', _Faker)
+
+    def _generate():
+        for locale in ('en_US', 'es_ES'):
+            for seed in range(50):
+                lazy_value_by_parameter(parameter, seed=seed, locale=locale)
+
+    # each thread builds their own instances, once by locale
+    threads = [threading.Thread(target=_generate) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(instances) == [('en_US',)] * 2 + [('es_ES',)] * 2
+
+    # seeding a value costs the same as reusing the same seed
+    def _distinct_seeds():
+        for seed in range(200):
+            lazy_value_by_parameter(parameter, seed=seed)
+
+    def _fixed_seed():
+        for _ in range(200):
+            lazy_value_by_parameter(parameter, seed=5)
+
+    distinct_seeds = min(timeit.repeat(_distinct_seeds, number=1, repeat=5))
+    fixed_seed = min(timeit.repeat(_fixed_seed, number=1, repeat=5))
+    assert distinct_seeds < fixed_seed * 3
+
+
+@pytest.mark.parametrize('seed', (None, 5))
+def test_lazy_value_by_parameter__str_locale(seed):
+    # built-in words are used only when no locale is defined
+    parameter = {'name': 'foo', 'type': 'str'}
+    assert lazy_value_by_parameter(parameter, seed=seed) in WORDS
+    assert lazy_value_by_parameter(
+        parameter, seed=seed, locale='en_US',
+    ) in EnUsLoremProvider.word_list
+
+
+@pytest.mark.parametrize(
+    'parameter', (
+        {'name': 'foo', 'value': 'bar'},
+        {'name': 'foo', 'value': ['bar', 'baz', 'qux']},
+        {'name': 'foo', 'values': ['bar', 'baz', 'qux']},
+        {'name': 'foo', 'faker': 'faker.providers.file::file_path'},
+        {'name': 'foo', 'type': 'int', 'min': 5, 'max': 10},
+        {'name': 'foo', 'type': float, 'round': 2},
+        {'name': 'foo', 'type': 'bool', 'null': True},
+        {'name': 'foo', 'type': uuid.UUID},
+        {'name': 'foo', 'type': ['id', 'int', 'str']},
+        {'name': 'foo', 'type': 'random'},
+        {'names': ['foo', 'bar', 'baz']},
+    ),
+)
+def test_compile_value_generator(parameter):
+    value_generator = compile_value_generator(parameter)
+    name_generator = compile_name_generator(parameter)
+    for seed in range(10):
+        assert value_generator(seed=seed) == lazy_value_by_parameter(
+            parameter, seed=seed,
+        )
+        assert name_generator(seed=seed) == lazy_name_by_parameter(
+            parameter, seed=seed,
+        )
+
+
+@pytest.mark.parametrize(
+    ('parameter', 'exception'), (
+        ({'value': 'foo'}, ValueError),
+        ({'name': 'foo', 'type': 'foo'}, TypeError),
+        ({'name': 'foo', 'faker': 1}, TypeError),
+    ),
+)
+def test_compile_value_generator__invalid(parameter, exception):
+    # invalid parameters are detected compiling them
+    with pytest.raises(exception):
+        compile_name_generator(parameter)
+        compile_value_generator(parameter)
+
+
+def test_lazy_value_by_parameter__random_type():
+    parameter = {'name': 'foo', 'type': 'random'}
+    values = {lazy_value_by_parameter(parameter) for _ in range(100)}
+    assert parameter == {'name': 'foo', 'type': 'random'}
+    assert any(value in WORDS for value in values)
+    assert any(value.lstrip('-').isdigit() for value in values)
+    assert 'random' not in RANDOM_TYPES
+
+    parameter = {'name': 'foo', 'type': 'random', 'types': ['uuid']}
+    assert len(lazy_value_by_parameter(parameter)) == 32
+
+
+def test_compile_parameters():
+    parameters = [
+        {'name': 'foo', 'type': 'int'},
+        {'names': ['bar', 'baz'], 'value': 1},
+        {'value': ['qux', 'quux']},
+    ]
+    resolve_parameters = compile_parameters(parameters)
+
+    assert resolve_parameters(seed=4) == resolve_parameters(seed=4)
+    for seed in range(10):
+        resolved_parameters = resolve_parameters(seed=seed)
+        assert resolved_parameters[0]['name'] == 'foo'
+        assert resolved_parameters[0]['value'] == lazy_value_by_parameter(
+            parameters[0], seed=seed,
+        )
+        assert resolved_parameters[1]['value'] == 1
+        assert resolved_parameters[1]['name'] in ('bar', 'baz')
+        assert resolved_parameters[2] == {
+            'value': lazy_value_by_parameter(parameters[2], seed=seed),
+        }
+
+
+@pytest.mark.parametrize('numpy', (False, True))
+@pytest.mark.parametrize(
+    ('parameter', 'check'), (
+        ({'type': 'int', 'min': 3, 'max': 7}, lambda v: 3 <= int(v) <= 7),
+        ({'type': 'int', 'max': 2 ** 70}, lambda v: int(v) <= 2 ** 70),
+        ({'type': 'id', 'max': 10}, lambda v: 1 <= int(v) <= 10),
+        ({'type': float, 'round': 1}, lambda v: len(v.split('.')[1]) == 1),
+        ({'type': 'bool'}, lambda v: v in ('true', 'false')),
+        (
+            {'type': 'bool', 'null': True},
+            lambda v: v in ('true', 'false', 'null'),
+        ),
+        ({'type': uuid.UUID}, lambda v: uuid.UUID(v).version == 4),
+        ({}, lambda v: v in WORDS),
+        ({'values': ['foo', 'bar']}, lambda v: v in ('foo', 'bar')),
+        (
+            {'type': ['id', 'uuid']},
+            lambda v: v.isdigit() or uuid.UUID(v).version == 4,
+        ),
+    ),
+)
+def test_generate_values(parameter, check, numpy, monkeypatch):
+    if numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(hrc_valuer, '_numpy', lambda: None)
+
+    values = generate_values(parameter, 200, seed=4)
+    assert len(values) == 200
+    assert all(isinstance(value, str) and check(value) for value in values)
+    assert len(set(values)) > 1
+
+    # deterministic for a seed
+    assert generate_values(parameter, 200, seed=4) == values
+    assert generate_values(parameter, 200, seed=5) != values
+    assert len(generate_values(parameter, 200)) == 200
+
+
+@pytest.mark.parametrize('numpy', (False, True))
+def test_generate_values__negative_seed(numpy, monkeypatch):
+    if numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(hrc_valuer, '_numpy', lambda: None)
+
+    for parameter in ({'type': 'int'}, {'type': 'uuid'}, {'type': 'bool'}):
+        values = generate_values(parameter, 3, seed=-1)
+        assert len(values) == 3
+        assert generate_values(parameter, 3, seed=-1) == values
+
+
+def test_generate_values__invalid():
+    assert generate_values({'type': 'int'}, 0) == []
+    with pytest.raises(ValueError, match='positive'):
+        generate_values({'type': 'int'}, -1)
+    with pytest.raises(TypeError):
+        generate_values({'name': 'foo', 'type': 'foo'}, 1)
+
+
+def test_lazy_value_by_parameter__faker_providers_registered_once():
+    parameter = {'name': 'foo', 'faker': 'faker.providers.file::file_path'}
+    faker = _faker_by_locale('fr_FR')
+    lazy_value_by_parameter(parameter, seed=1, locale='fr_FR')
+    n_providers = len(faker.providers)
+
+    for seed in range(10):
+        lazy_value_by_parameter(parameter, seed=seed, locale='fr_FR')
+    assert len(faker.providers) == n_providers
+
+
+def test_compile_value_generator__faker_path_imported_once():
+    value_generator = compile_value_generator(
+        {'name': 'foo', 'faker': 'faker.providers.file::file_path'},
+    )
+    value_generator(seed=1)
+    misses = hrc_string._import_module.cache_info().misses
+
+    values = [value_generator(seed=seed) for seed in range(10)]
+    assert len(set(values)) > 1
+    assert hrc_string._import_module.cache_info().misses == misses